@@ -1,4 +1,5 @@
 import streamlit as st
+import plotly.graph_objects as go
 import sys
 import os
 
@@ -10,6 +11,7 @@ from src.styles.dark_mode import load_dark_mode_css
 from src.data.processor import DataProcessor
 from src.visualizations.charts import ChartCreator
 from src.components.ui_elements import UIComponents
+from src.components.fragments import fragment
 
 # ==============================================================================
 # MAIN APPLICATION CLASS
@@ -22,8 +24,10 @@ class MovieRevenueTracker:
         configure_page()
         self.load_styles()
         self.data_processor = DataProcessor()
-        self.chart_creator = ChartCreator()
+        self.chart_creator = ChartCreator(aggregate=self.data_processor.aggregate)
         self.ui = UIComponents()
+        # Figures built during this run, shared by the views showing them
+        self.figures = {}
         
     def load_styles(self):
         """Load custom CSS styles"""
@@ -32,7 +36,7 @@ class MovieRevenueTracker:
     def run(self):
         """Run the main application"""
         # Load and process data
-        df = self.data_processor.load_and_clean_data()
+        df = self.data_processor.load_shared_data()
         
         if df is None:
             self.ui.create_error_message("Failed to load data. Please check if 'movie_revenue_data.csv' exists.")
@@ -46,6 +50,7 @@ class MovieRevenueTracker:
         
         # Create sidebar filters
         filters = self.ui.create_sidebar_filters(df)
+        self.ui.create_memory_report(self.data_processor.get_memory_report(df))
         
         # Apply filters to data
         filtered_df = self.data_processor.apply_filters(
@@ -104,106 +109,119 @@ class MovieRevenueTracker:
         """Render regional comparison analysis"""
         self.ui.create_analysis_header("🌍 Cross-Regional Box Office Comparison")
         
-        tab1, tab2, tab3 = st.tabs(["📊 Movie Comparison", "🌐 Regional Breakdown", "📈 Trends Analysis"])
-        
-        with tab1:
-            # Movie selection and comparison
-            selected_movies = self.ui.create_movie_selector(df, filters['show_top_n'])
-            
-            if selected_movies:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Regional comparison chart
-                    fig1 = self.chart_creator.create_regional_comparison_chart(df, selected_movies)
-                    st.plotly_chart(fig1, use_container_width=True)
-                
-                with col2:
-                    # Performance scatter plot
-                    fig2 = self.chart_creator.create_performance_scatter(df)
-                    st.plotly_chart(fig2, use_container_width=True)
-                
-                # Regional performance details table
-                self.ui.create_data_table(
-                    df[df['Release Group'].isin(selected_movies)][
-                        ['Release Group', 'Worldwide_Millions', 'Domestic_Millions', 
-                         'Foreign_Millions', 'Domestic %', 'Foreign %']
-                    ].round(2),
-                    "📋 Regional Performance Details"
-                )
+        self.ui.create_view_tabs({
+            "📊 Movie Comparison": lambda: self.render_movie_comparison(df, filters),
+            "🌐 Regional Breakdown": lambda: self.render_regional_breakdown(df),
+            "📈 Trends Analysis": lambda: self.render_trends_analysis(df)
+        }, key="regional_comparison_view")
+    
+    def render_movie_comparison(self, df, filters):
+        """Render the movie comparison view"""
+        # Movie selection and comparison
+        selected_movies = self.ui.create_movie_selector(df, filters['show_top_n'])
         
-        with tab2:
+        if selected_movies:
             col1, col2 = st.columns(2)
             
             with col1:
-                # Regional dominance distribution
-                dominance_data = {
-                    'Domestic Dominance': len(df[df['Domestic_Dominance']]),
-                    'Foreign Dominance': len(df[df['Foreign_Dominance']]),
-                    'Balanced Performance': len(df[df['Regional_Balance']])
-                }
-                fig3 = self.chart_creator.create_pie_chart(dominance_data, "Regional Performance Distribution")
-                st.plotly_chart(fig3, use_container_width=True)
+                # Regional comparison chart
+                fig1 = self.chart_creator.create_regional_comparison_chart(df, selected_movies)
+                st.plotly_chart(fig1, use_container_width=True)
             
             with col2:
-                # Top performers by region
-                top_domestic = self.data_processor.get_top_performers(df, 10, 'domestic')
-                self.ui.create_data_table(
-                    top_domestic[['Release Group', 'Domestic_Millions', 'Domestic %']].round(2),
-                    "🏆 Top Domestic Performers"
-                )
-        
-        with tab3:
-            # Revenue trends over time
-            fig4 = self.chart_creator.create_revenue_trends_chart(df)
-            st.plotly_chart(fig4, use_container_width=True)
+                # Performance scatter plot
+                fig2 = self.chart_creator.create_performance_scatter(df)
+                st.plotly_chart(fig2, use_container_width=True)
             
-            # Yearly analysis table
-            yearly_trends = self.data_processor.get_yearly_trends(df)
-            self.ui.create_data_table(yearly_trends, "📅 Yearly Trends Summary")
+            # Regional performance details table
+            self.ui.create_data_table(
+                df[df['Release Group'].isin(selected_movies)][
+                    ['Release Group', 'Worldwide_Millions', 'Domestic_Millions', 
+                     'Foreign_Millions', 'Domestic %', 'Foreign %']
+                ].round(2),
+                "📋 Regional Performance Details"
+            )
+    
+    def render_regional_breakdown(self, df):
+        """Render the regional breakdown view"""
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Regional dominance distribution
+            dominance_data = {
+                'Domestic Dominance': len(df[df['Domestic_Dominance']]),
+                'Foreign Dominance': len(df[df['Foreign_Dominance']]),
+                'Balanced Performance': len(df[df['Regional_Balance']])
+            }
+            fig3 = self.chart_creator.create_pie_chart(dominance_data, "Regional Performance Distribution")
+            st.plotly_chart(fig3, use_container_width=True)
+        
+        with col2:
+            # Top performers by region
+            top_domestic = self.data_processor.get_top_performers(df, 10, 'domestic')
+            self.ui.create_data_table(
+                top_domestic[['Release Group', 'Domestic_Millions', 'Domestic %']].round(2),
+                "🏆 Top Domestic Performers"
+            )
+    
+    def render_trends_analysis(self, df):
+        """Render the trends analysis view"""
+        # Revenue trends over time
+        fig4 = self.chart_creator.create_revenue_trends_chart(df)
+        st.plotly_chart(fig4, use_container_width=True)
+        
+        # Yearly analysis table
+        yearly_trends = self.data_processor.get_yearly_trends(df)
+        self.ui.create_data_table(yearly_trends, "📅 Yearly Trends Summary")
     
     def render_revenue_performance(self, df, filters):
         """Render revenue performance analysis"""
         self.ui.create_analysis_header("📊 Revenue Performance Analysis")
         
-        tab1, tab2 = st.tabs(["🏆 Top Performers", "📈 Performance Metrics"])
-        
-        with tab1:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Top movies chart
-                fig1 = self.chart_creator.create_top_performers_chart(df, filters['show_top_n'])
-                st.plotly_chart(fig1, use_container_width=True)
-            
-            with col2:
-                # Performance categories distribution
-                if 'Performance_Category' in df.columns:
-                    category_counts = df['Performance_Category'].value_counts().to_dict()
-                    fig2 = self.chart_creator.create_pie_chart(category_counts, "Performance Categories")
-                    st.plotly_chart(fig2, use_container_width=True)
-        
-        with tab2:
-            # Performance scatter plot
-            fig3 = self.chart_creator.create_performance_scatter(df)
-            st.plotly_chart(fig3, use_container_width=True)
-            
-            # Performance statistics
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                top_worldwide = self.data_processor.get_top_performers(df, 10, 'worldwide')
-                self.ui.create_data_table(
-                    top_worldwide[['Release Group', 'Worldwide_Millions', 'Year']].round(2),
-                    "🌍 Top Worldwide Earners"
-                )
-            
-            with col2:
-                top_foreign = self.data_processor.get_top_performers(df, 10, 'foreign')
-                self.ui.create_data_table(
-                    top_foreign[['Release Group', 'Foreign_Millions', 'Foreign %']].round(2),
-                    "🌎 Top Foreign Earners"
-                )
+        self.ui.create_view_tabs({
+            "🏆 Top Performers": lambda: self.render_top_performers(df, filters),
+            "📈 Performance Metrics": lambda: self.render_performance_metrics(df)
+        }, key="revenue_performance_view")
+    
+    def render_top_performers(self, df, filters):
+        """Render the top performers view"""
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Top movies chart
+            fig1 = self.chart_creator.create_top_performers_chart(df, filters['show_top_n'])
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # Performance categories distribution
+            if 'Performance_Category' in df.columns:
+                category_counts = df['Performance_Category'].value_counts().to_dict()
+                fig2 = self.chart_creator.create_pie_chart(category_counts, "Performance Categories")
+                st.plotly_chart(fig2, use_container_width=True)
+    
+    def render_performance_metrics(self, df):
+        """Render the performance metrics view"""
+        # Performance scatter plot (density view for large selections)
+        x_range, y_range = self.ui.create_zoom_controls(df, "performance_zoom")
+        fig3 = self.chart_creator.create_performance_scatter(df, x_range=x_range, y_range=y_range)
+        st.plotly_chart(fig3, use_container_width=True)
+        
+        # Performance statistics
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            top_worldwide = self.data_processor.get_top_performers(df, 10, 'worldwide')
+            self.ui.create_data_table(
+                top_worldwide[['Release Group', 'Worldwide_Millions', 'Year']].round(2),
+                "🌍 Top Worldwide Earners"
+            )
+        
+        with col2:
+            top_foreign = self.data_processor.get_top_performers(df, 10, 'foreign')
+            self.ui.create_data_table(
+                top_foreign[['Release Group', 'Foreign_Millions', 'Foreign %']].round(2),
+                "🌎 Top Foreign Earners"
+            )
     
     def render_genre_analysis(self, df, filters):
         """Render genre analysis"""
@@ -260,7 +278,7 @@ class MovieRevenueTracker:
         
         # Decade analysis
         if 'Decade' in df.columns:
-            decade_stats = df.groupby('Decade').agg({
+            decade_stats = self.data_processor.aggregate(df, ['Decade'], {
                 'Worldwide_Millions': ['count', 'mean'],
                 'Domestic %': 'mean',
                 'Foreign %': 'mean'
@@ -306,126 +324,13 @@ class MovieRevenueTracker:
         </div>
         """, unsafe_allow_html=True)
         
-        # Create tabs for different visualization types
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "🌌 3D Universe", "🎭 Animated Timeline", "🌟 Radial Charts", "💎 Special Effects"
-        ])
-        
-        with tab1:
-            st.markdown("### 🌌 3D Movie Performance Universe")
-            st.markdown("*Navigate through a 3D space where each bubble represents a movie*")
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                fig_3d = self.chart_creator.create_advanced_3d_scatter(df)
-                st.plotly_chart(fig_3d, use_container_width=True)
-            
-            with col2:
-                st.markdown("""
-                **🎯 How to explore:**
-                - 🖱️ **Rotate**: Click and drag to spin the view
-                - 🔍 **Zoom**: Scroll to zoom in/out
-                - 👆 **Hover**: See movie details
-                - 🎨 **Colors**: Different genres
-                - 📏 **Size**: Bubble size = Total revenue
-                """)
-        
-        with tab2:
-            st.markdown("### 🎭 Animated Genre Evolution Timeline")
-            st.markdown("*Watch how different movie genres evolved over the years*")
-            
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                fig_animated = self.chart_creator.create_animated_timeline_chart(df)
-                st.plotly_chart(fig_animated, use_container_width=True)
-            
-            with col2:
-                st.markdown("""
-                **🎮 Animation Controls:**
-                - ▶️ **Play**: Watch the timeline unfold
-                - ⏸️ **Pause**: Stop at any year
-                - 🔄 **Loop**: Continuous playback
-                - 📊 **Observe**: Genre movements over time
-                - 💫 **Bubbles**: Larger = Higher revenue
-                """)
-        
-        with tab3:
-            st.markdown("### 🌟 Radial Performance Charts")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("#### 🌟 Genre Performance Radar")
-                fig_radial = self.chart_creator.create_radial_chart(df)
-                st.plotly_chart(fig_radial, use_container_width=True)
-            
-            with col2:
-                st.markdown("#### ☀️ Revenue Sunburst")
-                fig_sunburst = self.chart_creator.create_sunburst_chart(df)
-                st.plotly_chart(fig_sunburst, use_container_width=True)
-        
-        with tab4:
-            st.markdown("### 💎 Special Effect Visualizations")
-            
-            # Create sub-tabs for different special effects
-            subtab1, subtab2, subtab3, subtab4 = st.tabs([
-                "💰 Waterfall", "🔥 Heatmap", "🎻 Violin Plot", "📊 All Charts"
-            ])
-            
-            with subtab1:
-                st.markdown("#### 💰 Revenue Waterfall Analysis")
-                if 'Release Group' in df.columns:
-                    selected_movie = st.selectbox(
-                        "Choose a movie for waterfall analysis:",
-                        df['Release Group'].head(20).tolist(),
-                        key="waterfall_movie"
-                    )
-                    
-                    if selected_movie:
-                        fig_waterfall = self.chart_creator.create_waterfall_chart(df, selected_movie)
-                        st.plotly_chart(fig_waterfall, use_container_width=True)
-                else:
-                    st.info("Movie data not available for waterfall analysis")
-            
-            with subtab2:
-                st.markdown("#### 🔥 Correlation Heatmap")
-                fig_heatmap = self.chart_creator.create_heatmap_correlation(df)
-                st.plotly_chart(fig_heatmap, use_container_width=True)
-            
-            with subtab3:
-                st.markdown("#### 🎻 Revenue Distribution Violin Plot")
-                fig_violin = self.chart_creator.create_violin_plot(df)
-                st.plotly_chart(fig_violin, use_container_width=True)
-            
-            with subtab4:
-                st.markdown("#### 📊 Chart Gallery Overview")
-                
-                # Create a grid of smaller charts
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Mini radial chart
-                    fig_mini_radial = self.chart_creator.create_radial_chart(df)
-                    fig_mini_radial.update_layout(height=300)
-                    st.plotly_chart(fig_mini_radial, use_container_width=True)
-                    
-                    # Mini heatmap
-                    fig_mini_heatmap = self.chart_creator.create_heatmap_correlation(df)
-                    fig_mini_heatmap.update_layout(height=300)
-                    st.plotly_chart(fig_mini_heatmap, use_container_width=True)
-                
-                with col2:
-                    # Mini violin plot
-                    fig_mini_violin = self.chart_creator.create_violin_plot(df)
-                    fig_mini_violin.update_layout(height=300)
-                    st.plotly_chart(fig_mini_violin, use_container_width=True)
-                    
-                    # Mini sunburst
-                    fig_mini_sunburst = self.chart_creator.create_sunburst_chart(df)
-                    fig_mini_sunburst.update_layout(height=300)
-                    st.plotly_chart(fig_mini_sunburst, use_container_width=True)
+        # Only the selected visualization type is built
+        self.ui.create_view_tabs({
+            "🌌 3D Universe": lambda: self.render_3d_universe(df),
+            "🎭 Animated Timeline": lambda: self.render_animated_timeline(df),
+            "🌟 Radial Charts": lambda: self.render_radial_charts(df),
+            "💎 Special Effects": lambda: self.render_special_effects(df)
+        }, key="advanced_visualizations_view")
         
         # Add usage tips
         st.markdown("---")
@@ -442,6 +347,139 @@ class MovieRevenueTracker:
             </ul>
         </div>
         """, unsafe_allow_html=True)
+    
+    def get_figure(self, chart: str, df, *args) -> go.Figure:
+        """
+        Get a chart built earlier in this run, or build it
+        
+        Args:
+            chart: Name of the ChartCreator method, e.g. 'create_radial_chart'
+            df: Source dataframe
+            *args: Further chart arguments
+            
+        Returns:
+            go.Figure: Chart figure, shared by every caller of this run
+        """
+        key = (chart, id(df), args)
+        if key not in self.figures:
+            self.figures[key] = getattr(self.chart_creator, chart)(df, *args)
+        return self.figures[key]
+    
+    def render_3d_universe(self, df):
+        """Render the 3D universe view"""
+        st.markdown("### 🌌 3D Movie Performance Universe")
+        st.markdown("*Navigate through a 3D space where each bubble represents a movie*")
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            x_range, y_range = self.ui.create_zoom_controls(df, "universe_zoom")
+            fig_3d = self.chart_creator.create_advanced_3d_scatter(df, x_range=x_range, y_range=y_range)
+            st.plotly_chart(fig_3d, use_container_width=True)
+        
+        with col2:
+            st.markdown("""
+            **🎯 How to explore:**
+            - 🖱️ **Rotate**: Click and drag to spin the view
+            - 🔍 **Zoom**: Scroll to zoom in/out
+            - 👆 **Hover**: See movie details
+            - 🎨 **Colors**: Different genres
+            - 📏 **Size**: Bubble size = Total revenue
+            """)
+    
+    def render_animated_timeline(self, df):
+        """Render the animated timeline view"""
+        st.markdown("### 🎭 Animated Genre Evolution Timeline")
+        st.markdown("*Watch how different movie genres evolved over the years*")
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            fig_animated = self.chart_creator.create_animated_timeline_chart(df)
+            st.plotly_chart(fig_animated, use_container_width=True)
+        
+        with col2:
+            st.markdown("""
+            **🎮 Animation Controls:**
+            - ▶️ **Play**: Watch the timeline unfold
+            - ⏸️ **Pause**: Stop at any year
+            - 🔄 **Loop**: Continuous playback
+            - 📊 **Observe**: Genre movements over time
+            - 💫 **Bubbles**: Larger = Higher revenue
+            """)
+    
+    def render_radial_charts(self, df):
+        """Render the radial charts view"""
+        st.markdown("### 🌟 Radial Performance Charts")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🌟 Genre Performance Radar")
+            fig_radial = self.get_figure('create_radial_chart', df)
+            st.plotly_chart(fig_radial, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### ☀️ Revenue Sunburst")
+            fig_sunburst = self.get_figure('create_sunburst_chart', df)
+            st.plotly_chart(fig_sunburst, use_container_width=True)
+    
+    def render_special_effects(self, df):
+        """Render the special effects view and its sub-views"""
+        st.markdown("### 💎 Special Effect Visualizations")
+        
+        # Create sub-tabs for different special effects
+        self.ui.create_view_tabs({
+            "💰 Waterfall": lambda: self.render_waterfall(df),
+            "🔥 Heatmap": lambda: self.render_heatmap(df),
+            "🎻 Violin Plot": lambda: self.render_violin(df),
+            "📊 All Charts": lambda: self.render_chart_gallery(df)
+        }, key="special_effects_view")
+    
+    @fragment
+    def render_waterfall(self, df):
+        """Render the waterfall view; picking another movie only reruns this view"""
+        st.markdown("#### 💰 Revenue Waterfall Analysis")
+        if 'Release Group' in df.columns:
+            selected_movie = st.selectbox(
+                "Choose a movie for waterfall analysis:",
+                df['Release Group'].head(20).tolist(),
+                key="waterfall_movie"
+            )
+            
+            if selected_movie:
+                fig_waterfall = self.chart_creator.create_waterfall_chart(df, selected_movie)
+                st.plotly_chart(fig_waterfall, use_container_width=True)
+        else:
+            st.info("Movie data not available for waterfall analysis")
+    
+    def render_heatmap(self, df):
+        """Render the correlation heatmap view"""
+        st.markdown("#### 🔥 Correlation Heatmap")
+        fig_heatmap = self.get_figure('create_heatmap_correlation', df)
+        st.plotly_chart(fig_heatmap, use_container_width=True)
+    
+    def render_violin(self, df):
+        """Render the violin plot view"""
+        st.markdown("#### 🎻 Revenue Distribution Violin Plot")
+        fig_violin = self.get_figure('create_violin_plot', df)
+        st.plotly_chart(fig_violin, use_container_width=True)
+    
+    def render_chart_gallery(self, df):
+        """Render smaller copies of the radial, heatmap, violin and sunburst charts"""
+        st.markdown("#### 📊 Chart Gallery Overview")
+        
+        # Create a grid of smaller charts, reusing the figures already built
+        col1, col2 = st.columns(2)
+        
+        for col, charts in [(col1, ['create_radial_chart', 'create_heatmap_correlation']),
+                            (col2, ['create_violin_plot', 'create_sunburst_chart'])]:
+            with col:
+                for chart in charts:
+                    # Resize a copy, the full-size figure may be shown elsewhere
+                    fig_mini = go.Figure(self.get_figure(chart, df))
+                    fig_mini.update_layout(height=300)
+                    st.plotly_chart(fig_mini, use_container_width=True)
 
 # ==============================================================================
 # APPLICATION ENTRY POINT
@@ -16,6 +16,8 @@ from src.styles.ultra_modern_theme import load_ultra_modern_theme
 from src.data.processor import DataProcessor
 from src.visualizations.charts import ChartCreator
 from src.components.ui_elements import UIComponents
+from src.components.fragments import fragment
+from src.components.data_explorer import DataExplorer
 
 class UltraModernMovieTracker:
     """Ultra-Modern Movie Revenue Tracker with Cinematic Interface"""
@@ -37,7 +39,7 @@ class UltraModernMovieTracker:
         self.ui = UIComponents()
         
         # Load data
-        self.data = self.data_processor.load_data()
+        self.data = self.data_processor.load_shared_data()
         
     def setup_page_config(self):
         """Configure Streamlit page with ultra-modern settings"""
@@ -179,6 +181,10 @@ class UltraModernMovieTracker:
         """
         Filter data based on user selections
         
+        The revenue range goes through DataProcessor.apply_filters, so the
+        shared frame is never copied and the result's fingerprint is known
+        without hashing it; only the selected movies are masked afterwards.
+        
         Args:
             selected_movies: List of selected movie titles
             selected_regions: List of selected regions
@@ -187,42 +193,23 @@ class UltraModernMovieTracker:
         Returns:
             pd.DataFrame: Filtered dataframe
         """
-        filtered_data = self.data.copy()
+        year_range = (int(self.data['Year'].min()), int(self.data['Year'].max()))
+        filtered_data = self.data_processor.apply_filters(self.data, year_range, revenue_range=revenue_range)
         
         # Filter by movies
         if 'All Movies' not in selected_movies and selected_movies:
             filtered_data = filtered_data[filtered_data['Release Group'].isin(selected_movies)]
         
-        # Filter by revenue range (converting to millions for comparison)
-        min_revenue, max_revenue = revenue_range
-        revenue_millions = filtered_data['$Worldwide'] / 1_000_000
-        filtered_data = filtered_data[
-            (revenue_millions >= min_revenue) & 
-            (revenue_millions <= max_revenue)
-        ]
-        
         return filtered_data
         
     def render_analysis_tabs(self, filtered_data: pd.DataFrame, selected_regions: List[str]):
         """Render analysis tabs with ultra-modern styling"""
-        tab1, tab2, tab3, tab4 = st.tabs([
-            "📊 Revenue Analysis", 
-            "🌍 Regional Comparison", 
-            "📈 Performance Insights",
-            "📋 Data Explorer"
-        ])
-        
-        with tab1:
-            self.render_revenue_analysis(filtered_data, selected_regions)
-            
-        with tab2:
-            self.render_regional_comparison(filtered_data, selected_regions)
-            
-        with tab3:
-            self.render_performance_insights(filtered_data)
-            
-        with tab4:
-            self.render_data_explorer(filtered_data)
+        self.ui.create_view_tabs({
+            "📊 Revenue Analysis": lambda: self.render_revenue_analysis(filtered_data, selected_regions),
+            "🌍 Regional Comparison": lambda: self.render_regional_comparison(filtered_data, selected_regions),
+            "📈 Performance Insights": lambda: self.render_performance_insights(filtered_data),
+            "📋 Data Explorer": lambda: self.render_data_explorer(filtered_data)
+        }, key=f"analysis_view_{self.session_id}")
             
     def render_revenue_analysis(self, filtered_data: pd.DataFrame, selected_regions: List[str]):
         """Render revenue analysis with ultra-modern charts"""
@@ -250,15 +237,15 @@ class UltraModernMovieTracker:
         with col2:
             # Revenue distribution pie chart
             if len(filtered_data) > 0:
-                # Create revenue categories
+                # Create revenue categories (kept out of the frame, whose fingerprint is remembered)
                 revenue_millions = filtered_data['$Worldwide'] / 1_000_000
-                filtered_data['Revenue_Category'] = pd.cut(
+                revenue_category = pd.cut(
                     revenue_millions,
                     bins=[0, 100, 300, 500, 1000, float('inf')],
                     labels=['<$100M', '$100M-$300M', '$300M-$500M', '$500M-$1B', '$1B+']
                 )
                 
-                category_counts = filtered_data['Revenue_Category'].value_counts()
+                category_counts = revenue_category.value_counts()
                 
                 fig_pie = self.chart_creator.create_pie_chart(
                     category_counts.values,
@@ -417,77 +404,20 @@ class UltraModernMovieTracker:
             total_revenue = filtered_data['$Worldwide'].sum() / 1_000_000
             st.metric("Total Revenue", f"${total_revenue:,.0f}M")
             
-        # Search and filter options
-        search_term = st.text_input("🔍 Search movies:", placeholder="Enter movie title...", key="movie_search")
+        self.render_data_table(filtered_data)
         
-        if search_term:
-            mask = filtered_data['Release Group'].str.contains(search_term, case=False, na=False)
-            display_data = filtered_data[mask]
-        else:
-            display_data = filtered_data
-            
-        # Sorting options
-        col1, col2 = st.columns(2)
-        with col1:
-            sort_column = st.selectbox("Sort by:", filtered_data.columns, key="sort_column_select")
-        with col2:
-            sort_ascending = st.selectbox("Order:", ["Descending", "Ascending"], key="sort_order_select") == "Ascending"
-            
-        # Apply sorting
-        display_data = display_data.sort_values(sort_column, ascending=sort_ascending)
-        
-        # Display data with enhanced styling
-        st.markdown("### 📊 Data Table")
-        
-        # Format numerical columns
-        numeric_columns = display_data.select_dtypes(include=[np.number]).columns
-        formatted_data = display_data.copy()
-        
-        for col in numeric_columns:
-            if col not in ['Release Group', 'Rank', 'Year', 'Vote_Count']:
-                if '$' in col or 'revenue' in col.lower():
-                    formatted_data[col] = formatted_data[col].apply(lambda x: f"${x/1_000_000:,.0f}M" if pd.notna(x) else "N/A")
-                elif '%' in col:
-                    formatted_data[col] = formatted_data[col].apply(lambda x: f"{x:.1f}%" if pd.notna(x) else "N/A")
-                else:
-                    formatted_data[col] = formatted_data[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else "N/A")
-        
-        st.dataframe(
-            formatted_data,
-            use_container_width=True,
-            hide_index=True,
-            height=400
-        )
+    @fragment
+    def render_data_table(self, filtered_data: pd.DataFrame):
+        """Render the searchable, sortable table and its downloads; its widgets only rerun this part"""
+        # Sorting runs on the raw values and only the visible page is formatted
+        explorer = DataExplorer(filtered_data, "explorer", search=self.data_processor.search_titles)
+        positions = explorer.render()
         
         # Download options
         st.markdown("### 📥 Export Data")
-        col1, col2 = st.columns(2)
         
-        with col1:
-            csv = display_data.to_csv(index=False)
-            st.download_button(
-                "📄 Download as CSV",
-                csv,
-                "movie_revenue_data.csv",
-                "text/csv",
-                key='download-csv-ultra'
-            )
-            
-        with col2:
-            # Convert to Excel
-            from io import BytesIO
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                display_data.to_excel(writer, sheet_name='Movie Revenue Data', index=False)
-            excel_data = output.getvalue()
-            
-            st.download_button(
-                "📊 Download as Excel",
-                excel_data,
-                "movie_revenue_data.xlsx",
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                key='download-excel-ultra'
-            )
+        # Files are written in chunks only when a download is clicked, then reused
+        self.ui.create_export_buttons(filtered_data, "explorer", positions=positions)
             
     def run(self):
         """Run the ultra-modern movie tracker application"""
@@ -503,9 +433,6 @@ class UltraModernMovieTracker:
         # Render sidebar controls
         selected_movies, selected_regions, revenue_range = self.render_sidebar_controls()
         
-        # Render sidebar controls
-        selected_movies, selected_regions, revenue_range = self.render_sidebar_controls()
-        
         # Filter data based on selections
         filtered_data = self.filter_data_simple(selected_movies, selected_regions, revenue_range)
         
@@ -0,0 +1,89 @@
+"""
+Benchmark the query API with many concurrent requests, in process through its ASGI interface
+
+Usage:
+    python -m benchmarks.bench_api [--requests 5000] [--concurrency 100] [--workers 4]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from typing import List, Tuple
+
+from src.api.query import encode
+from src.api.server import QueryService
+
+ENDPOINTS = ['/summary', '/top-performers', '/genres', '/yearly-trends', '/movies']
+REGIONS = ['', 'domestic', 'foreign', 'balanced']
+
+def make_queries() -> List[Tuple[str, bytes]]:
+    """Distinct (endpoint, query string) pairs over year ranges and regional filters"""
+    queries = []
+    for path, start, region in itertools.product(ENDPOINTS, range(2000, 2024, 2), REGIONS):
+        query = f"year_min={start}&year_max={start + 5}" + (f"&region={region}" if region else "")
+        queries.append((path, query.encode()))
+    return queries
+
+async def request(app: QueryService, path: str, query_string: bytes) -> Tuple[int, bytes]:
+    """Send one GET request to the ASGI app and collect the response"""
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        messages.append(message)
+
+    await app({'type': 'http', 'method': 'GET', 'path': path, 'query_string': query_string}, receive, send)
+    return messages[0]['status'], messages[1]['body']
+
+async def run_load(app: QueryService, queries: List[Tuple[str, bytes]], n_requests: int, concurrency: int) -> float:
+    """
+    Send n_requests requests cycling through queries, concurrency at a time
+
+    Returns:
+        float: Requests per second
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    cycle = itertools.islice(itertools.cycle(queries), n_requests)
+
+    async def limited(path: str, query_string: bytes) -> None:
+        async with semaphore:
+            status, _ = await request(app, path, query_string)
+            assert status == 200, (path, query_string, status)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(path, query_string) for path, query_string in cycle))
+    return n_requests / (time.perf_counter() - start)
+
+async def check_summary(app: QueryService) -> None:
+    """The API must answer exactly what DataProcessor computes"""
+    _, body = await request(app, '/summary', b'year_min=2010&year_max=2015&region=foreign')
+    filtered = app.processor.apply_filters(app.df, (2010, 2015), regional_filter="Foreign Dominance (>50%)")
+    expected = json.loads(encode(app.processor.get_summary_stats(filtered)))
+    assert json.loads(body)['data'] == expected
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=5_000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    app = QueryService(workers=args.workers)
+    start = time.perf_counter()
+    await app.dataset()
+    print(f"dataset loaded in {time.perf_counter() - start:.2f} s")
+    await check_summary(app)
+
+    queries = make_queries()
+    cold = await run_load(app, queries, len(queries), args.concurrency)
+    warm = await run_load(app, queries, args.requests, args.concurrency)
+
+    print(f"{'distinct queries':>17} {'cold (req/s)':>13} {'cached (req/s)':>15}")
+    print(f"{len(queries):>17,} {cold:>13,.0f} {warm:>15,.0f}")
+    print(f"response cache: {app.responses.stats()}")
+
+if __name__ == '__main__':
+    asyncio.run(main())
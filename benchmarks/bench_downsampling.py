@@ -0,0 +1,89 @@
+"""
+Benchmark the revenue trends chart on daily series with and without downsampling
+
+Usage:
+    python -m benchmarks.bench_downsampling [--sizes 5000 10000 20000 200000]
+
+Downsampling is forced on at every size, whatever DOWNSAMPLING_CONFIG['min_points'],
+so that the output shows the series length from which it pays off.
+"""
+import argparse
+import json
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parsing import best_of
+from src.config.settings import DOWNSAMPLING_CONFIG
+from src.visualizations.charts import ChartCreator
+
+def make_daily_frame(n_days: int, n_spikes: int = 20, seed: int = 42) -> pd.DataFrame:
+    """
+    Build one row per day with random-walk market shares and isolated spikes
+
+    Args:
+        n_days: Number of days
+        n_spikes: Number of single-day spikes in the domestic share, evenly spread
+        seed: Random seed
+
+    Returns:
+        pd.DataFrame: Frame with the columns the trends chart aggregates
+    """
+    rng = np.random.default_rng(seed)
+    domestic = (40 + rng.normal(0, 0.2, n_days).cumsum()).clip(5, 90)
+    # Spikes are spread out: LTTB keeps a single point per bucket of days
+    spikes = np.linspace(0, n_days - 1, n_spikes + 2).astype(np.int64)[1:-1]
+    domestic[spikes] = np.where(rng.random(n_spikes) < 0.5, 99.0, 1.0)
+
+    return pd.DataFrame({
+        'Release_Date': pd.date_range('1800-01-01', periods=n_days, freq='D'),
+        'Domestic %': domestic,
+        'Foreign %': 100 - domestic,
+        'Worldwide_Millions': rng.lognormal(3, 1, n_days),
+        'Release Group': [f"Movie {i}" for i in range(n_days)],
+    })
+
+def build_and_serialize(creator: ChartCreator, df: pd.DataFrame) -> str:
+    """Build the trends chart, bypassing the figure cache, and serialize it as sent to the browser"""
+    fig = ChartCreator.create_revenue_trends_chart.__wrapped__(creator, df, time_col='Release_Date')
+    return fig.to_json()
+
+def trace_x(payload: str) -> list:
+    """x values of the first trace of a serialized figure"""
+    return json.loads(payload)['data'][0]['x']
+
+def check_spikes_kept(df: pd.DataFrame, payload: str) -> None:
+    """Every single-day spike of the domestic share must survive downsampling"""
+    shown = pd.to_datetime(pd.Series(trace_x(payload)))
+    spikes = df.loc[(df['Domestic %'] == 99.0) | (df['Domestic %'] == 1.0), 'Release_Date']
+    assert spikes.isin(shown).all(), "a spike was dropped"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5_000, 10_000, 20_000, 200_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    creator = ChartCreator()
+    DOWNSAMPLING_CONFIG['min_points'] = 0
+
+    print(f"{'days':>10} {'points':>8} {'full (MB)':>10} {'reduced (MB)':>13} "
+          f"{'full (s)':>9} {'reduced (s)':>12} {'speedup':>8}")
+
+    for n_days in args.sizes:
+        df = make_daily_frame(n_days)
+
+        DOWNSAMPLING_CONFIG['enabled'] = False
+        full = build_and_serialize(creator, df)
+        before = best_of(lambda: build_and_serialize(creator, df), args.repeat)
+
+        DOWNSAMPLING_CONFIG['enabled'] = True
+        reduced = build_and_serialize(creator, df)
+        check_spikes_kept(df, reduced)
+        after = best_of(lambda: build_and_serialize(creator, df), args.repeat)
+
+        print(f"{n_days:>10,} {len(trace_x(reduced)):>8,} {len(full) / 1e6:>10.2f} {len(reduced) / 1e6:>13.3f} "
+              f"{before:>9.3f} {after:>12.4f} {before / after:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
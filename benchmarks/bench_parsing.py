@@ -0,0 +1,59 @@
+"""
+Benchmark rating and genre parsing against the per-row regex/split path
+
+Usage:
+    python -m benchmarks.bench_parsing [--sizes 100000 1000000 10000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.datasets import make_raw_frame
+from src.data.parsing import parse_rating_scores, parse_primary_genres
+
+def best_of(func, repeat: int = 3) -> float:
+    """Return the best wall time of several runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def per_row_parsing(ratings: pd.Series, genres: pd.Series) -> None:
+    """Previous implementation: regex and split evaluated on every row"""
+    ratings.str.extract(r'(\d+\.?\d*)').astype(float)
+    genres.str.split(',').str[0].str.strip()
+
+def distinct_value_parsing(ratings: pd.Series, genres: pd.Series) -> None:
+    """Current implementation: parse each distinct value once and broadcast"""
+    parse_rating_scores(ratings)
+    parse_primary_genres(genres)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    print(f"{'rows':>12} {'input':>10} {'per-row (s)':>12} {'distinct (s)':>13} {'speedup':>8}")
+    
+    for n_rows in args.sizes:
+        raw = make_raw_frame(n_rows)
+        
+        for label, ratings, genres in [
+            ('category', raw['Rating'], raw['Genres']),
+            ('object', raw['Rating'].astype(object), raw['Genres'].astype(object))
+        ]:
+            # Results must match the per-row path exactly
+            expected = ratings.str.extract(r'(\d+\.?\d*)')[0].astype(float)
+            np.testing.assert_array_equal(parse_rating_scores(ratings).to_numpy(), expected.to_numpy())
+            
+            before = best_of(lambda: per_row_parsing(ratings, genres), args.repeat)
+            after = best_of(lambda: distinct_value_parsing(ratings, genres), args.repeat)
+            print(f"{n_rows:>12,} {label:>10} {before:>12.3f} {after:>13.4f} {before / after:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark the title search index against a str.contains scan
+
+Usage:
+    python -m benchmarks.bench_search [--sizes 5000 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parsing import best_of
+from benchmarks.datasets import make_clean_frame
+from src.data.search_index import SearchIndex, normalize_titles
+
+QUERIES = ['avengers', 'harry potter', 'star wars', 'avenegrs', 'hary poter', 'the']
+
+def make_titles(n_rows: int) -> pd.Series:
+    """Distinct titles: resampled source titles numbered like sequels and re-releases"""
+    titles = make_clean_frame(n_rows)['Release Group'].astype(str)
+    return titles + ' ' + pd.Series(np.arange(n_rows)).astype(str)
+
+def check_same_matches(index: SearchIndex, titles: pd.Series, query: str) -> None:
+    """Without typos, the index must find exactly the titles containing the query"""
+    expected = np.flatnonzero(normalize_titles(titles).str.contains(query, regex=False).to_numpy())
+    assert np.array_equal(np.sort(index.search(query, fuzzy=False)), expected), query
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for n_rows in args.sizes:
+        titles = make_titles(n_rows)
+
+        start = time.perf_counter()
+        index = SearchIndex(titles)
+        print(f"\n{index}: built in {time.perf_counter() - start:.2f} s")
+
+        check_same_matches(index, titles, 'potter')
+        check_same_matches(index, titles, 'of the')
+
+        print(f"{'query':>14} {'matches':>9} {'scan (ms)':>10} {'index (ms)':>11} {'speedup':>8}")
+        for query in QUERIES:
+            scan = best_of(lambda: titles.str.contains(query, case=False, na=False), args.repeat)
+            indexed = best_of(lambda: index.search(query), args.repeat)
+            print(f"{query:>14} {len(index.search(query)):>9,} {scan * 1e3:>10.1f} "
+                  f"{indexed * 1e3:>11.3f} {scan / indexed:>7.0f}x")
+
+if __name__ == '__main__':
+    main()
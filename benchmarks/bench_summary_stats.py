@@ -0,0 +1,59 @@
+"""
+Benchmark the fused summary statistics kernel against the per-metric pandas path
+
+Usage:
+    python -m benchmarks.bench_summary_stats [--rows 1000000] [--fractions 0.001 0.01 0.1 1.0]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parsing import best_of
+from benchmarks.datasets import make_clean_frame
+from src.data.processor import DataProcessor
+
+def per_metric_summary_stats(df: pd.DataFrame) -> dict:
+    """Previous implementation: one pandas reduction or sub-frame per metric"""
+    return {
+        'total_movies': len(df),
+        'total_worldwide_revenue': df['$Worldwide'].sum(),
+        'avg_worldwide_revenue': df['$Worldwide'].mean(),
+        'avg_domestic_percentage': df['Domestic %'].mean(),
+        'avg_foreign_percentage': df['Foreign %'].mean(),
+        'top_grossing_movie': df.loc[df['$Worldwide'].idxmax(), 'Release Group'],
+        'avg_rating': df['Rating_Score'].mean() if not df['Rating_Score'].isna().all() else 0,
+        'year_range': (int(df['Year'].min()), int(df['Year'].max())),
+        'unique_genres': df['Primary_Genre'].nunique(),
+        'domestic_dominance_count': len(df[df['Domestic_Dominance'] == True]),
+        'foreign_dominance_count': len(df[df['Foreign_Dominance'] == True]),
+        'balanced_performance_count': len(df[df['Regional_Balance'] == True])
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--fractions', type=float, nargs='+', default=[0.001, 0.01, 0.1, 1.0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    processor = DataProcessor(use_cache=False)
+    df = make_clean_frame(args.rows)
+    rng = np.random.default_rng(0)
+
+    print(f"{'subset rows':>12} {'per-metric (ms)':>16} {'fused (ms)':>11} {'speedup':>8}")
+
+    for fraction in args.fractions:
+        # Filtered subsets are non-contiguous row selections, as apply_filters returns
+        positions = np.sort(rng.choice(len(df), max(1, int(len(df) * fraction)), replace=False))
+        subset = df.take(positions)
+
+        # Results must match the previous implementation exactly
+        assert processor._compute_summary_stats(subset) == per_metric_summary_stats(subset)
+
+        before = best_of(lambda: per_metric_summary_stats(subset), args.repeat)
+        after = best_of(lambda: processor._compute_summary_stats(subset), args.repeat)
+        print(f"{len(subset):>12,} {before * 1000:>16.2f} {after * 1000:>11.2f} {before / after:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark the sunburst hierarchy builder against the nested genre/rating loop
+
+Usage:
+    python -m benchmarks.bench_sunburst [--sizes 5000 1000000]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_parsing import best_of
+from benchmarks.datasets import make_clean_frame
+from src.visualizations.hierarchy import build_hierarchy
+
+def nested_loop_hierarchy(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous implementation: re-filter the frame for every genre and rating"""
+    sunburst_data = []
+
+    for genre in df['Primary_Genre'].unique():
+        genre_df = df[df['Primary_Genre'] == genre]
+        sunburst_data.append({
+            'ids': genre,
+            'labels': genre,
+            'parents': '',
+            'values': genre_df['Worldwide_Millions'].sum()
+        })
+
+        for rating in genre_df['Rating'].unique():
+            rating_df = genre_df[genre_df['Rating'] == rating]
+            sunburst_data.append({
+                'ids': f"{genre} - {rating}",
+                'labels': rating,
+                'parents': genre,
+                'values': rating_df['Worldwide_Millions'].sum()
+            })
+
+    return pd.DataFrame(sunburst_data)
+
+def check_same_nodes(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    """
+    Both builders must produce the same nodes. Missing genres and ratings
+    are left out: the loop gives them zero-valued nodes, the builder an
+    'Unknown' node holding their revenue.
+    """
+    expected = expected[expected['ids'].notna() & ~expected['ids'].astype(str).str.endswith(' - nan')]
+    expected = expected.set_index('ids').sort_index()
+    actual = actual[~actual['ids'].str.startswith('Unknown') & ~actual['ids'].str.endswith(' - Unknown')]
+    actual = actual.set_index('ids').sort_index()
+
+    assert expected.index.equals(actual.index)
+    assert (expected['parents'] == actual['parents']).all()
+    np.testing.assert_allclose(expected['values'].astype(float), actual['values'], rtol=1e-6)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--loop-repeat', type=int, default=1, help='Runs of the (slow) nested loop')
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'ratings':>8} {'nodes':>8} {'loop (s)':>10} {'builder (s)':>12} {'speedup':>8}")
+
+    for n_rows in args.sizes:
+        df = make_clean_frame(n_rows)
+
+        nodes = build_hierarchy(df, ['Primary_Genre', 'Rating'], 'Worldwide_Millions')
+        check_same_nodes(nested_loop_hierarchy(df), nodes)
+
+        before = best_of(lambda: nested_loop_hierarchy(df), args.loop_repeat)
+        after = best_of(lambda: build_hierarchy(df, ['Primary_Genre', 'Rating'], 'Worldwide_Millions'), args.repeat)
+        print(f"{n_rows:>12,} {df['Rating'].nunique():>8,} {len(nodes):>8,} "
+              f"{before:>10.3f} {after:>12.4f} {before / after:>7.1f}x")
+
+        # Deeper hierarchy with binned ratings, only possible with the builder
+        deep = best_of(lambda: build_hierarchy(
+            df, ['Primary_Genre', 'Rating_Score', 'Original_Language', 'Release Group'], 'Worldwide_Millions',
+            bins={'Rating_Score': [0, 5, 6, 7, 8, 10]}
+        ), args.repeat)
+        print(f"{'':>12} genre -> rating bucket -> language -> movie: {deep:.4f} s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from benchmarks.synthetic import SOURCE_CSV, generate_frame
+from src.config.settings import SOURCE_SCHEMA
+
+def make_raw_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a raw frame shaped like the source CSV, as read with SOURCE_SCHEMA
+    
+    Rows come from the synthetic generator, so revenues, ratings and titles
+    keep growing in distinct values with the row count, as they do in real
+    feeds.
+    
+    Args:
+        n_rows: Number of rows to generate
+        seed: Random seed
+        
+    Returns:
+        pd.DataFrame: Raw frame with the source schema
+    """
+    return generate_frame(n_rows, seed, SOURCE_CSV).astype(SOURCE_SCHEMA)
+
+def make_clean_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build a cleaned dataset of the given size
+    
+    Args:
+        n_rows: Number of rows to generate
+        seed: Random seed
+        
+    Returns:
+        pd.DataFrame: Frame as returned by DataProcessor.load_and_clean_data
+    """
+    from src.data.processor import DataProcessor
+    
+    return DataProcessor(use_cache=False)._clean_data(make_raw_frame(n_rows, seed))
@@ -0,0 +1,334 @@
+"""
+Benchmark suite for the data and chart layers, with stored baselines
+
+Every case runs on synthetic datasets of each size. The best time of
+several runs is compared with benchmarks/baselines.json, and the run fails
+when a case is slower than its baseline by more than its regression
+threshold. Baselines also record how much the runs of each case spread, and
+cases that are noisy on the recording machine get a wider threshold.
+
+A fixed reference workload is timed before every run, and a case only
+counts as changed when it also is once scaled by how fast that workload ran
+compared with when the baseline was recorded, so that a machine running
+slower or faster as a whole (a busy shared host, CPU throttling) does not
+read as a change of the code.
+
+Usage:
+    python -m benchmarks.suite [--sizes 5000 100000 1000000] [--only apply_filters create_]
+    python -m benchmarks.suite --save                        # record the results as new baselines
+    python -m benchmarks.suite --sizes 10000000 --repeat 3   # scale run, without a baseline
+"""
+import argparse
+import gc
+import inspect
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_dataset
+from src.config.settings import DATA_CACHE_CONFIG
+from src.data.cache import DatasetCache
+from src.data.processor import DataProcessor, _shared_result_cache
+from src.visualizations.charts import ChartCreator
+
+# Sizes with stored baselines; larger ones can be run with --sizes
+SIZES = [5_000, 100_000, 1_000_000]
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+# A case regresses when it is this much slower than its baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...or, for noisy cases, than this many times the spread of its baseline runs...
+NOISE_MULTIPLIER = 2
+# ...and slower by more than this, so that timer noise on tiny cases never fails a run
+NOISE_FLOOR_SECONDS = 0.002
+# Runs of every case, however long it takes
+MIN_RUNS = 3
+# Values sorted and grouped by the reference workload
+REFERENCE_ROWS = 500_000
+
+class Context:
+    """Synthetic dataset of one size, loaded the way the apps load it"""
+
+    def __init__(self, n_rows: int, directory: str):
+        """
+        Args:
+            n_rows: Number of rows
+            directory: Folder for the source CSV and its dataset cache
+        """
+        self.n_rows = n_rows
+        self.csv_path = os.path.join(directory, f"movies_{n_rows}.csv")
+        write_dataset(self.csv_path, n_rows)
+
+        self.processor = DataProcessor(self.csv_path)
+        self.df = self.processor.load_shared_data()
+        self.filters = ((2000, 2020),)
+        self.filtered = self.processor.apply_filters(self.df, *self.filters)
+
+        self.charts = ChartCreator()
+        # Figures are measured as built, never served from the figure cache
+        self.charts.figure_cache = None
+
+    def reset(self) -> None:
+        """Drop cached filter results so that every run computes them again"""
+        _shared_result_cache().clear()
+
+class Case:
+    """One timed operation"""
+
+    def __init__(self,
+                 name: str,
+                 build: Callable[[Context], Callable[[], Any]],
+                 threshold: float = DEFAULT_THRESHOLD):
+        """
+        Args:
+            name: Unique case name, the key of its baselines
+            build: Function (context) returning the operation to time
+            threshold: Allowed slowdown over the baseline, as a fraction
+        """
+        self.name = name
+        self.build = build
+        self.threshold = threshold
+
+def loaded(load: Callable[[], Optional[pd.DataFrame]]) -> Callable[[], pd.DataFrame]:
+    """Time a loader, failing loudly instead of timing the error path"""
+    def run() -> pd.DataFrame:
+        df = load()
+        if df is None:
+            raise RuntimeError("dataset could not be loaded")
+        return df
+    return run
+
+def serialized(create: Callable[..., Any], *args) -> Callable[[], str]:
+    """Time a chart method together with the serialization sent to the browser"""
+    return lambda: create(*args).to_json()
+
+# ChartCreator.create_* method -> arguments after the chart creator, built from the context
+CHART_ARGS: Dict[str, Callable[[Context], tuple]] = {
+    'create_regional_comparison_chart': lambda ctx: (
+        ctx.filtered, ctx.filtered.nlargest(5, 'Worldwide_Millions')['Release Group'].tolist()),
+    'create_performance_scatter': lambda ctx: (ctx.filtered,),
+    'create_genre_regional_analysis': lambda ctx: (ctx.filtered,),
+    'create_revenue_trends_chart': lambda ctx: (ctx.filtered,),
+    'create_top_performers_chart': lambda ctx: (ctx.filtered, 10),
+    'create_pie_chart': lambda ctx: (
+        ctx.filtered['Performance_Category'].value_counts().to_dict(), "Performance Categories"),
+    'create_stacked_bar_chart': lambda ctx: (
+        ctx.processor.get_yearly_trends(ctx.filtered), 'Year', ['Avg_Domestic_Pct', 'Avg_Foreign_Pct'], "Regional Share"),
+    'create_advanced_3d_scatter': lambda ctx: (ctx.filtered,),
+    'create_animated_timeline_chart': lambda ctx: (ctx.filtered,),
+    'create_radial_chart': lambda ctx: (ctx.filtered,),
+    'create_waterfall_chart': lambda ctx: (
+        ctx.filtered, ctx.filtered['Release Group'].iloc[int(np.argmax(ctx.filtered['Worldwide_Millions'].to_numpy()))]),
+    'create_heatmap_correlation': lambda ctx: (ctx.filtered,),
+    'create_sunburst_chart': lambda ctx: (ctx.filtered,),
+    'create_violin_plot': lambda ctx: (ctx.filtered,),
+}
+
+def chart_cases() -> List[Case]:
+    """One case per public ChartCreator.create_* method; every one needs an entry in CHART_ARGS"""
+    methods = [name for name, _ in inspect.getmembers(ChartCreator, inspect.isfunction) if name.startswith('create_')]
+    missing = sorted(set(methods) - set(CHART_ARGS))
+    if missing:
+        raise SystemExit(f"No benchmark arguments for {', '.join(missing)}: add them to CHART_ARGS")
+
+    return [
+        Case(method, lambda ctx, method=method: serialized(getattr(ctx.charts, method), *CHART_ARGS[method](ctx)))
+        for method in methods
+    ]
+
+CASES: List[Case] = [
+    Case('load_and_clean_data', lambda ctx: loaded(DataProcessor(ctx.csv_path, use_cache=False)._load_and_clean)),
+    Case('load_cached_dataset', lambda ctx: loaded(lambda: DatasetCache(ctx.csv_path).load(memory_map=True))),
+    Case('apply_filters', lambda ctx: lambda: ctx.processor.apply_filters(ctx.df, (2005, 2015), 'Action')),
+    Case('get_summary_stats', lambda ctx: lambda: ctx.processor.get_summary_stats(ctx.filtered)),
+    Case('get_genre_analysis', lambda ctx: lambda: ctx.processor.get_genre_analysis(ctx.filtered)),
+    Case('get_yearly_trends', lambda ctx: lambda: ctx.processor.get_yearly_trends(ctx.filtered)),
+] + chart_cases()
+
+def reference_workload() -> None:
+    """Fixed mix of NumPy, pandas and interpreter work whose time tracks the speed of the machine"""
+    values = np.random.default_rng(0).random(REFERENCE_ROWS)
+    keys = (values * 64).astype(np.int64)
+    np.sort(values)
+    pd.Series(values).groupby(keys).mean()
+    sum(int(key) for key in keys[:REFERENCE_ROWS // 4])
+
+def _timed(func: Callable[[], Any]) -> float:
+    """Wall time of one call, with garbage collection switched off as timeit does"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def measure(func: Callable[[], Any], reset: Callable[[], None], repeat: int, budget: float) -> Tuple[float, float, float]:
+    """
+    Time an operation several times and keep the best run
+
+    The reference workload is timed right before every run, so that both
+    best times come from the same stretches of machine speed.
+
+    Args:
+        func: Operation to time
+        reset: Called before every run, untimed
+        repeat: Maximum number of runs
+        budget: Stop repeating once this many seconds have been spent, after
+            at least MIN_RUNS runs
+
+    Returns:
+        tuple: (best wall time in seconds, spread of the runs: how much
+            slower the median run is than the best, as a fraction, best
+            wall time of the reference workload in seconds)
+    """
+    timings = []
+    references = []
+    while len(timings) < repeat and (len(timings) < MIN_RUNS or sum(timings) < budget):
+        reset()
+        references.append(_timed(reference_workload))
+        timings.append(_timed(func))
+    best = min(timings)
+    return best, float(np.median(timings)) / best - 1, min(references)
+
+def machine_info() -> Dict[str, Any]:
+    """Description of the machine and library versions the timings depend on"""
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+
+def load_baselines(path: str) -> Dict[str, Any]:
+    """Read the stored baselines, an empty set if there are none"""
+    if not os.path.exists(path):
+        return {'machine': None, 'results': {}}
+    with open(path, encoding='utf-8') as source:
+        stored = json.load(source)
+    # Entries of earlier versions of the suite lack the spread or the reference time
+    stored['results'] = {
+        name: {size: entry for size, entry in sizes.items() if isinstance(entry, dict) and 'reference' in entry}
+        for name, sizes in stored['results'].items()
+    }
+    return stored
+
+def threshold(case: Case, baseline: Dict[str, float]) -> float:
+    """Allowed slowdown of a case over a baseline, widened for noisy cases"""
+    return max(case.threshold, NOISE_MULTIPLIER * baseline['spread'])
+
+def scaled(seconds: float, reference: float, baseline: Dict[str, float]) -> float:
+    """Time of a run as it would have been at the machine speed of the baseline"""
+    return seconds * baseline['reference'] / reference
+
+def compare(case: Case, seconds: float, reference: float, baseline: Optional[Dict[str, float]]) -> str:
+    """
+    Classify a timing against its baseline
+
+    A case changed only when it did both as measured and scaled to the
+    machine speed of the baseline, so that neither a drifting machine nor
+    a reference run that hit a fast or slow moment reads as a change.
+
+    Args:
+        case: Timed case
+        seconds: Best time of the run
+        reference: Best time of the reference workload during the run
+        baseline: Stored {'seconds', 'spread', 'reference'} of the case at
+            this size, None if there is none
+
+    Returns:
+        str: 'new', 'faster', 'ok' or 'SLOWER' (a regression)
+    """
+    if baseline is None:
+        return 'new'
+    allowed = threshold(case, baseline)
+    base = baseline['seconds']
+    timings = (seconds, scaled(seconds, reference, baseline))
+    if all(t > base * (1 + allowed) and t - base > NOISE_FLOOR_SECONDS for t in timings):
+        return 'SLOWER'
+    if all(t < base / (1 + allowed) and base - t > NOISE_FLOOR_SECONDS for t in timings):
+        return 'faster'
+    return 'ok'
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--only', nargs='+', default=[], help="Run only cases whose name starts with one of these")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=15.0,
+                        help=f"Seconds per case after which runs stop repeating (after at least {MIN_RUNS} runs)")
+    parser.add_argument('--baselines', default=BASELINES_PATH)
+    parser.add_argument('--save', action='store_true', help="Store the results as the new baselines")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if not args.only or case.name.startswith(tuple(args.only))]
+    stored = load_baselines(args.baselines)
+    if stored['machine'] and stored['machine'] != machine_info() and not args.save:
+        print(f"warning: baselines were recorded on a different machine: {stored['machine']}\n")
+
+    regressions = []
+    print(f"{'case':<34} {'rows':>11} {'best (ms)':>11} {'spread':>7} {'speed':>6} "
+          f"{'baseline (ms)':>14} {'change':>8} {'allowed':>8}  status")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Dataset caches of the synthetic sources stay in the temporary folder
+        DATA_CACHE_CONFIG['directory'] = directory
+
+        for n_rows in args.sizes:
+            ctx = Context(n_rows, directory)
+
+            for case in cases:
+                func = case.build(ctx)
+                seconds, spread, reference = measure(func, ctx.reset, args.repeat, args.budget)
+                baseline = stored['results'].get(case.name, {}).get(str(n_rows))
+                status = compare(case, seconds, reference, baseline)
+
+                if status == 'SLOWER':
+                    # Confirm with a second round before reporting a regression
+                    confirmed = measure(func, ctx.reset, args.repeat, args.budget)
+                    if scaled(confirmed[0], confirmed[2], baseline) < scaled(seconds, reference, baseline):
+                        seconds, spread, reference = confirmed
+                    status = compare(case, seconds, reference, baseline)
+
+                if baseline:
+                    speed = f"{baseline['reference'] / reference:.2f}x"
+                    change = f"{scaled(seconds, reference, baseline) / baseline['seconds'] - 1:>+8.0%}"
+                    allowed = f"{threshold(case, baseline):>+8.0%}"
+                    baseline_ms = f"{baseline['seconds'] * 1e3:.2f}"
+                else:
+                    speed = change = allowed = baseline_ms = '-'
+                print(f"{case.name:<34} {n_rows:>11,} {seconds * 1e3:>11.2f} {spread:>7.0%} {speed:>6} "
+                      f"{baseline_ms:>14} {change:>8} {allowed:>8}  {status}")
+
+                if status == 'SLOWER':
+                    regressions.append(f"{case.name} @ {n_rows:,} rows")
+                stored['results'].setdefault(case.name, {})[str(n_rows)] = {
+                    'seconds': round(seconds, 6),
+                    'spread': round(spread, 3),
+                    'reference': round(reference, 6),
+                }
+
+            del ctx
+
+    if args.save:
+        stored['machine'] = machine_info()
+        with open(args.baselines, 'w', encoding='utf-8') as target:
+            json.dump(stored, target, indent=2, sort_keys=True)
+            target.write('\n')
+        print(f"\nbaselines saved to {args.baselines}")
+    elif regressions:
+        print(f"\n{len(regressions)} regression(s) over the thresholds: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
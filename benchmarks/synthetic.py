@@ -0,0 +1,280 @@
+"""
+Generate synthetic box-office datasets of any size with the schema of the source CSV
+
+Rows are drawn from a smoothed bootstrap of the source: every synthetic
+movie takes the genres, language, countries and rating profile of a source
+movie of the same year, with its revenue, domestic share, rating and votes
+jittered, so joint patterns (foreign-language releases with no domestic
+gross, blockbusters with many votes) carry over. Titles are new word
+combinations from the source vocabulary. Revenues always add up and the
+percentages always sum to 100; rows are ordered by year and ranked by
+worldwide gross within the year, as in the source.
+
+Output is written year by year in chunks, so memory stays bounded by one
+chunk plus two numbers per row of the largest year, and is reproducible
+for a given seed and row count.
+
+Usage:
+    python -m benchmarks.synthetic 10000000 data/movies_10m.csv [--seed 42]
+    python -m benchmarks.synthetic 10000000 data/movies_10m.parquet    # or .arrow
+"""
+import argparse
+import os
+import time
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+SOURCE_CSV = 'movie_revenue_data.csv'
+
+# Rows generated and written at a time; part of the random draw, like the seed
+CHUNK_ROWS = 100_000
+
+# Spread of the multiplicative revenue jitter (log scale) and of the
+# domestic share jitter (logit scale)
+REVENUE_SIGMA = 0.25
+SHARE_SIGMA = 0.25
+# Spread of the rating jitter, in points out of 10
+RATING_SIGMA = 0.3
+
+# Column types of the columnar outputs, matching what read_csv infers for the source
+RAW_SCHEMA = pa.schema([
+    ('Rank', pa.int64()),
+    ('Release Group', pa.string()),
+    ('$Worldwide', pa.float64()),
+    ('$Domestic', pa.float64()),
+    ('Domestic %', pa.float64()),
+    ('$Foreign', pa.float64()),
+    ('Foreign %', pa.float64()),
+    ('Year', pa.int64()),
+    ('Genres', pa.string()),
+    ('Rating', pa.string()),
+    ('Vote_Count', pa.float64()),
+    ('Original_Language', pa.string()),
+    ('Production_Countries', pa.string()),
+])
+
+FORMATS = {'.csv': 'csv', '.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow'}
+
+class Profiles:
+    """Source movies the synthetic rows are drawn from, as NumPy arrays"""
+
+    def __init__(self, reference_path: str = SOURCE_CSV):
+        """
+        Args:
+            reference_path: Source CSV the distributions are taken from
+        """
+        source = pd.read_csv(reference_path)
+        source = source[source['$Worldwide'] > 0].sort_values('Year', kind='stable').reset_index(drop=True)
+
+        self.years, year_starts = np.unique(source['Year'].to_numpy(), return_index=True)
+        self.year_bounds = np.append(year_starts, len(source))
+
+        self.worldwide = source['$Worldwide'].to_numpy(dtype=np.float64)
+        # Shares are recomputed from the dollar amounts, which the rounded source percentages disagree with
+        parts = source[['$Domestic', '$Foreign']].to_numpy(dtype=np.float64)
+        self.domestic_share = parts[:, 0] / np.maximum(parts.sum(axis=1), 1)
+        self.rating = pd.to_numeric(source['Rating'].str.extract(r'^(\d+\.?\d*)')[0]).to_numpy(dtype=np.float64)
+        self.votes = source['Vote_Count'].to_numpy(dtype=np.float64)
+
+        self.text: Dict[str, np.ndarray] = {
+            column: source[column].astype(object).to_numpy()
+            for column in ['Genres', 'Original_Language', 'Production_Countries']
+        }
+
+        words = source['Release Group'].astype(str).str.split()
+        self.title_lengths = words.str.len().to_numpy()
+        vocabulary = pd.Series(np.concatenate(words.to_numpy())).value_counts()
+        self.vocabulary = pa.array(vocabulary.index.to_numpy(dtype=object), type=pa.string())
+        self.word_weights = vocabulary.to_numpy() / vocabulary.sum()
+
+    def rows_per_year(self, n_rows: int) -> np.ndarray:
+        """Split a row count over the source years in proportion to their movies"""
+        counts = np.diff(self.year_bounds)
+        rows = np.floor(n_rows * counts / counts.sum()).astype(np.int64)
+        rows[:n_rows - rows.sum()] += 1
+        return rows
+
+def _titles(profiles: Profiles, sources: np.ndarray, rng: np.random.Generator) -> pa.Array:
+    """New titles with the word counts of their source movies, words drawn by frequency"""
+    lengths = profiles.title_lengths[sources]
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+    words = rng.choice(len(profiles.vocabulary), size=int(offsets[-1]), p=profiles.word_weights)
+    lists = pa.ListArray.from_arrays(pa.array(offsets), profiles.vocabulary.take(pa.array(words)))
+    return pc.binary_join(lists, ' ')
+
+def _ratings(scores: np.ndarray) -> np.ndarray:
+    """Format scores like the source: up to three decimals and '/10', missing scores as None"""
+    text = np.char.add(np.round(scores, 3).astype(str), '/10').astype(object)
+    text[np.isnan(scores)] = None
+    return text
+
+def _chunk(profiles: Profiles,
+           sources: np.ndarray,
+           worldwide: np.ndarray,
+           scale: np.ndarray,
+           ranks: np.ndarray,
+           year: int,
+           rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Build the rows of one chunk
+
+    Args:
+        profiles: Source movies
+        sources: Source movie of every row
+        worldwide: Worldwide gross of every row, whole dollars
+        scale: Revenue jitter of every row, also applied to the vote count
+        ranks: Rank of every row within its year
+        year: Release year of the chunk
+        rng: Generator of the chunk
+
+    Returns:
+        pd.DataFrame: Rows with the source columns
+    """
+    n = len(sources)
+
+    # Releases with no domestic (or no foreign) gross keep it that way
+    share = profiles.domestic_share[sources]
+    partial = (share > 0) & (share < 1)
+    logit = np.log(share[partial] / (1 - share[partial])) + rng.normal(0, SHARE_SIGMA, int(partial.sum()))
+    share[partial] = 1 / (1 + np.exp(-logit))
+
+    domestic = np.round(worldwide * share)
+    domestic_pct = np.round(100 * domestic / worldwide, 1)
+
+    scores = np.clip(profiles.rating[sources] + rng.normal(0, RATING_SIGMA, n), 1, 10)
+
+    df = pd.DataFrame({
+        'Rank': ranks,
+        'Release Group': pd.Series(pd.arrays.ArrowStringArray(_titles(profiles, sources, rng))),
+        '$Worldwide': worldwide,
+        '$Domestic': domestic,
+        'Domestic %': domestic_pct,
+        '$Foreign': worldwide - domestic,
+        'Foreign %': np.round(100 - domestic_pct, 1),
+        'Year': np.full(n, year, dtype=np.int64),
+        'Genres': profiles.text['Genres'][sources],
+        'Rating': _ratings(scores),
+        'Vote_Count': np.round(profiles.votes[sources] * scale),
+        'Original_Language': profiles.text['Original_Language'][sources],
+        'Production_Countries': profiles.text['Production_Countries'][sources],
+    })
+    return df
+
+def generate_chunks(n_rows: int,
+                    seed: int = 42,
+                    reference_path: str = SOURCE_CSV,
+                    profiles: Optional[Profiles] = None) -> Iterator[pd.DataFrame]:
+    """
+    Generate a synthetic dataset chunk by chunk
+
+    Every year draws from its own generator, seeded with (seed, year), and
+    each of its chunks from (seed, year, chunk), so the output only depends
+    on the seed, the row count and the reference data.
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+        reference_path: Source CSV the distributions are taken from
+        profiles: Already loaded source movies, instead of reading reference_path
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of at most CHUNK_ROWS rows with the source columns
+    """
+    profiles = profiles or Profiles(reference_path)
+
+    for i, (year, rows) in enumerate(zip(profiles.years, profiles.rows_per_year(n_rows))):
+        if rows == 0:
+            continue
+        rng = np.random.default_rng([seed, int(year)])
+
+        # Revenues of the whole year come first, so that rows can be ranked within it
+        sources = rng.integers(profiles.year_bounds[i], profiles.year_bounds[i + 1], rows)
+        scale = rng.lognormal(0.0, REVENUE_SIGMA, rows)
+        worldwide = np.maximum(np.round(profiles.worldwide[sources] * scale), 1)
+
+        order = np.argsort(-worldwide, kind='stable')
+        sources, scale, worldwide = sources[order], scale[order], worldwide[order]
+
+        for start in range(0, rows, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, rows)
+            chunk_rng = np.random.default_rng([seed, int(year), start // CHUNK_ROWS])
+            yield _chunk(profiles, sources[start:stop], worldwide[start:stop], scale[start:stop],
+                         np.arange(start + 1, stop + 1), int(year), chunk_rng)
+
+def generate_frame(n_rows: int, seed: int = 42, reference_path: str = SOURCE_CSV) -> pd.DataFrame:
+    """
+    Generate a synthetic dataset in memory
+
+    Args:
+        n_rows: Number of rows
+        seed: Random seed
+        reference_path: Source CSV the distributions are taken from
+
+    Returns:
+        pd.DataFrame: Raw frame with the source columns
+    """
+    chunks = list(generate_chunks(n_rows, seed, reference_path))
+    if not chunks:
+        return pd.DataFrame({field.name: pd.Series(dtype=field.type.to_pandas_dtype()) for field in RAW_SCHEMA})
+    return pd.concat(chunks, ignore_index=True)
+
+def write_dataset(path: str,
+                  n_rows: int,
+                  seed: int = 42,
+                  fmt: Optional[str] = None,
+                  reference_path: str = SOURCE_CSV) -> int:
+    """
+    Stream a synthetic dataset to a file
+
+    Args:
+        path: Destination path
+        n_rows: Number of rows
+        seed: Random seed
+        fmt: 'csv', 'parquet' or 'arrow' (an Arrow IPC file), from the extension if None
+        reference_path: Source CSV the distributions are taken from
+
+    Returns:
+        int: Size of the written file in bytes
+    """
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in FORMATS.values():
+        raise ValueError(f"Unknown output format for {path}: use one of {', '.join(sorted(FORMATS))}")
+
+    chunks = generate_chunks(n_rows, seed, reference_path)
+
+    if fmt == 'csv':
+        with open(path, 'w', encoding='utf-8', newline='') as target:
+            target.write(','.join(RAW_SCHEMA.names) + '\n')
+            for chunk in chunks:
+                chunk.to_csv(target, header=False, index=False)
+    else:
+        with pa.OSFile(path, 'wb') as sink:
+            writer = pq.ParquetWriter(sink, RAW_SCHEMA) if fmt == 'parquet' else ipc.new_file(sink, RAW_SCHEMA)
+            with writer:
+                for chunk in chunks:
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=RAW_SCHEMA, preserve_index=False))
+
+    return os.path.getsize(path)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('rows', type=int, help="Number of rows")
+    parser.add_argument('path', help="Output file: .csv, .parquet or .arrow")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--reference', default=SOURCE_CSV, help="Source CSV the distributions are taken from")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.path)), exist_ok=True)
+    start = time.perf_counter()
+    size = write_dataset(args.path, args.rows, args.seed, reference_path=args.reference)
+    elapsed = time.perf_counter() - start
+    print(f"{args.rows:,} rows written to {args.path} ({size / 1_048_576:,.1f} MB) in {elapsed:.1f} s")
+
+if __name__ == '__main__':
+    main()
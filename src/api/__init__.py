@@ -0,0 +1 @@
+# Headless query API module
@@ -0,0 +1,96 @@
+"""
+Query parameters and JSON encoding shared by the query API and the batch reports
+
+Kept apart from the server so that importing them does not build a service.
+"""
+import json
+import math
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import ALL_OPTION, REGIONAL_FILTERS
+
+# Short names of the regional filter options
+REGION_ALIASES = dict(zip(['domestic', 'foreign', 'balanced'], REGIONAL_FILTERS[1:]))
+
+FILTER_PARAMS = ['year_min', 'year_max', 'genre', 'language', 'region', 'revenue_min', 'revenue_max']
+
+class QueryError(ValueError):
+    """Invalid query, answered with 400 Bad Request"""
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert a query result to plain JSON types
+
+    Frames become lists of row objects, NumPy scalars Python numbers and
+    missing or non-finite numbers null.
+
+    Args:
+        value: Frame, dict, list, tuple or scalar
+
+    Returns:
+        Value that json.dumps accepts with allow_nan=False
+    """
+    if isinstance(value, pd.DataFrame):
+        return json.loads(value.to_json(orient='records', date_format='iso'))
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+def encode(payload: Any) -> bytes:
+    """Serialize a response payload as compact JSON"""
+    return json.dumps(to_jsonable(payload), separators=(',', ':'), allow_nan=False).encode()
+
+def _number(params: Dict[str, str], name: str, kind: type, default: Any) -> Any:
+    """Parse an optional int or float query parameter"""
+    if name not in params:
+        return default
+    try:
+        return kind(params[name])
+    except (TypeError, ValueError):
+        expected = "an integer" if kind is int else "a number"
+        raise QueryError(f"{name} must be {expected}, got {params[name]!r}")
+
+def parse_filters(params: Dict[str, Any], year_bounds: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Turn filter parameters (FILTER_PARAMS) into apply_filters keyword arguments
+
+    Args:
+        params: Filter values as strings or numbers; missing ones do not filter
+        year_bounds: First and last year of the dataset, the default year range
+
+    Returns:
+        dict: year_range, selected_genre, selected_language, regional_filter
+            and revenue_range
+
+    Raises:
+        QueryError: On invalid values
+    """
+    region = str(params.get('region', ALL_OPTION))
+    region = REGION_ALIASES.get(region.lower(), region)
+    if region not in REGIONAL_FILTERS:
+        raise QueryError(f"region must be one of {', '.join(REGION_ALIASES)}")
+
+    revenue_range = None
+    if 'revenue_min' in params or 'revenue_max' in params:
+        revenue_range = (_number(params, 'revenue_min', float, 0.0), _number(params, 'revenue_max', float, math.inf))
+
+    return {
+        'year_range': (_number(params, 'year_min', int, year_bounds[0]), _number(params, 'year_max', int, year_bounds[1])),
+        'selected_genre': str(params.get('genre', ALL_OPTION)),
+        'selected_language': str(params.get('language', ALL_OPTION)),
+        'regional_filter': region,
+        'revenue_range': revenue_range,
+    }
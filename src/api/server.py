@@ -0,0 +1,307 @@
+"""
+Headless JSON query service over the cleaned dataset
+
+A plain ASGI application: run it with the bundled launcher (needs uvicorn)
+or with any ASGI server.
+
+Usage:
+    python -m src.api.server [--host 127.0.0.1] [--port 8600] [--workers 4]
+    uvicorn src.api.server:create_app --factory --port 8600
+
+Endpoints (GET, JSON):
+    /health          Dataset version, row count and cache counters
+    /movies          Filtered rows, paged with offset and limit
+    /summary         Summary statistics of the filtered rows
+    /top-performers  Top n filtered movies by worldwide, domestic or foreign revenue
+    /genres          Genre analysis of the filtered rows
+    /yearly-trends   Yearly trends of the filtered rows
+
+Every endpoint but /health takes the sidebar filters as query parameters:
+year_min, year_max, genre, language (ISO code such as en), region (domestic,
+foreign or balanced) and revenue_min, revenue_max (in millions).
+"""
+import argparse
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+import numpy as np
+import pandas as pd
+
+from src.api.query import FILTER_PARAMS, QueryError, _number, encode, parse_filters
+from src.config.settings import API_CONFIG
+from src.data.processor import DataProcessor
+from src.data.result_cache import FilterResultCache
+
+logger = logging.getLogger(__name__)
+
+# endpoint -> query parameters it accepts besides the filters
+ENDPOINT_PARAMS = {
+    '/movies': ['offset', 'limit'],
+    '/summary': [],
+    '/top-performers': ['n', 'by'],
+    '/genres': [],
+    '/yearly-trends': [],
+}
+
+def parse_query(path: str, params: Dict[str, str], year_bounds: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Validate and normalize the query parameters of a request
+
+    Args:
+        path: Endpoint, a key of ENDPOINT_PARAMS
+        params: Raw query parameters
+        year_bounds: First and last year of the dataset, the default year range
+
+    Returns:
+        dict: 'filters' (apply_filters keyword arguments) plus the endpoint
+            specific parameters
+
+    Raises:
+        QueryError: On unknown parameters or invalid values
+    """
+    unknown = sorted(set(params) - set(FILTER_PARAMS) - set(ENDPOINT_PARAMS[path]))
+    if unknown:
+        raise QueryError(f"Unknown parameter(s) for {path}: {', '.join(unknown)}")
+
+    query = {'filters': parse_filters(params, year_bounds)}
+
+    if path == '/movies':
+        query['offset'] = max(0, _number(params, 'offset', int, 0))
+        query['limit'] = min(max(0, _number(params, 'limit', int, API_CONFIG['default_rows'])), API_CONFIG['max_rows'])
+    elif path == '/top-performers':
+        query['n'] = min(max(0, _number(params, 'n', int, 10)), API_CONFIG['max_rows'])
+        query['by'] = params.get('by', 'worldwide')
+        if query['by'] not in ('worldwide', 'domestic', 'foreign'):
+            raise QueryError("by must be worldwide, domestic or foreign")
+
+    return query
+
+def _cache_key(value: Any) -> Hashable:
+    """Turn a parsed query into a hashable cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _cache_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_cache_key(item) for item in value)
+    return value
+
+class QueryService:
+    """ASGI application answering JSON queries with the DataProcessor of one shared dataset"""
+
+    def __init__(self,
+                 processor: Optional[DataProcessor] = None,
+                 workers: Optional[int] = None,
+                 cache_entries: Optional[int] = None,
+                 cache_mb: Optional[float] = None):
+        """
+        Args:
+            processor: Processor loading the shared dataset, a default one if None
+            workers: Threads running the pandas work off the event loop
+            cache_entries: Maximum number of encoded responses kept
+            cache_mb: Maximum size of the kept responses
+        """
+        self.processor = processor or DataProcessor()
+        self.executor = ThreadPoolExecutor(max_workers=workers or API_CONFIG['workers'], thread_name_prefix='query')
+        self.responses = FilterResultCache(
+            max_entries=cache_entries or API_CONFIG['cache_entries'],
+            max_bytes=int((cache_mb or API_CONFIG['cache_mb']) * 1024 * 1024)
+        )
+
+        self.df: Optional[pd.DataFrame] = None
+        self.year_bounds: Tuple[int, int] = (0, 0)
+        self._loading: Optional[asyncio.Future] = None
+        # Cache key -> future of the response being computed, so concurrent
+        # identical requests share one computation
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def _load(self) -> Optional[pd.DataFrame]:
+        """Load the shared dataset and warm up its filter index and aggregation cube"""
+        df = self.processor.load_shared_data()
+        if df is None or df.empty:
+            return df
+
+        years = df['Year'].to_numpy()
+        self.year_bounds = (int(np.nanmin(years)), int(np.nanmax(years)))
+        self.processor.get_genre_analysis(self.processor.apply_filters(df, self.year_bounds))
+        return df
+
+    async def dataset(self) -> Optional[pd.DataFrame]:
+        """
+        Get the shared dataset, loading it on the worker pool on first use
+
+        Returns:
+            pd.DataFrame: Shared dataset or None if it could not be loaded
+        """
+        if self.df is None:
+            if self._loading is None:
+                self._loading = asyncio.get_running_loop().run_in_executor(self.executor, self._load)
+            loading = self._loading
+            try:
+                self.df = await asyncio.shield(loading)
+            except Exception:
+                logger.exception("Loading the dataset failed")
+            if self.df is None and self._loading is loading:
+                # Let the next request retry a failed load
+                self._loading = None
+        return self.df
+
+    def run_query(self, path: str, query: Dict[str, Any]) -> bytes:
+        """
+        Answer a parsed query; runs on the worker pool
+
+        Args:
+            path: Endpoint
+            query: Parsed query as returned by parse_query
+
+        Returns:
+            bytes: Encoded JSON response
+        """
+        filtered = self.processor.apply_filters(self.df, **query['filters'])
+
+        if path == '/movies':
+            start = query['offset']
+            data = {'total': len(filtered), 'offset': start,
+                    'rows': filtered.iloc[start:start + query['limit']]}
+        elif path == '/summary':
+            data = self.processor.get_summary_stats(filtered)
+        elif path == '/top-performers':
+            data = self.processor.get_top_performers(filtered, n=query['n'], by=query['by'])
+        elif path == '/genres':
+            data = self.processor.get_genre_analysis(filtered)
+        else:
+            data = self.processor.get_yearly_trends(filtered)
+
+        return encode({'dataset_version': self.processor.dataset_version, 'query': query, 'data': data})
+
+    async def respond(self, path: str, query: Dict[str, Any]) -> bytes:
+        """
+        Get the encoded response of a query from the cache or the worker pool
+
+        Args:
+            path: Endpoint
+            query: Parsed query
+
+        Returns:
+            bytes: Encoded JSON response
+        """
+        key = (self.processor.dataset_version, path, _cache_key(query))
+        body = self.responses.get(key, 'body')
+        if body is not None:
+            return body
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        pending = asyncio.get_running_loop().run_in_executor(self.executor, self.run_query, path, query)
+        self._pending[key] = pending
+        try:
+            body = await asyncio.shield(pending)
+        finally:
+            self._pending.pop(key, None)
+
+        self.responses.put(key, 'body', body)
+        return body
+
+    def health(self) -> bytes:
+        """Encode the dataset and cache state"""
+        return encode({
+            'status': 'ok',
+            'dataset_version': self.processor.dataset_version,
+            'rows': len(self.df),
+            'year_range': self.year_bounds,
+            'response_cache': self.responses.stats(),
+            'result_cache': self.processor.get_result_cache_stats(),
+        })
+
+    async def handle(self, method: str, path: str, query_string: bytes) -> Tuple[int, bytes]:
+        """
+        Answer one request
+
+        Args:
+            method: HTTP method
+            path: Request path
+            query_string: Raw query string
+
+        Returns:
+            tuple: (HTTP status, encoded JSON body)
+        """
+        path = path.rstrip('/') or '/'
+        if path != '/health' and path not in ENDPOINT_PARAMS:
+            return 404, encode({'error': f"Unknown endpoint {path}"})
+        if method not in ('GET', 'HEAD'):
+            return 405, encode({'error': f"{method} is not allowed, use GET"})
+
+        df = await self.dataset()
+        if df is None:
+            return 503, encode({'error': "Dataset could not be loaded"})
+        if path == '/health':
+            return 200, self.health()
+
+        try:
+            params = dict(parse_qsl(query_string.decode(), keep_blank_values=True))
+            query = parse_query(path, params, self.year_bounds)
+        except (QueryError, UnicodeDecodeError) as e:
+            return 400, encode({'error': str(e)})
+
+        try:
+            return 200, await self.respond(path, query)
+        except Exception as e:
+            logger.exception("Query %s failed", path)
+            return 500, encode({'error': str(e)})
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        """ASGI entry point"""
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        status, body = await self.handle(scope['method'], scope['path'], scope.get('query_string', b''))
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': b'' if scope['method'] == 'HEAD' else body})
+
+    async def _lifespan(self, receive, send) -> None:
+        """Load the dataset at startup and stop the worker pool at shutdown"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await self.dataset()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+def create_app() -> QueryService:
+    """Application factory for external ASGI servers (uvicorn src.api.server:create_app --factory)"""
+    return QueryService()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default=API_CONFIG['host'])
+    parser.add_argument('--port', type=int, default=API_CONFIG['port'])
+    parser.add_argument('--workers', type=int, default=API_CONFIG['workers'], help="Threads running the pandas work")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("The query API needs an ASGI server: pip install uvicorn "
+                         "(or serve src.api.server:create_app() with any other ASGI server)")
+
+    # Outside a Streamlit session the shared caches fall back to plain
+    # in-memory storage and warn about it on every use
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    uvicorn.run(QueryService(workers=args.workers), host=args.host, port=args.port)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from typing import Callable, Optional
+from src.config.settings import EXPLORER_CONFIG
+from src.data.fingerprint import frame_fingerprint
+
+def _group_thousands(text: pd.Series) -> pd.Series:
+    """Insert thousands separators into the integer part of formatted numbers"""
+    return text.str.replace(r'(\d)(?=(\d{3})+(?!\d))', r'\1,', regex=True)
+
+def format_column(values: pd.Series, column: str) -> pd.Series:
+    """
+    Format a numeric column for display, a whole column at a time
+
+    Revenue columns ('$' or 'revenue' in the name) become "$1,234M",
+    percentages "12.3%" and other numbers "1,234"; missing values "N/A".
+
+    Args:
+        values: Numeric values
+        column: Column name, which selects the format
+
+    Returns:
+        pd.Series: Formatted strings with the index of values
+    """
+    numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if '$' in column or 'revenue' in column.lower():
+        text = '$' + _group_thousands(pd.Series(np.char.mod('%.0f', numbers / 1_000_000))) + 'M'
+    elif '%' in column:
+        text = pd.Series(np.char.mod('%.1f', numbers)) + '%'
+    else:
+        text = _group_thousands(pd.Series(np.char.mod('%.0f', numbers)))
+
+    text = text.where(~np.isnan(numbers), "N/A")
+    text.index = values.index
+    return text
+
+def format_page(page: pd.DataFrame) -> pd.DataFrame:
+    """
+    Format the numeric columns of a page of rows for display
+
+    Args:
+        page: Rows to display
+
+    Returns:
+        pd.DataFrame: Copy of page with numeric columns as strings, except
+            EXPLORER_CONFIG['raw_columns']
+    """
+    formatted = page.copy()
+    for column in page.select_dtypes(include=[np.number]).columns:
+        if column not in EXPLORER_CONFIG['raw_columns']:
+            formatted[column] = format_column(page[column], column)
+    return formatted
+
+# Sort option keeping the ranking of the title search
+BEST_MATCH = "Best match"
+
+class DataExplorer:
+    """Paginated table of a frame that sorts raw values and formats only the visible page"""
+
+    def __init__(self,
+                 df: pd.DataFrame,
+                 key: str,
+                 search: Optional[Callable[[pd.DataFrame, str], Optional[np.ndarray]]] = None):
+        """
+        Args:
+            df: Frame to explore
+            key: Unique prefix of the widget keys; the sorted row order is
+                kept in session state under this prefix too
+            search: Function (df, query) returning ranked matching row
+                positions, such as DataProcessor.search_titles, or None to
+                fall back to scanning; defaults to scanning the titles
+        """
+        self.df = df
+        self.key = key
+        self.search = search
+
+    def matching_positions(self, search_term: str) -> np.ndarray:
+        """
+        Find the rows whose title matches the search term
+
+        Args:
+            search_term: Case-insensitive text to look for, empty for all rows
+
+        Returns:
+            np.ndarray: Positions of the matching rows, best matches first
+                when a search function is set
+        """
+        if not search_term:
+            return np.arange(len(self.df))
+
+        if self.search is not None:
+            positions = self.search(self.df, search_term)
+            if positions is not None:
+                return positions
+
+        titles = self.df[EXPLORER_CONFIG['search_column']]
+        mask = titles.str.contains(search_term, case=False, na=False, regex=False)
+        return np.flatnonzero(mask.to_numpy(dtype=bool))
+
+    def sorted_positions(self, search_term: str, sort_column: str, ascending: bool) -> np.ndarray:
+        """
+        Get the positions of the matching rows in display order
+
+        Rows are sorted on the raw column values, missing values last, or
+        kept in search rank order for BEST_MATCH. The
+        result is kept in session state, so paging through it does not sort
+        again; computing a new order goes back to the first page.
+
+        Args:
+            search_term: Title search text
+            sort_column: Column to sort by, or BEST_MATCH
+            ascending: Sort direction
+
+        Returns:
+            np.ndarray: Row positions into the explored frame
+        """
+        state_key = f"{self.key}_order"
+        order_key = (frame_fingerprint(self.df), search_term, sort_column, ascending)
+
+        cached = st.session_state.get(state_key)
+        if cached is not None and cached[0] == order_key:
+            return cached[1]
+
+        positions = self.matching_positions(search_term)
+        if sort_column != BEST_MATCH:
+            values = self.df[sort_column].take(positions).reset_index(drop=True)
+            order = values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+            positions = positions[order]
+
+        st.session_state[state_key] = (order_key, positions)
+        # A new search, sort or filter starts again from the first page
+        st.session_state[f"{self.key}_page"] = 1
+        return positions
+
+    def page(self, positions: np.ndarray, page_number: int, page_size: int) -> pd.DataFrame:
+        """
+        Take and format one page of rows
+
+        Args:
+            positions: Row positions in display order
+            page_number: 1-based page number
+            page_size: Rows per page
+
+        Returns:
+            pd.DataFrame: Formatted rows of the page
+        """
+        start = (page_number - 1) * page_size
+        return format_page(self.df.take(positions[start:start + page_size]))
+
+    def render(self, height: Optional[int] = 400) -> np.ndarray:
+        """
+        Render the search box, sort and paging controls and the current page
+
+        Args:
+            height: Table height in pixels
+
+        Returns:
+            np.ndarray: Positions of the matching rows in display order
+        """
+        search_term = st.text_input("🔍 Search movies:", placeholder="Enter movie title...", key=f"{self.key}_search")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            sort_options = list(self.df.columns) + ([BEST_MATCH] if self.search is not None else [])
+            sort_column = st.selectbox("Sort by:", sort_options, key=f"{self.key}_sort_column")
+        with col2:
+            sort_ascending = st.selectbox("Order:", ["Descending", "Ascending"], key=f"{self.key}_sort_order") == "Ascending"
+        with col3:
+            page_sizes = EXPLORER_CONFIG['page_sizes']
+            page_size = st.selectbox(
+                "Rows per page:", page_sizes,
+                index=page_sizes.index(EXPLORER_CONFIG['default_page_size']),
+                key=f"{self.key}_page_size"
+            )
+
+        positions = self.sorted_positions(search_term, sort_column, sort_ascending)
+        n_pages = max(1, -(-len(positions) // page_size))
+
+        st.markdown("### 📊 Data Table")
+
+        page_number = int(st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=f"{self.key}_page"))
+
+        st.dataframe(
+            self.page(positions, page_number, page_size),
+            use_container_width=True,
+            hide_index=True,
+            height=height
+        )
+
+        first = (page_number - 1) * page_size
+        st.caption(f"Rows {min(first + 1, len(positions)):,}–{min(first + page_size, len(positions)):,} "
+                   f"of {len(positions):,} · page {page_number:,} of {n_pages:,}")
+
+        return positions
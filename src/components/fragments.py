@@ -0,0 +1,26 @@
+import streamlit as st
+from typing import Callable, TypeVar
+from src.config.settings import AppConfig
+
+F = TypeVar('F', bound=Callable)
+
+def fragment(func: F) -> F:
+    """
+    Make a function rerun on its own when one of its widgets changes
+    
+    Widgets inside a fragment only rerun the fragment, not the whole script,
+    so data loading, filtering and the other charts are skipped. Uses
+    st.fragment (Streamlit 1.37+) or st.experimental_fragment (1.33+); on
+    older versions, or with AppConfig.PARTIAL_RERUNS off, the function is
+    returned unchanged and runs as part of every full rerun.
+    
+    Args:
+        func: Function rendering a self-contained component
+        
+    Returns:
+        Callable: Fragment version of func
+    """
+    decorator = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+    if decorator is None or not AppConfig.PARTIAL_RERUNS:
+        return func
+    return decorator(func)
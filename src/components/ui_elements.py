@@ -1,7 +1,27 @@
+import functools
+import hashlib
+import numpy as np
 import streamlit as st
 import pandas as pd
-from typing import List, Tuple, Optional, Dict, Any
-from src.config.settings import ALL_OPTION, REGIONAL_FILTERS, ANALYSIS_TYPES
+from typing import Callable, List, Tuple, Optional, Dict, Any
+from src.config.settings import ALL_OPTION, REGIONAL_FILTERS, ANALYSIS_TYPES, EXPORT_CONFIG, AppConfig
+from src.data.export import EXPORT_FORMATS, shared_export_cache
+from src.data.fingerprint import frame_fingerprint
+
+# format -> (icon, name)
+EXPORT_LABELS = {
+    'csv': ("📄", "CSV"),
+    'excel': ("📊", "Excel"),
+    'parquet': ("🗃️", "Parquet"),
+}
+
+def _supports_deferred_downloads() -> bool:
+    """Whether st.download_button accepts a callable that is only run on click"""
+    try:
+        from streamlit.runtime.media_file_manager import MediaFileManager
+    except ImportError:
+        return False
+    return hasattr(MediaFileManager, 'add_deferred')
 
 class UIComponents:
     """Class containing reusable UI components"""
@@ -122,6 +142,61 @@ class UIComponents:
             'analysis_type': analysis_type
         }
     
+    @staticmethod
+    def create_zoom_controls(df: pd.DataFrame, key: str) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        """
+        Create domestic/foreign revenue range controls for zooming scatter charts
+        
+        Large views are drawn as density grids; zooming into a small enough
+        region brings back the individual movies.
+        
+        Args:
+            df: Source dataframe
+            key: Unique widget key prefix
+            
+        Returns:
+            tuple: (domestic range, foreign range) in millions, None for an unzoomed axis
+        """
+        ranges = []
+        
+        with st.expander("🔍 Zoom into a revenue region"):
+            col1, col2 = st.columns(2)
+            
+            for col, column, label in [(col1, 'Domestic_Millions', "🏠 Domestic Revenue (M USD)"),
+                                       (col2, 'Foreign_Millions', "🌎 Foreign Revenue (M USD)")]:
+                low, high = float(df[column].min()), float(df[column].max())
+                if not low < high:
+                    ranges.append(None)
+                    continue
+                
+                with col:
+                    selected = st.slider(label, low, high, (low, high), key=f"{key}_{column}")
+                ranges.append(None if selected == (low, high) else selected)
+        
+        return ranges[0], ranges[1]
+    
+    @staticmethod
+    def create_view_tabs(views: Dict[str, Callable[[], None]], key: str) -> None:
+        """
+        Create tabbed views, rendering only the selected one when lazy loading is on
+        
+        st.tabs runs every tab body on each rerun. With AppConfig.LAZY_LOADING
+        the views are picked with a horizontal selector kept in session state
+        instead, and only the selected view's function is called.
+        
+        Args:
+            views: Tab label -> function rendering the tab body, in display order
+            key: Unique widget key of the selector
+        """
+        if not AppConfig.LAZY_LOADING:
+            for tab, render in zip(st.tabs(list(views)), views.values()):
+                with tab:
+                    render()
+            return
+        
+        selected = st.radio("View", list(views), horizontal=True, key=key, label_visibility="collapsed")
+        views[selected]()
+    
     @staticmethod
     def create_metrics_row(stats: Dict[str, Any]) -> None:
         """
@@ -249,6 +324,14 @@ class UIComponents:
         # Limit rows if needed
         display_df = df.head(max_rows) if len(df) > max_rows else df
         
+        # Widen float32 columns through their shortest decimal representation
+        # so values like 67.98 are not rendered as 67.980003
+        float32_columns = display_df.select_dtypes(include='float32').columns
+        if len(float32_columns):
+            display_df = display_df.astype({col: str for col in float32_columns}).astype(
+                {col: 'float64' for col in float32_columns}
+            )
+        
         st.dataframe(display_df, use_container_width=True)
         
         if len(df) > max_rows:
@@ -281,6 +364,66 @@ class UIComponents:
         
         return selected_movies
     
+    @staticmethod
+    def create_export_buttons(df: pd.DataFrame,
+                              key: str,
+                              positions: Optional[np.ndarray] = None,
+                              file_name: str = "movie_revenue_data",
+                              formats: Optional[List[str]] = None) -> None:
+        """
+        Create one download button per export format
+        
+        Nothing is exported while rendering: the file is written chunk by
+        chunk when a download is requested and kept on disk for the exported
+        rows, so downloading the same rows again only reads the file. On
+        Streamlit versions that cannot defer a download until it is clicked,
+        a "Prepare" button writes the file first.
+        
+        Files are keyed by frame_fingerprint, which covers every value of the
+        frame (or the dataset version and filters it was built from), plus the
+        exported positions, so a refreshed dataset never gets an old file.
+        
+        Args:
+            df: Dataframe to export
+            key: Unique prefix of the button keys
+            positions: Positions of the rows to export in file order, None for
+                all rows; the rows are taken a chunk at a time while writing
+            file_name: Download file name without extension
+            formats: Keys of EXPORT_FORMATS, defaults to EXPORT_CONFIG['formats']
+        """
+        if df.empty or (positions is not None and len(positions) == 0):
+            return
+        
+        cache = shared_export_cache()
+        export_key = frame_fingerprint(df)
+        if positions is not None:
+            digest = hashlib.blake2b(export_key.encode(), digest_size=16)
+            digest.update(np.ascontiguousarray(positions, dtype=np.int64).tobytes())
+            export_key = digest.hexdigest()
+        formats = formats or EXPORT_CONFIG['formats']
+        deferred = _supports_deferred_downloads()
+        
+        for column, fmt in zip(st.columns(len(formats)), formats):
+            extension, mime, _ = EXPORT_FORMATS[fmt]
+            icon, name = EXPORT_LABELS[fmt]
+            with column:
+                if deferred:
+                    data = functools.partial(cache.read, export_key, df, fmt, positions)
+                elif cache.get(export_key, fmt) is not None or st.button(
+                        f"Prepare {name}", key=f"{key}_prepare_{fmt}"):
+                    with st.spinner("Exporting..."):
+                        data = cache.read(export_key, df, fmt, positions)
+                else:
+                    continue
+                
+                st.download_button(
+                    f"{icon} Download as {name}",
+                    data,
+                    file_name=f"{file_name}.{extension}",
+                    mime=mime,
+                    key=f"{key}_download_{fmt}"
+                )
+    
     @staticmethod
     def create_download_button(df: pd.DataFrame, filename: str = "movie_data.csv") -> None:
         """
@@ -290,17 +433,7 @@ class UIComponents:
             df: Dataframe to download
             filename: Download filename
         """
-        if df.empty:
-            return
-        
-        csv = df.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Data as CSV",
-            data=csv,
-            file_name=filename,
-            mime="text/csv",
-            help="Download the current filtered data"
-        )
+        UIComponents.create_export_buttons(df, "download", file_name=filename.rsplit('.', 1)[0], formats=['csv'])
     
     @staticmethod
     def create_filter_summary(filters: Dict[str, Any]) -> None:
@@ -335,6 +468,29 @@ class UIComponents:
         else:
             st.caption("🔍 No filters applied - showing all data")
     
+    @staticmethod
+    def create_memory_report(report: pd.DataFrame) -> None:
+        """
+        Create a sidebar panel with the memory saved by the compact dataset schema
+        
+        Args:
+            report: Per-column report from DataProcessor.get_memory_report
+        """
+        used = report['Bytes'].sum()
+        baseline = report['Baseline_Bytes'].sum()
+        saved = baseline - used
+        
+        with st.sidebar.expander("💾 Dataset Memory"):
+            st.caption(
+                f"{used / 1_048_576:,.1f} MB in memory, {saved / 1_048_576:,.1f} MB "
+                f"({saved / baseline:.0%}) less than with inferred dtypes"
+            )
+            table = report[['Column', 'Dtype']].assign(
+                MB=report['Bytes'] / 1_048_576,
+                Saved_MB=report['Saved_Bytes'] / 1_048_576
+            )
+            st.dataframe(table.round(2), hide_index=True, use_container_width=True)
+    
     @staticmethod
     def create_loading_placeholder() -> None:
         """Create loading placeholder"""
@@ -17,6 +17,11 @@ def configure_page():
 # ==============================================================================
 FINANCIAL_COLUMNS = ['$Worldwide', '$Domestic', '$Foreign', 'Domestic %', 'Foreign %']
 NUMERIC_COLUMNS = ['Year', 'Vote_Count']
+RANK_COLUMNS = {
+    'Revenue_Rank': '$Worldwide',
+    'Domestic_Rank': '$Domestic',
+    'Foreign_Rank': '$Foreign'
+}
 ANALYSIS_TYPES = [
     "Regional Comparison", 
     "Revenue Performance", 
@@ -25,6 +30,118 @@ ANALYSIS_TYPES = [
     "🎨 Advanced Visualizations"
 ]
 
+# ==============================================================================
+# DATASET SCHEMA
+# ==============================================================================
+# Text columns parsed by read_csv straight into compact dtypes
+SOURCE_SCHEMA = {
+    'Release Group': 'string[pyarrow]',
+    'Genres': 'category',
+    'Rating': 'category',
+    'Original_Language': 'category',
+    'Production_Countries': 'category'
+}
+
+# Final dtypes of the cleaned frame, applied once numeric coercion and
+# derived columns are done. Every column that is averaged or summed for
+# display stays float64 so results match the source to the last decimal;
+# only counts and figures that are never aggregated use float32.
+DATASET_SCHEMA = {
+    'Rank': 'int32',
+    '$Worldwide': 'float64',
+    '$Domestic': 'float64',
+    '$Foreign': 'float64',
+    'Domestic %': 'float64',
+    'Foreign %': 'float64',
+    'Year': 'int16',
+    'Vote_Count': 'float32',
+    'Rating_Score': 'float64',
+    'Primary_Genre': 'category',
+    'Worldwide_Millions': 'float64',
+    'Domestic_Millions': 'float64',
+    'Foreign_Millions': 'float64',
+    'Decade': 'int16',
+    'Domestic_Foreign_Ratio': 'float32'
+}
+
+# ==============================================================================
+# DATA CACHE CONFIGURATION
+# ==============================================================================
+DATA_CACHE_CONFIG = {
+    'enabled': True,
+    'directory': '.cache',
+    'hash_sample_bytes': 1_048_576,  # Bytes hashed from the head and tail of the source file
+    'format_version': 7,  # Bump whenever the cleaning logic changes the cached frame
+    'shared_versions': 2,  # Dataset versions kept mapped, with their indexes, per process
+    'incremental_max_changed_fraction': 0.25  # Rebuild in full above this share of changed rows
+}
+
+# Sources at or above threshold_mb are cleaned chunk by chunk
+STREAMING_CONFIG = {
+    'threshold_mb': 512,
+    'memory_budget_mb': 256,
+    'sample_rows': 10_000,  # Rows cleaned up front to estimate the chunk size
+    'overhead_factor': 4,  # Peak memory as a multiple of the raw plus cleaned chunk
+    'min_chunk_rows': 1_000
+}
+
+# Per-process LRU cache of filtered row positions and their derived results
+RESULT_CACHE_CONFIG = {
+    'max_entries': 64,
+    'max_mb': 64
+}
+
+# Dimensions and measures of the pre-aggregated cube (Year and the regional
+# flags are always dimensions)
+CUBE_CONFIG = {
+    'categorical_dimensions': ['Primary_Genre', 'Original_Language', 'Performance_Category'],
+    'measures': ['Worldwide_Millions', 'Domestic_Millions', 'Foreign_Millions', 'Domestic %', 'Foreign %', 'Rating_Score']
+}
+
+# Title search index; a query word of at least min_length characters may be
+# that many edits away from a title word
+SEARCH_CONFIG = {
+    'column': 'Release Group',
+    'max_edits': [(4, 1), (8, 2)],  # (min_length, edits)
+    'fuzzy_candidates': 50  # Words per query word checked for edit distance
+}
+
+# Export files (CSV, Excel, Parquet) are written chunk by chunk on request and
+# kept on disk, keyed by the exported rows, until evicted least recently used
+EXPORT_CONFIG = {
+    'directory': '.cache/exports',
+    'format_version': 2,  # Bump whenever the writers or the export keys change
+    'chunk_rows': 50_000,
+    'max_files': 32,
+    'max_mb': 512,
+    'formats': ['csv', 'excel', 'parquet']
+}
+
+# ==============================================================================
+# QUERY API
+# ==============================================================================
+# Headless JSON service over the shared dataset (python -m src.api.server)
+API_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8600,
+    'workers': 4,  # Threads running the pandas work
+    'cache_entries': 1024,  # Encoded responses kept per process
+    'cache_mb': 64,
+    'default_rows': 100,  # Rows per page of /movies
+    'max_rows': 1000
+}
+
+# ==============================================================================
+# BATCH REPORTS
+# ==============================================================================
+# Report generator (python -m src.reports.batch); processes None uses every core
+REPORT_CONFIG = {
+    'output_dir': 'reports',
+    'processes': None,
+    'top_n': 10,
+    'formats': ['json', 'html']
+}
+
 # ==============================================================================
 # UI CONSTANTS
 # ==============================================================================
@@ -33,6 +150,14 @@ DEFAULT_TOP_N = 15
 MIN_TOP_N = 5
 MAX_TOP_N = 50
 
+# Data explorer paging; raw_columns are numeric columns shown unformatted
+EXPLORER_CONFIG = {
+    'page_sizes': [25, 50, 100, 250],
+    'default_page_size': 50,
+    'search_column': 'Release Group',
+    'raw_columns': ['Rank', 'Year', 'Vote_Count']
+}
+
 # ==============================================================================
 # COLOR SCHEME (Dark Mode)
 # ==============================================================================
@@ -99,6 +224,39 @@ CHART_CONFIG = {
     'color_sequence': ['#4facfe', '#00f2fe', '#43e97b', '#f093fb', '#ff6b6b', '#4ecdc4']
 }
 
+# Per-process cache of serialized figures, keyed by a fingerprint of the
+# chart's input rows plus its parameters
+FIGURE_CACHE_CONFIG = {
+    'enabled': True,
+    'max_entries': 128,
+    'max_mb': 128
+}
+
+# Scatter charts switch to WebGL traces above webgl_threshold points and to a
+# server-side density grid above their density threshold. Charts with more
+# points than their cap show the top rows by rank_by.
+RENDER_CONFIG = {
+    'mode': 'auto',  # 'auto', 'svg', 'webgl' or 'density'
+    'webgl_threshold': 1_000,
+    'density_threshold': 50_000,
+    'density_threshold_3d': 20_000,
+    'density_bins': 200,  # Cells per axis of the 2D density grid
+    'density_bins_3d': 40,  # Cells per revenue axis of the 3D grid (one per year on the third)
+    'max_points': 200_000,
+    'max_points_3d': 20_000,
+    'rank_by': 'Worldwide_Millions'
+}
+
+# Line traces longer than the chart is wide are decimated before plotting
+DOWNSAMPLING_CONFIG = {
+    'enabled': True,
+    'line_method': 'lttb',  # 'lttb' or 'minmax'
+    'bar_method': 'minmax',
+    'target_width_px': 1200,  # Plot width the series is reduced for
+    'points_per_pixel': 1,
+    'min_points': 10_000  # Shorter series are plotted as they are: reducing them costs about what it saves
+}
+
 # ==============================================================================
 # FILTERS CONFIGURATION
 # ==============================================================================
@@ -109,6 +267,13 @@ REGIONAL_FILTERS = [
     "Balanced Performance"
 ]
 
+# Boolean indicator column behind each regional filter option
+REGIONAL_FILTER_COLUMNS = {
+    "Domestic Dominance (>50%)": 'Domestic_Dominance',
+    "Foreign Dominance (>50%)": 'Foreign_Dominance',
+    "Balanced Performance": 'Regional_Balance'
+}
+
 PERFORMANCE_CATEGORIES = [
     'Low (<$100M)', 
     'Medium ($100M-$500M)', 
@@ -142,6 +307,7 @@ class AppConfig:
     
     # Performance Settings
     LAZY_LOADING = True
+    PARTIAL_RERUNS = True  # Rerun local widgets as fragments where supported
     OPTIMIZE_CHARTS = True
     CACHE_DATA = True
 
@@ -0,0 +1,252 @@
+import glob
+import hashlib
+import os
+from typing import Optional, Set, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from src.config.settings import DATA_CACHE_CONFIG
+
+class DatasetCache:
+    """Persistent Arrow IPC cache of the cleaned dataset, keyed by its source file"""
+
+    def __init__(self, source_path: str, cache_dir: Optional[str] = None):
+        self.source_path = source_path
+        self.cache_dir = cache_dir or DATA_CACHE_CONFIG['directory']
+
+        # Prefix cache files with the source name plus a digest of its absolute
+        # path so that equally named sources in different folders never collide
+        base_name = os.path.splitext(os.path.basename(source_path))[0]
+        path_digest = hashlib.blake2b(os.path.abspath(source_path).encode(), digest_size=4).hexdigest()
+        self.prefix = f"{base_name}-{path_digest}"
+
+    def fingerprint(self) -> str:
+        """
+        Compute the cache key of the current source file
+
+        The key combines the cache format version, the file size and
+        modification time, and a hash of the first and last blocks of the file,
+        so it stays cheap to compute even for multi-GB sources.
+
+        Returns:
+            str: Hex digest identifying the source file contents
+        """
+        stat = os.stat(self.source_path)
+        sample_bytes = DATA_CACHE_CONFIG['hash_sample_bytes']
+
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"{DATA_CACHE_CONFIG['format_version']}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+        with open(self.source_path, 'rb') as source:
+            digest.update(source.read(sample_bytes))
+            if stat.st_size > sample_bytes:
+                source.seek(max(sample_bytes, stat.st_size - sample_bytes))
+                digest.update(source.read(sample_bytes))
+
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> str:
+        """
+        Get the cache file path for a given key
+
+        Args:
+            key: Cache key as returned by fingerprint()
+
+        Returns:
+            str: Path of the Arrow IPC cache file
+        """
+        return os.path.join(self.cache_dir, f"{self.prefix}-{key}.arrow")
+
+    def current_path(self) -> str:
+        """
+        Get the cache file path for the current version of the source file
+
+        Returns:
+            str: Path of the Arrow IPC cache file (which may not exist yet)
+        """
+        return self.path_for(self.fingerprint())
+
+    def load(self, memory_map: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Load the cached frame for the current source file
+
+        Args:
+            memory_map: Map the cache file read-only instead of reading it into memory
+
+        Returns:
+            pd.DataFrame: Cached cleaned dataset or None on a cache miss
+        """
+        path = self.current_path()
+
+        if not os.path.exists(path):
+            return None
+
+        return self.read_file(path, memory_map)
+
+    @staticmethod
+    def read_file(path: str, memory_map: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Read an Arrow IPC cache file into a DataFrame
+
+        With memory_map enabled the numeric and string columns of the returned
+        frame are read-only views over the mapped file, so every process that
+        maps the same file shares one copy of the data through the OS page cache.
+
+        Args:
+            path: Path of the cache file
+            memory_map: Map the file instead of reading it into memory
+
+        Returns:
+            pd.DataFrame: Cached dataset or None if the file cannot be read
+        """
+        try:
+            if memory_map:
+                table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+                # One block per column keeps pandas from consolidating (copying)
+                # the zero-copy column buffers into 2D blocks
+                return table.to_pandas(split_blocks=True)
+
+            with pa.OSFile(path, 'rb') as source:
+                table = ipc.open_file(source).read_all()
+            return table.to_pandas()
+        except (OSError, pa.ArrowInvalid):
+            # A truncated or corrupt cache file is treated as a miss
+            return None
+
+    @staticmethod
+    def row_index_path(path: str) -> str:
+        """
+        Get the path of the row index stored next to a cache file
+
+        Args:
+            path: Path of the cache file
+
+        Returns:
+            str: Path of the row index file
+        """
+        return f"{path[:-len('.arrow')]}.rows.arrow"
+
+    def latest_entry(self) -> Optional[Tuple[str, str]]:
+        """
+        Find the most recent cache entry of an earlier version of the source file
+
+        Only entries that have a row index are returned, since they are the
+        ones that can be updated incrementally.
+
+        Returns:
+            tuple: (cache file path, row index path) or None if there is no such entry
+        """
+        current = self.current_path()
+        entries = [
+            path for path in glob.glob(os.path.join(self.cache_dir, f"{self.prefix}-*.arrow"))
+            if path != current and not path.endswith('.rows.arrow')
+            and os.path.exists(self.row_index_path(path))
+        ]
+
+        if not entries:
+            return None
+
+        latest = max(entries, key=os.path.getmtime)
+        return latest, self.row_index_path(latest)
+
+    def save(self, df: pd.DataFrame, row_index: Optional[pd.DataFrame] = None) -> Optional[str]:
+        """
+        Write the cleaned frame to the cache and drop stale entries
+
+        Args:
+            df: Cleaned dataset
+            row_index: Optional per-source-row key and content hashes, used by
+                incremental updates to detect changed rows
+
+        Returns:
+            str: Path of the written cache file or None if it could not be written
+        """
+        temp_path = f"{self.current_path()}.{os.getpid()}.tmp"
+        rows_temp_path = f"{temp_path}.rows"
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write(df, temp_path)
+
+            if row_index is not None:
+                self._write(row_index, rows_temp_path)
+                os.replace(rows_temp_path, self.row_index_path(self.current_path()))
+
+            return self.publish(temp_path)
+        except (OSError, pa.ArrowException):
+            for path in (temp_path, rows_temp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            return None
+
+    def _write(self, df: pd.DataFrame, path: str) -> None:
+        """
+        Write a frame to an Arrow IPC file
+
+        Args:
+            df: Frame to write
+            path: Destination path
+        """
+        table = self.to_table(df)
+
+        with pa.OSFile(path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    def publish(self, temp_path: str) -> str:
+        """
+        Move a fully written cache file into place and drop stale entries
+
+        Args:
+            temp_path: Path of the finished temporary file
+
+        Returns:
+            str: Path of the published cache file
+        """
+        path = self.current_path()
+
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(temp_path, path)
+
+        self._remove_stale(keep={path, self.row_index_path(path)})
+        return path
+
+    @staticmethod
+    def to_table(df: pd.DataFrame) -> pa.Table:
+        """
+        Convert a frame to an Arrow table suitable for zero-copy reads
+
+        pyarrow turns NaN into nulls by default, and columns with nulls have to
+        be copied when converted back to NumPy. Float columns are therefore
+        stored with their NaN values intact.
+
+        Args:
+            df: Frame to convert
+
+        Returns:
+            pa.Table: Arrow table including the pandas index and metadata
+        """
+        table = pa.Table.from_pandas(df, preserve_index=True)
+
+        for i, field in enumerate(table.schema):
+            if pa.types.is_floating(field.type) and table.column(i).null_count and field.name in df.columns:
+                values = df[field.name].to_numpy()
+                table = table.set_column(i, field, pa.array(values, type=field.type, from_pandas=False))
+
+        return table
+
+    def _remove_stale(self, keep: Set[str]) -> None:
+        """
+        Remove cache files of earlier versions of the source file
+
+        Args:
+            keep: Paths of the current cache file and its row index
+        """
+        for stale_path in glob.glob(os.path.join(self.cache_dir, f"{self.prefix}-*.arrow")):
+            if stale_path not in keep:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
@@ -0,0 +1,225 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple, Union
+from src.config.settings import ALL_OPTION, REGIONAL_FILTER_COLUMNS, CUBE_CONFIG
+
+AggSpec = Dict[str, Union[str, List[str]]]
+
+class AggregationCube:
+    """
+    Pre-aggregated count, sum and sum of squares of the numeric measures per
+    Year x Primary_Genre x Original_Language x regional flags x
+    Performance_Category cell
+
+    Aggregates for any combination of the year, genre, language and regional
+    filters are rolled up from the non-empty cells instead of scanning rows.
+    """
+
+    SUPPORTED_FUNCTIONS = {'count', 'sum', 'mean', 'std'}
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the cube for a dataset
+
+        Args:
+            df: Cleaned dataset
+        """
+        self.measures = [col for col in CUBE_CONFIG['measures'] if col in df.columns]
+
+        # Integer codes and labels of every dimension
+        years, year_codes = np.unique(df['Year'].to_numpy(), return_inverse=True)
+        self.years = years
+
+        self.categoricals = {}
+        codes = [year_codes]
+        for col in CUBE_CONFIG['categorical_dimensions']:
+            values = df[col]
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = values.astype('category')
+            self.categoricals[col] = values.dtype
+            # Missing values get their own code after the categories
+            col_codes = values.cat.codes.to_numpy().astype(np.int64)
+            col_codes[col_codes < 0] = len(values.dtype.categories)
+            codes.append(col_codes)
+
+        # Regional flags packed into one code, one bit per filter option
+        self.region_bits = {label: 1 << i for i, label in enumerate(REGIONAL_FILTER_COLUMNS)}
+        region_codes = np.zeros(len(df), dtype=np.int64)
+        for label, col in REGIONAL_FILTER_COLUMNS.items():
+            region_codes |= df[col].to_numpy(dtype=bool, na_value=False).astype(np.int64) * self.region_bits[label]
+        codes.append(region_codes)
+
+        self.dimensions = ['Year'] + list(self.categoricals) + ['Region']
+        self.shape = (
+            (len(years),)
+            + tuple(len(dtype.categories) + 1 for dtype in self.categoricals.values())
+            + (1 << len(REGIONAL_FILTER_COLUMNS),)
+        )
+
+        # Collapse rows into the non-empty cells
+        cell_ids, row_cells = np.unique(np.ravel_multi_index(codes, self.shape), return_inverse=True)
+        self.cell_codes = dict(zip(self.dimensions, np.unravel_index(cell_ids, self.shape)))
+        self.n_cells = len(cell_ids)
+        self.rows = np.bincount(row_cells, minlength=self.n_cells)
+
+        self.counts = {}
+        self.sums = {}
+        self.sumsqs = {}
+        for col in self.measures:
+            values = df[col].to_numpy(dtype=np.float64)
+            present = ~np.isnan(values)
+            values = np.where(present, values, 0.0)
+            self.counts[col] = np.bincount(row_cells, weights=present, minlength=self.n_cells)
+            self.sums[col] = np.bincount(row_cells, weights=values, minlength=self.n_cells)
+            self.sumsqs[col] = np.bincount(row_cells, weights=values * values, minlength=self.n_cells)
+
+    def supports(self, by: List[str], spec: AggSpec) -> bool:
+        """
+        Check whether an aggregation can be answered from the cube
+
+        Args:
+            by: Grouping columns
+            spec: Aggregation spec in DataFrame.agg dict form
+
+        Returns:
+            bool: True if every grouping column and function is covered
+        """
+        if not all(col in self.cell_codes or col == 'Decade' for col in by) or 'Region' in by:
+            return False
+
+        for col, functions in spec.items():
+            functions = [functions] if isinstance(functions, str) else functions
+            if not all(isinstance(func, str) and func in self.SUPPORTED_FUNCTIONS for func in functions):
+                return False
+            # Columns that are not measures can only be counted (as rows)
+            if col not in self.measures and set(functions) != {'count'}:
+                return False
+
+        return True
+
+    def aggregate(self,
+                  by: List[str],
+                  spec: AggSpec,
+                  year_range: Optional[Tuple[int, int]] = None,
+                  selected_genre: str = ALL_OPTION,
+                  selected_language: str = ALL_OPTION,
+                  regional_filter: str = ALL_OPTION) -> pd.DataFrame:
+        """
+        Roll up the cells matching a filter combination
+
+        The result has the same shape as df.groupby(by, observed=True).agg(spec)
+        on the filtered rows and the same values up to floating-point rounding:
+        sums are added per cell first, so a mean may differ in its last bits
+        and a rounded mean can fall on the other side of a tie. Counts of
+        columns that are not measures are the row counts of the groups.
+
+        Args:
+            by: Grouping columns (dimensions, or 'Decade')
+            spec: Aggregation spec with count, sum, mean and std functions
+            year_range: Tuple of (min_year, max_year)
+            selected_genre: Selected genre filter
+            selected_language: Selected language filter
+            regional_filter: Regional performance filter
+
+        Returns:
+            pd.DataFrame: Aggregates indexed by the grouping columns
+        """
+        cells = np.flatnonzero(self._cell_mask(year_range, selected_genre, selected_language, regional_filter))
+
+        # Missing categorical values are dropped from groupings, as groupby does
+        for col in by:
+            if col in self.categoricals:
+                cells = cells[self.cell_codes[col][cells] < len(self.categoricals[col].categories)]
+
+        keys = np.stack([self._group_key(col, cells).astype(np.int64) for col in by])
+        group_ids, groups = np.unique(keys, axis=1, return_inverse=True)
+        groups = groups.ravel()
+        n_groups = group_ids.shape[1]
+
+        def rollup(values: np.ndarray) -> np.ndarray:
+            return np.bincount(groups, weights=values[cells], minlength=n_groups)
+
+        columns = {}
+        flat = all(isinstance(functions, str) for functions in spec.values())
+        for col, functions in spec.items():
+            for func in [functions] if isinstance(functions, str) else functions:
+                if col not in self.measures:
+                    result = rollup(self.rows).astype(np.int64)
+                elif func == 'count':
+                    result = rollup(self.counts[col]).astype(np.int64)
+                else:
+                    result = self._statistic(func, rollup(self.counts[col]), rollup(self.sums[col]), rollup(self.sumsqs[col]))
+                columns[col if flat else (col, func)] = result
+
+        result = pd.DataFrame(columns, index=self._group_index(by, group_ids))
+        if not flat:
+            result.columns = pd.MultiIndex.from_tuples(result.columns)
+        return result
+
+    def _cell_mask(self, year_range, selected_genre, selected_language, regional_filter) -> np.ndarray:
+        """
+        Select the cells matching a filter combination, with the semantics of
+        DataProcessor.apply_filters
+
+        Returns:
+            np.ndarray: Boolean mask over the cells
+        """
+        mask = np.ones(self.n_cells, dtype=bool)
+
+        if year_range is not None:
+            years = self.years[self.cell_codes['Year']]
+            mask &= (years >= year_range[0]) & (years <= year_range[1])
+
+        for col, selected in [('Primary_Genre', selected_genre), ('Original_Language', selected_language)]:
+            if selected != ALL_OPTION:
+                categories = self.categoricals[col].categories
+                code = categories.get_loc(selected) if selected in categories else -1
+                mask &= self.cell_codes[col] == code
+
+        if regional_filter in self.region_bits:
+            mask &= (self.cell_codes['Region'] & self.region_bits[regional_filter]) != 0
+
+        return mask
+
+    def _group_key(self, col: str, cells: np.ndarray) -> np.ndarray:
+        """Get the integer grouping key of the selected cells"""
+        if col == 'Decade':
+            return (self.years[self.cell_codes['Year'][cells]] // 10) * 10
+        if col == 'Year':
+            return self.years[self.cell_codes['Year'][cells]]
+        return self.cell_codes[col][cells]
+
+    def _group_index(self, by: List[str], group_ids: np.ndarray) -> pd.Index:
+        """Build the result index from the sorted group keys"""
+        levels = []
+        for col, keys in zip(by, group_ids):
+            if col in self.categoricals:
+                levels.append(pd.CategoricalIndex(pd.Categorical.from_codes(keys, dtype=self.categoricals[col]), name=col))
+            else:
+                levels.append(pd.Index(keys.astype(self.years.dtype), name=col))
+
+        if len(levels) == 1:
+            return levels[0]
+        return pd.MultiIndex.from_arrays(levels)
+
+    @staticmethod
+    def _statistic(func: str, counts: np.ndarray, sums: np.ndarray, sumsqs: np.ndarray) -> np.ndarray:
+        """
+        Derive a statistic from rolled-up count, sum and sum of squares
+
+        Args:
+            func: 'sum', 'mean' or 'std' (sample standard deviation)
+
+        Returns:
+            np.ndarray: Statistic per group (NaN where undefined)
+        """
+        if func == 'sum':
+            return sums
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+            if func == 'mean':
+                return means
+
+            variances = (sumsqs - sums * means) / (counts - 1)
+            return np.where(counts > 1, np.sqrt(np.maximum(variances, 0.0)), np.nan)
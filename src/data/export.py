@@ -0,0 +1,279 @@
+import glob
+import os
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+from openpyxl import Workbook
+
+from src.config.settings import EXPORT_CONFIG
+
+# Rows per worksheet, the header row excluded (Excel's limit is 1,048,576)
+EXCEL_MAX_ROWS = 1_048_575
+EXCEL_SHEET_NAME = 'Movie Revenue Data'
+
+def _chunks(df: pd.DataFrame, chunk_rows: int, positions: Optional[np.ndarray] = None):
+    """Yield the exported rows in consecutive chunks of at most chunk_rows rows"""
+    if positions is None:
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+    else:
+        for start in range(0, len(positions), chunk_rows):
+            yield df.take(positions[start:start + chunk_rows])
+
+def write_csv(df: pd.DataFrame, path: str, chunk_rows: int, positions: Optional[np.ndarray] = None) -> None:
+    """
+    Write rows of a frame to a CSV file chunk by chunk
+
+    Produces the same file as df.take(positions).to_csv(path, index=False).
+
+    Args:
+        df: Frame to export
+        path: Destination path
+        chunk_rows: Rows converted to text at a time
+        positions: Positions of the rows to export in file order, None for all rows
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as target:
+        df.iloc[:0].to_csv(target, index=False)
+        for chunk in _chunks(df, chunk_rows, positions):
+            chunk.to_csv(target, header=False, index=False)
+
+def _excel_rows(chunk: pd.DataFrame):
+    """Rows of a chunk as tuples of plain values, missing values as empty cells"""
+    values = chunk.astype(object)
+    return values.where(chunk.notna(), None).itertuples(index=False, name=None)
+
+def write_excel(df: pd.DataFrame, path: str, chunk_rows: int, positions: Optional[np.ndarray] = None) -> None:
+    """
+    Write rows of a frame to an .xlsx workbook chunk by chunk
+
+    Uses the write-only mode of openpyxl, which streams rows to disk instead
+    of keeping every cell in memory. Frames longer than an Excel worksheet
+    continue on numbered extra sheets, each with the header row.
+
+    Args:
+        df: Frame to export
+        path: Destination path
+        chunk_rows: Rows converted at a time
+        positions: Positions of the rows to export in file order, None for all rows
+    """
+    if positions is None:
+        positions = np.arange(len(df))
+
+    workbook = Workbook(write_only=True)
+    header = [str(column) for column in df.columns]
+
+    for start in range(0, max(len(positions), 1), EXCEL_MAX_ROWS):
+        number = start // EXCEL_MAX_ROWS + 1
+        sheet = workbook.create_sheet(EXCEL_SHEET_NAME if number == 1 else f"{EXCEL_SHEET_NAME} ({number})")
+        sheet.append(header)
+
+        for chunk in _chunks(df, chunk_rows, positions[start:start + EXCEL_MAX_ROWS]):
+            for row in _excel_rows(chunk):
+                sheet.append(row)
+
+    workbook.save(path)
+
+def write_parquet(df: pd.DataFrame, path: str, chunk_rows: int, positions: Optional[np.ndarray] = None) -> None:
+    """
+    Write rows of a frame to a Parquet file, one row group per chunk
+
+    Args:
+        df: Frame to export
+        path: Destination path
+        chunk_rows: Rows converted to Arrow at a time
+        positions: Positions of the rows to export in file order, None for all rows
+    """
+    schema = pa.Schema.from_pandas(df.iloc[:0], preserve_index=False)
+
+    with pq.ParquetWriter(path, schema) as writer:
+        if (len(df) if positions is None else len(positions)) == 0:
+            writer.write_table(pa.Table.from_pandas(df.iloc[:0], schema=schema, preserve_index=False))
+        for chunk in _chunks(df, chunk_rows, positions):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+# format -> (file extension, MIME type, writer)
+EXPORT_FORMATS: Dict[str, Tuple[str, str, Callable[..., None]]] = {
+    'csv': ('csv', 'text/csv', write_csv),
+    'excel': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', write_excel),
+    'parquet': ('parquet', 'application/vnd.apache.parquet', write_parquet),
+}
+
+class ExportCache:
+    """Directory of finished export files, keyed by the exported rows and format, bounded by count and size"""
+
+    def __init__(self,
+                 directory: Optional[str] = None,
+                 max_files: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Folder holding the export files
+            max_files: Maximum number of files kept
+            max_bytes: Maximum total size of the kept files
+        """
+        self.directory = directory or EXPORT_CONFIG['directory']
+        self.max_files = max_files or EXPORT_CONFIG['max_files']
+        self.max_bytes = max_bytes or EXPORT_CONFIG['max_mb'] * 1024 * 1024
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str, fmt: str) -> str:
+        """
+        Get the export file path for a key and format
+
+        Args:
+            key: Identifier of the exported rows, such as frame_fingerprint(df)
+            fmt: Export format, a key of EXPORT_FORMATS
+
+        Returns:
+            str: Path of the export file (which may not exist yet)
+        """
+        extension = EXPORT_FORMATS[fmt][0]
+        return os.path.join(self.directory, f"export-v{EXPORT_CONFIG['format_version']}-{key}.{extension}")
+
+    def get(self, key: str, fmt: str) -> Optional[str]:
+        """
+        Look up a finished export file and mark it as recently used
+
+        Args:
+            key: Identifier of the exported rows
+            fmt: Export format
+
+        Returns:
+            str: Path of the export file or None if it has not been written
+        """
+        path = self.path_for(key, fmt)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def get_or_create(self, key: str, df: pd.DataFrame, fmt: str, positions: Optional[np.ndarray] = None) -> str:
+        """
+        Get the export file of rows of a frame, writing it first on a miss
+
+        The file is written chunk by chunk next to its final path and moved
+        into place once complete, so concurrent sessions never read a
+        partial file.
+
+        Args:
+            key: Identifier of the exported rows
+            df: Frame to export
+            fmt: Export format
+            positions: Positions of the rows to export in file order, None for all rows
+
+        Returns:
+            str: Path of the export file
+        """
+        path = self.get(key, fmt)
+        if path is not None:
+            with self._lock:
+                self.hits += 1
+            return path
+
+        with self._lock:
+            self.misses += 1
+
+        path = self.path_for(key, fmt)
+        temp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        writer = EXPORT_FORMATS[fmt][2]
+
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            writer(df, temp_path, EXPORT_CONFIG['chunk_rows'], positions)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self._evict(keep=path)
+        return path
+
+    def read(self, key: str, df: pd.DataFrame, fmt: str, positions: Optional[np.ndarray] = None) -> bytes:
+        """
+        Get the contents of the export file of rows of a frame, writing it first on a miss
+
+        Args:
+            key: Identifier of the exported rows
+            df: Frame to export
+            fmt: Export format
+            positions: Positions of the rows to export in file order, None for all rows
+
+        Returns:
+            bytes: File contents
+        """
+        with open(self.get_or_create(key, df, fmt, positions), 'rb') as source:
+            return source.read()
+
+    def _files(self):
+        """Finished export files as (path, size, last use), least recently used first"""
+        files = []
+        for path in glob.glob(os.path.join(self.directory, 'export-*')):
+            if path.endswith('.tmp'):
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((path, stat.st_size, stat.st_mtime_ns))
+        return sorted(files, key=lambda item: item[2])
+
+    def _evict(self, keep: str) -> None:
+        """
+        Remove the least recently used files beyond the count and size limits
+
+        Args:
+            keep: Path of the file just written, which is never removed
+        """
+        files = self._files()
+        total_bytes = sum(size for _, size, _ in files)
+
+        for path, size, _ in files:
+            if len(files) <= self.max_files and total_bytes <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            files = [item for item in files if item[0] != path]
+            total_bytes -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Hits, misses, evictions, file count and total size in bytes
+        """
+        files = self._files()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'files': len(files),
+            'bytes': sum(size for _, size, _ in files),
+        }
+
+@st.cache_resource(show_spinner=False)
+def shared_export_cache() -> ExportCache:
+    """
+    Get the export cache shared by all sessions of the process
+
+    Returns:
+        ExportCache: Process-wide export cache
+    """
+    return ExportCache()
@@ -0,0 +1,174 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+from src.config.settings import ALL_OPTION, REGIONAL_FILTER_COLUMNS
+
+class FilterIndex:
+    """Precomputed bitmaps and sorted positions for resolving sidebar filters"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the index for a dataset
+
+        Args:
+            df: Cleaned dataset the index describes (row positions refer to it)
+        """
+        self.n_rows = len(df)
+
+        # Equality filters: one packed bitmap (1 bit per row) per distinct value
+        self.genre_bitmaps = self._value_bitmaps(df['Primary_Genre']) if 'Primary_Genre' in df.columns else {}
+        self.language_bitmaps = self._value_bitmaps(df['Original_Language']) if 'Original_Language' in df.columns else {}
+        self.regional_bitmaps = {
+            label: np.packbits(df[col].to_numpy(dtype=bool))
+            for label, col in REGIONAL_FILTER_COLUMNS.items() if col in df.columns
+        }
+
+        # Range filters: row positions ordered by value for binary searches
+        self.year_order, self.year_sorted = self._sorted_positions(df['Year'])
+        self.revenue_order, self.revenue_sorted = self._sorted_positions(df['Worldwide_Millions'])
+
+    def positions(self,
+                  year_range: Tuple[int, int],
+                  selected_genre: str = ALL_OPTION,
+                  selected_language: str = ALL_OPTION,
+                  regional_filter: str = ALL_OPTION,
+                  revenue_range: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        Resolve a filter combination to row positions
+
+        Args:
+            year_range: Tuple of (min_year, max_year)
+            selected_genre: Selected genre filter
+            selected_language: Selected language filter
+            regional_filter: Regional performance filter
+            revenue_range: Revenue range filter in millions
+
+        Returns:
+            np.ndarray: Ascending positions of the matching rows
+        """
+        bitmaps = [self._range_bitmap(self.year_order, self.year_sorted, *year_range)]
+
+        if selected_genre != ALL_OPTION and self.genre_bitmaps:
+            bitmaps.append(self.genre_bitmaps.get(selected_genre, self._empty_bitmap()))
+
+        if selected_language != ALL_OPTION and self.language_bitmaps:
+            bitmaps.append(self.language_bitmaps.get(selected_language, self._empty_bitmap()))
+
+        if regional_filter in self.regional_bitmaps:
+            bitmaps.append(self.regional_bitmaps[regional_filter])
+
+        if revenue_range:
+            bitmaps.append(self._range_bitmap(self.revenue_order, self.revenue_sorted, *revenue_range))
+
+        bitmaps = [bitmap for bitmap in bitmaps if bitmap is not None]
+        if not bitmaps:
+            return np.arange(self.n_rows)
+
+        combined = bitmaps[0]
+        for bitmap in bitmaps[1:]:
+            combined = combined & bitmap
+
+        return np.flatnonzero(np.unpackbits(combined, count=self.n_rows))
+
+    def filter_key(self,
+                   year_range: Tuple[int, int],
+                   selected_genre: str = ALL_OPTION,
+                   selected_language: str = ALL_OPTION,
+                   regional_filter: str = ALL_OPTION,
+                   revenue_range: Optional[Tuple[float, float]] = None) -> Tuple:
+        """
+        Normalize a filter combination to a hashable key
+
+        Ranges are reduced to the span of sorted positions they select (None
+        when they cover every row), and options that do not filter anything
+        become None, so combinations that select the same rows share a key.
+
+        Args:
+            year_range: Tuple of (min_year, max_year)
+            selected_genre: Selected genre filter
+            selected_language: Selected language filter
+            regional_filter: Regional performance filter
+            revenue_range: Revenue range filter in millions
+
+        Returns:
+            tuple: Normalized (year, genre, language, regional, revenue) filters
+        """
+        def option(value: str, choices: dict):
+            return value if value != ALL_OPTION and choices else None
+
+        return (
+            self._range_span(self.year_sorted, *year_range),
+            option(selected_genre, self.genre_bitmaps),
+            option(selected_language, self.language_bitmaps),
+            regional_filter if regional_filter in self.regional_bitmaps else None,
+            self._range_span(self.revenue_sorted, *revenue_range) if revenue_range else None
+        )
+
+    def _range_span(self, sorted_values: np.ndarray, low, high) -> Optional[Tuple[int, int]]:
+        """
+        Get the span of sorted positions with low <= value <= high
+
+        Args:
+            sorted_values: Sorted values
+            low: Inclusive lower bound
+            high: Inclusive upper bound
+
+        Returns:
+            tuple: (start, stop) positions, or None if the range covers every row
+        """
+        start = int(np.searchsorted(sorted_values, low, side='left'))
+        stop = int(np.searchsorted(sorted_values, high, side='right'))
+        return None if start == 0 and stop == self.n_rows else (start, stop)
+
+    def _value_bitmaps(self, values: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Build one packed bitmap per distinct value of a column
+
+        Args:
+            values: Column to index
+
+        Returns:
+            dict: Value to packed bitmap
+        """
+        codes, uniques = pd.factorize(values)
+        return {value: np.packbits(codes == code) for code, value in enumerate(uniques)}
+
+    def _sorted_positions(self, values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sort row positions by value
+
+        Args:
+            values: Column to index
+
+        Returns:
+            tuple: (positions in value order, sorted values)
+        """
+        array = values.to_numpy()
+        order = np.argsort(array, kind='stable')
+        return order, array[order]
+
+    def _range_bitmap(self, order: np.ndarray, sorted_values: np.ndarray, low, high) -> Optional[np.ndarray]:
+        """
+        Build the bitmap of rows with low <= value <= high
+
+        Args:
+            order: Positions in value order
+            sorted_values: Sorted values
+            low: Inclusive lower bound
+            high: Inclusive upper bound
+
+        Returns:
+            np.ndarray: Packed bitmap, or None if the range covers every row
+        """
+        span = self._range_span(sorted_values, low, high)
+        if span is None:
+            return None
+
+        start, stop = span
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[order[start:stop]] = True
+        return np.packbits(mask)
+
+    def _empty_bitmap(self) -> np.ndarray:
+        """Bitmap matching no rows, used for values absent from the dataset"""
+        return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
@@ -0,0 +1,93 @@
+import hashlib
+import weakref
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# id of each fingerprinted frame -> (weak reference, fingerprint)
+_fingerprints: Dict[int, tuple] = {}
+
+def _update_column(digest, values: pd.Series) -> None:
+    """
+    Feed the contents of one column to a digest
+
+    Plain NumPy columns and category codes are hashed as raw bytes, Arrow
+    backed strings through their buffers, so no value is converted to a
+    Python object. Equal columns stored differently may hash differently,
+    which only costs a cache miss.
+
+    Args:
+        digest: hashlib digest to update
+        values: Column to hash
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        digest.update(values.cat.codes.to_numpy().tobytes())
+        digest.update(pd.util.hash_array(values.cat.categories.to_numpy(dtype=object)).tobytes())
+    elif isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        digest.update(np.ascontiguousarray(values.to_numpy()).tobytes())
+    elif hasattr(values.array, '__arrow_array__'):
+        for chunk in pa.chunked_array(values.array.__arrow_array__()).chunks:
+            if chunk.offset:
+                # Slices share the buffers of their parent; hash only their own values
+                chunk = pa.concat_arrays([chunk])
+            digest.update(repr((str(chunk.type), len(chunk))).encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    else:
+        digest.update(pd.util.hash_pandas_object(values, index=False).to_numpy().tobytes())
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Compute a fingerprint of the contents of a frame
+
+    The fingerprint covers the column names and dtypes, the row index and
+    every value, so any change to the data, such as a refreshed dataset,
+    gives a new fingerprint. The result is remembered per frame object, so
+    a frame is hashed once however many figures and exports use it, and
+    frames whose identity is already known (see remember_fingerprint) are
+    never hashed.
+
+    Args:
+        df: Frame to fingerprint
+
+    Returns:
+        str: Hex digest identifying the frame contents
+    """
+    entry = _fingerprints.get(id(df))
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((df.shape, list(df.columns), [str(dtype) for dtype in df.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    for _, values in df.items():
+        _update_column(digest, values)
+
+    fingerprint = digest.hexdigest()
+    frame_id = id(df)
+    _fingerprints[frame_id] = (weakref.ref(df, lambda _: _fingerprints.pop(frame_id, None)), fingerprint)
+    return fingerprint
+
+def remember_fingerprint(df: pd.DataFrame, identity: str) -> str:
+    """
+    Set the fingerprint of a frame from an identity that already covers its contents
+
+    Used for the shared dataset, identified by its dataset version, and for
+    frames filtered from it, identified by the version and their filter key,
+    so that fingerprinting them costs nothing.
+
+    Args:
+        df: Frame to fingerprint
+        identity: Description determining every value of the frame
+
+    Returns:
+        str: Fingerprint now returned by frame_fingerprint(df)
+    """
+    fingerprint = hashlib.blake2b(identity.encode(), digest_size=16, person=b'identity').hexdigest()
+    frame_id = id(df)
+    _fingerprints[frame_id] = (weakref.ref(df, lambda _: _fingerprints.pop(frame_id, None)), fingerprint)
+    return fingerprint
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+
+RATING_PATTERN = r'(\d+\.?\d*)'
+
+def _factorize(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Split a column into integer codes and its distinct values
+
+    Categorical columns already carry both, anything else is factorized once.
+
+    Args:
+        values: Column to factorize
+
+    Returns:
+        tuple: (codes with -1 for missing values, distinct values)
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+
+    codes, uniques = pd.factorize(values)
+    return codes, pd.Index(uniques)
+
+def parse_rating_scores(ratings: pd.Series) -> pd.Series:
+    """
+    Extract the numeric score from rating strings such as "7.3/10"
+
+    The regex runs once per distinct rating and the result is broadcast to
+    all rows through the factorized codes.
+
+    Args:
+        ratings: Rating column
+
+    Returns:
+        pd.Series: Scores as float64, NaN where no score could be parsed
+    """
+    codes, uniques = _factorize(ratings)
+    distinct_scores = pd.Series(uniques).str.extract(RATING_PATTERN)[0].astype(float).to_numpy()
+
+    # Append a NaN slot so that missing values (code -1) index it directly
+    scores = np.append(distinct_scores, np.nan)[codes]
+    return pd.Series(scores, index=ratings.index, name='Rating_Score')
+
+def parse_primary_genres(genres: pd.Series) -> pd.Series:
+    """
+    Take the first entry of comma-separated genre lists such as "Action, Drama"
+
+    Splitting happens once per distinct genre list; the primary genres are
+    returned as a categorical whose categories are the genres that occur.
+
+    Args:
+        genres: Genres column
+
+    Returns:
+        pd.Series: Categorical primary genre per row
+    """
+    codes, uniques = _factorize(genres)
+
+    # Only parse the genre lists that are actually used (categoricals may
+    # carry unused categories after subsetting)
+    used = np.bincount(codes[codes >= 0], minlength=len(uniques)) > 0
+    firsts = pd.Series(uniques[used]).str.split(',').str[0].str.strip()
+    primary = pd.Categorical(firsts.astype(uniques.dtype))
+
+    # Map each distinct genre list to the code of its primary genre
+    code_map = np.full(len(uniques) + 1, -1, dtype=primary.codes.dtype)
+    code_map[np.flatnonzero(used)] = primary.codes
+
+    return pd.Series(
+        pd.Categorical.from_codes(code_map[codes], dtype=primary.dtype),
+        index=genres.index,
+        name='Primary_Genre'
+    )
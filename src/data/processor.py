@@ -1,15 +1,116 @@
+import os
+import weakref
 import pandas as pd
 import numpy as np
 import streamlit as st
-from typing import Optional, Tuple, List
-from src.config.settings import FINANCIAL_COLUMNS, NUMERIC_COLUMNS, PERFORMANCE_CATEGORIES
+import pyarrow as pa
+import pyarrow.ipc as ipc
+from typing import Optional, Tuple, List, Callable, Any, Hashable
+from src.config.settings import (
+    FINANCIAL_COLUMNS, NUMERIC_COLUMNS, RANK_COLUMNS, PERFORMANCE_CATEGORIES,
+    DATA_CACHE_CONFIG, STREAMING_CONFIG, SOURCE_SCHEMA, DATASET_SCHEMA,
+    ALL_OPTION, REGIONAL_FILTER_COLUMNS, SEARCH_CONFIG
+)
+from src.data.cache import DatasetCache
+from src.data.fingerprint import remember_fingerprint
+from src.data.filter_index import FilterIndex
+from src.data.result_cache import FilterResultCache
+from src.data.cube import AggregationCube, AggSpec
+from src.data.search_index import SearchIndex, normalize_query
+from src.data.parsing import parse_rating_scores, parse_primary_genres
+
+@st.cache_resource(show_spinner=False, max_entries=DATA_CACHE_CONFIG['shared_versions'])
+def _map_shared_dataset(cache_path: str) -> Optional[pd.DataFrame]:
+    """
+    Memory-map a dataset cache file once per process
+    
+    Only the most recently used versions stay mapped, so a refreshed
+    dataset does not pin every earlier version for the life of the process.
+    
+    Args:
+        cache_path: Path of the Arrow IPC cache file
+        
+    Returns:
+        pd.DataFrame: Read-only frame backed by the mapped file
+    """
+    return DatasetCache.read_file(cache_path, memory_map=True)
+
+@st.cache_resource(show_spinner=False, max_entries=DATA_CACHE_CONFIG['shared_versions'])
+def _build_filter_index(dataset_version: str, _df: pd.DataFrame) -> FilterIndex:
+    """
+    Build the filter index of a shared dataset once per process and version
+    
+    Args:
+        dataset_version: Cache key of the dataset the frame was loaded from
+        _df: Shared dataset (not hashed, identified by dataset_version)
+        
+    Returns:
+        FilterIndex: Index over the rows of the dataset
+    """
+    return FilterIndex(_df)
+
+@st.cache_resource(show_spinner=False, max_entries=DATA_CACHE_CONFIG['shared_versions'])
+def _build_aggregation_cube(dataset_version: str, _df: pd.DataFrame) -> AggregationCube:
+    """
+    Build the aggregation cube of a shared dataset once per process and version
+    
+    Args:
+        dataset_version: Cache key of the dataset the frame was loaded from
+        _df: Shared dataset (not hashed, identified by dataset_version)
+        
+    Returns:
+        AggregationCube: Pre-aggregated measures of the dataset
+    """
+    return AggregationCube(_df)
+
+@st.cache_resource(show_spinner=False, max_entries=DATA_CACHE_CONFIG['shared_versions'])
+def _build_search_index(dataset_version: str, _df: pd.DataFrame) -> SearchIndex:
+    """
+    Build the title search index of a shared dataset once per process and version
+    
+    Args:
+        dataset_version: Cache key of the dataset the frame was loaded from
+        _df: Shared dataset (not hashed, identified by dataset_version)
+        
+    Returns:
+        SearchIndex: Index over the titles of the dataset
+    """
+    return SearchIndex(_df[SEARCH_CONFIG['column']])
+
+@st.cache_resource(show_spinner=False, max_entries=DATA_CACHE_CONFIG['shared_versions'])
+def _build_memory_report(dataset_version: str, _df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the memory report of a shared dataset once per process and version
+    
+    Args:
+        dataset_version: Cache key of the dataset the frame was loaded from
+        _df: Shared dataset (not hashed, identified by dataset_version)
+        
+    Returns:
+        pd.DataFrame: Per-column bytes used, baseline bytes and bytes saved
+    """
+    return DataProcessor._compute_memory_report(_df)
+
+@st.cache_resource(show_spinner=False)
+def _shared_result_cache() -> FilterResultCache:
+    """
+    Get the filter result cache shared by all sessions of the process
+    
+    Returns:
+        FilterResultCache: Process-wide LRU cache of filter results
+    """
+    return FilterResultCache()
 
 class DataProcessor:
     """Class to handle data loading, cleaning, and processing operations"""
     
-    def __init__(self, csv_file_path: str = 'movie_revenue_data.csv'):
+    def __init__(self, csv_file_path: str = 'movie_revenue_data.csv', use_cache: bool = DATA_CACHE_CONFIG['enabled']):
         self.csv_file_path = csv_file_path
+        self.use_cache = use_cache
         self.df = None
+        self.dataset_version = None
+        # id of each filtered frame handed out -> (weak reference, filter key, filters)
+        self._result_keys = {}
     
     @st.cache_data
     def load_data(_self) -> Optional[pd.DataFrame]:
@@ -26,53 +127,508 @@ class DataProcessor:
         """
         Load and clean the movie box office dataset for regional analysis
         
+        The cleaned frame is persisted to an on-disk columnar cache keyed by the
+        source file, so new processes skip parsing and cleaning entirely.
+        
         Returns:
             pd.DataFrame: Cleaned dataset or None if error occurs
         """
+        return _self._load_and_clean()
+    
+    def load_shared_data(self) -> Optional[pd.DataFrame]:
+        """
+        Load the cleaned dataset as a read-only view over the memory-mapped cache
+        
+        Unlike load_data, the returned frame is not copied per session: every
+        Streamlit session in the process receives the same frame, and every
+        process maps the same cache file, so the data is held in memory once.
+        Callers must not modify the frame in place.
+        
+        Returns:
+            pd.DataFrame: Shared cleaned dataset or None if error occurs
+        """
+        if not self.use_cache:
+            return self.load_and_clean_data()
+        
         try:
-            df = pd.read_csv(_self.csv_file_path)
-            
-            if df.empty:
-                st.error("❌ Dataset is empty!")
+            cache = DatasetCache(self.csv_file_path)
+            dataset_version = cache.fingerprint()
+            cache_path = cache.path_for(dataset_version)
+        except FileNotFoundError:
+            st.error(f"❌ Dataset file '{self.csv_file_path}' not found!")
+            return None
+        
+        if not os.path.exists(cache_path) and self._needs_streaming():
+            progress = st.progress(0.0, text="Preparing dataset...")
+            try:
+                self.ingest_streaming(progress_callback=lambda message, fraction: progress.progress(fraction, text=message))
+            except Exception as e:
+                st.error(f"❌ Error loading data: {str(e)}")
                 return None
+            finally:
+                progress.empty()
+        
+        if not os.path.exists(cache_path):
+            df = self._load_and_clean()
+            if df is None or not os.path.exists(cache_path):
+                # Cache could not be written, serve the private copy instead
+                return df
+        
+        df = _map_shared_dataset(cache_path)
+        if df is None:
+            return self.load_and_clean_data()
+        
+        remember_fingerprint(df, f"dataset {dataset_version}")
+        self.df = df
+        self.dataset_version = dataset_version
+        return df
+    
+    def _load_and_clean(self) -> Optional[pd.DataFrame]:
+        """
+        Load and clean the dataset without going through the Streamlit cache
+        
+        Returns:
+            pd.DataFrame: Cleaned dataset or None if error occurs
+        """
+        try:
+            cache = DatasetCache(self.csv_file_path) if self.use_cache else None
             
-            # Clean column names
-            df.columns = df.columns.str.strip()
+            if cache is not None:
+                df = cache.load()
+                if df is not None:
+                    self.df = df
+                    return df
             
-            # Convert financial columns to numeric
-            for col in FINANCIAL_COLUMNS:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            if cache is not None and self._needs_streaming():
+                # Too large to clean in one piece: stream it into the cache first
+                df = DatasetCache.read_file(self.ingest_streaming())
+                self.df = df
+                return df
             
-            # Convert other numeric columns
-            for col in NUMERIC_COLUMNS:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
+            if cache is not None:
+                df = self._try_update_incremental()
+                if df is not None:
+                    self.df = df
+                    return df
             
-            # Extract rating scores
-            if 'Rating' in df.columns:
-                df['Rating_Score'] = df['Rating'].str.extract(r'(\d+\.?\d*)').astype(float)
+            df = pd.read_csv(self.csv_file_path, dtype=SOURCE_SCHEMA)
             
-            # Clean genres
-            if 'Genres' in df.columns:
-                df['Primary_Genre'] = df['Genres'].str.split(',').str[0].str.strip()
+            if df.empty:
+                st.error("❌ Dataset is empty!")
+                return None
             
-            # Add regional analysis columns
-            df = _self._add_calculated_columns(df)
+            df.columns = df.columns.str.strip()
+            row_index = self._hash_rows(df)
+            df = self._clean_data(df)
             
-            # Remove rows with missing critical data
-            df = df.dropna(subset=['$Worldwide', 'Year'])
+            if cache is not None:
+                cache.save(df, row_index)
             
-            _self.df = df
+            self.df = df
             return df
             
         except FileNotFoundError:
-            st.error(f"❌ Dataset file '{_self.csv_file_path}' not found!")
+            st.error(f"❌ Dataset file '{self.csv_file_path}' not found!")
             return None
         except Exception as e:
             st.error(f"❌ Error loading data: {str(e)}")
             return None
     
+    def update_incremental(self) -> Optional[pd.DataFrame]:
+        """
+        Refresh the dataset cache after the source file changed
+        
+        Rows are matched to the previous cache entry by their Release Group and
+        Year key. Only new or modified rows are cleaned; unchanged rows are
+        carried over with their derived columns, and their ranks are shifted by
+        the effect of the inserted and removed revenues instead of re-ranking
+        the whole dataset.
+        
+        Returns:
+            pd.DataFrame: Updated dataset, or None if the previous entry cannot be
+            reused (no earlier cache, or too many rows changed)
+        """
+        cache = DatasetCache(self.csv_file_path)
+        previous = cache.latest_entry()
+        
+        if previous is None:
+            return None
+        
+        old_df = DatasetCache.read_file(previous[0])
+        old_rows = DatasetCache.read_file(previous[1])
+        if old_df is None or old_rows is None:
+            return None
+        
+        raw = pd.read_csv(self.csv_file_path, dtype=SOURCE_SCHEMA)
+        raw.columns = raw.columns.str.strip()
+        row_index = self._hash_rows(raw)
+        
+        # Locate every source row in the previous version by its key
+        old_positions = pd.Index(old_rows['key_hash']).get_indexer(row_index['key_hash'])
+        unchanged = old_positions >= 0
+        unchanged[unchanged] = (
+            old_rows['row_hash'].to_numpy()[old_positions[unchanged]] ==
+            row_index['row_hash'].to_numpy()[unchanged]
+        )
+        changed = np.flatnonzero(~unchanged)
+        
+        if len(changed) > len(raw) * DATA_CACHE_CONFIG['incremental_max_changed_fraction']:
+            return None
+        
+        # Cleaned rows are labelled by their source row position, so relabel the
+        # carried-over rows with their position in the new file
+        old_to_new = np.full(len(old_rows), -1, dtype=np.int64)
+        old_to_new[old_positions[unchanged]] = np.flatnonzero(unchanged)
+        new_labels = old_to_new[old_df.index.to_numpy()]
+        carried = new_labels >= 0
+        
+        kept = old_df[carried].set_axis(new_labels[carried])
+        removed = old_df[~carried]
+        fresh = self._clean_data(raw.iloc[changed].copy(), with_ranks=False)
+        
+        df = self._merge_incremental(kept, removed, fresh)
+        cache.save(df, row_index)
+        return df
+    
+    def _try_update_incremental(self) -> Optional[pd.DataFrame]:
+        """
+        Attempt an incremental update, falling back quietly on any failure
+        
+        Returns:
+            pd.DataFrame: Updated dataset or None if a full rebuild is needed
+        """
+        try:
+            return self.update_incremental()
+        except Exception:
+            # Schema drift, hash collisions or unreadable entries: rebuild in full
+            return None
+    
+    def _hash_rows(self, raw: pd.DataFrame) -> pd.DataFrame:
+        """
+        Hash the key and the content of every source row
+        
+        Args:
+            raw: Source rows as read from the CSV, with stripped column names
+            
+        Returns:
+            pd.DataFrame: key_hash and row_hash per source row
+        """
+        keys = raw[['Release Group', 'Year']]
+        
+        # Number repeated keys so that every row gets a unique key
+        occurrence = keys.groupby(['Release Group', 'Year'], dropna=False, observed=True, sort=False).cumcount()
+        
+        return pd.DataFrame({
+            'key_hash': pd.util.hash_pandas_object(keys.assign(Occurrence=occurrence), index=False).to_numpy(),
+            'row_hash': pd.util.hash_pandas_object(raw, index=False).to_numpy()
+        })
+    
+    def _merge_incremental(self, kept: pd.DataFrame, removed: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge carried-over and freshly cleaned rows into one dataset
+        
+        Args:
+            kept: Unchanged rows from the previous version, with their old ranks
+            removed: Rows of the previous version that were modified or deleted
+            fresh: Newly cleaned rows without rank columns
+            
+        Returns:
+            pd.DataFrame: Merged dataset in source row order
+        """
+        # Categoricals only concatenate without falling back to object when
+        # both sides share the same categories
+        data_categoricals = [
+            col for col, dtype in {**SOURCE_SCHEMA, **DATASET_SCHEMA}.items()
+            if dtype == 'category' and col in kept.columns and col in fresh.columns
+        ]
+        for col in data_categoricals:
+            categories = sorted(set(kept[col].cat.categories) | set(fresh[col].cat.categories))
+            kept = kept.assign(**{col: kept[col].cat.set_categories(categories)})
+            fresh = fresh.assign(**{col: fresh[col].cat.set_categories(categories)})
+        
+        rank_columns_present = all(col in kept.columns for col in RANK_COLUMNS)
+        
+        if rank_columns_present and len(kept) + len(fresh) > 1:
+            for rank_col, source_col in RANK_COLUMNS.items():
+                kept_ranks, fresh_ranks = self._shift_ranks(
+                    kept[rank_col].to_numpy(),
+                    kept[source_col].to_numpy(dtype='float64'),
+                    removed[source_col].to_numpy(dtype='float64'),
+                    fresh[source_col].to_numpy(dtype='float64')
+                )
+                kept = kept.assign(**{rank_col: kept_ranks})
+                fresh = fresh.assign(**{rank_col: fresh_ranks})
+        
+        df = pd.concat([kept, fresh]).sort_index()
+        
+        for col in data_categoricals:
+            df[col] = df[col].cat.remove_unused_categories()
+        
+        if not rank_columns_present:
+            df = self._add_rank_columns(df)
+        
+        return df
+    
+    @staticmethod
+    def _shift_ranks(old_ranks: np.ndarray,
+                     kept_values: np.ndarray,
+                     removed_values: np.ndarray,
+                     inserted_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Update descending average ranks after removing and inserting values
+        
+        A descending average rank is G + (E + 1) / 2, with G the number of
+        larger values and E the number of equal values. For carried-over rows
+        G and E only change by the counts among the (few) removed and inserted
+        values, so their ranks are shifted with binary searches on those small
+        arrays instead of re-sorting the whole column.
+        
+        Args:
+            old_ranks: Previous ranks of the carried-over rows
+            kept_values: Values of the carried-over rows
+            removed_values: Values that left the dataset
+            inserted_values: Values of newly cleaned rows
+            
+        Returns:
+            tuple: (ranks of carried-over rows, ranks of inserted rows)
+        """
+        removed = np.sort(removed_values[~np.isnan(removed_values)])
+        inserted = np.sort(inserted_values[~np.isnan(inserted_values)])
+        
+        def greater_and_equal(sorted_values: np.ndarray, queries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            left = np.searchsorted(sorted_values, queries, side='left')
+            right = np.searchsorted(sorted_values, queries, side='right')
+            return len(sorted_values) - right, right - left
+        
+        inserted_greater, inserted_equal = greater_and_equal(inserted, kept_values)
+        removed_greater, removed_equal = greater_and_equal(removed, kept_values)
+        kept_ranks = old_ranks + (inserted_greater - removed_greater) + (inserted_equal - removed_equal) / 2
+        
+        # Count carried-over values above and equal to each distinct inserted
+        # value with a single histogram pass over the carried-over column
+        distinct = np.unique(inserted)
+        valid_kept = kept_values[~np.isnan(kept_values)]
+        left = np.searchsorted(distinct, valid_kept, side='left')
+        right = np.searchsorted(distinct, valid_kept, side='right')
+        below_counts = np.bincount(left, minlength=len(distinct) + 1)
+        kept_greater = np.cumsum(below_counts[::-1])[::-1][1:]
+        kept_equal = np.bincount(left[right > left], minlength=len(distinct))
+        
+        fresh_ranks = np.full(len(inserted_values), np.nan)
+        valid_fresh = ~np.isnan(inserted_values)
+        slots = np.searchsorted(distinct, inserted_values[valid_fresh])
+        fresh_greater, fresh_equal = greater_and_equal(inserted, inserted_values[valid_fresh])
+        fresh_ranks[valid_fresh] = (
+            kept_greater[slots] + fresh_greater +
+            (kept_equal[slots] + fresh_equal + 1) / 2
+        )
+        
+        return kept_ranks, fresh_ranks
+    
+    def _needs_streaming(self) -> bool:
+        """
+        Check whether the source file is too large to clean in one piece
+        
+        Returns:
+            bool: True if the file should go through ingest_streaming
+        """
+        return os.path.getsize(self.csv_file_path) >= STREAMING_CONFIG['threshold_mb'] * 1_048_576
+    
+    def ingest_streaming(self,
+                         memory_budget_mb: Optional[float] = None,
+                         chunk_rows: Optional[int] = None,
+                         progress_callback: Optional[Callable[[str, float], None]] = None) -> str:
+        """
+        Clean the source CSV in bounded chunks and write it to the dataset cache
+        
+        Each chunk goes through the same cleaning as load_and_clean_data and is
+        appended to a temporary Arrow file, so only one chunk is held in memory
+        at a time. Ranks need the whole dataset and are computed in a second
+        pass over the memory-mapped temporary file, which costs about 24 bytes
+        per row on top of the chunk budget.
+        
+        Args:
+            memory_budget_mb: Peak memory to target per chunk (defaults to STREAMING_CONFIG)
+            chunk_rows: Explicit rows per chunk, overriding the memory budget
+            progress_callback: Called with a status message and a 0-1 completion fraction
+            
+        Returns:
+            str: Path of the written cache file
+        """
+        def report(message: str, fraction: float) -> None:
+            if progress_callback is not None:
+                progress_callback(message, min(fraction, 1.0))
+        
+        cache = DatasetCache(self.csv_file_path)
+        source_size = os.path.getsize(self.csv_file_path)
+        
+        if chunk_rows is None:
+            chunk_rows = self._estimate_chunk_rows(memory_budget_mb or STREAMING_CONFIG['memory_budget_mb'])
+        
+        temp_path = f"{cache.current_path()}.{os.getpid()}.stream"
+        os.makedirs(cache.cache_dir, exist_ok=True)
+        
+        # Chunks see different subsets of the categorical values, and an Arrow
+        # file cannot change dictionaries between batches. Categoricals are
+        # written as plain strings first and re-encoded once all values are known.
+        categories = {}
+        schema = None
+        writer = None
+        rows_written = 0
+        
+        try:
+            with open(self.csv_file_path, 'rb') as source, pa.OSFile(temp_path, 'wb') as sink:
+                for chunk in pd.read_csv(source, dtype=SOURCE_SCHEMA, chunksize=chunk_rows):
+                    chunk = self._clean_data(chunk, with_ranks=False)
+                    
+                    for col in chunk.columns:
+                        if isinstance(chunk[col].dtype, pd.CategoricalDtype) and col != 'Performance_Category':
+                            categories.setdefault(col, set()).update(chunk[col].cat.categories)
+                            chunk[col] = chunk[col].astype('string[pyarrow]')
+                    
+                    table = DatasetCache.to_table(chunk)
+                    if writer is None:
+                        schema = table.schema
+                        writer = ipc.new_file(sink, schema)
+                    writer.write_table(table.replace_schema_metadata(schema.metadata).cast(schema))
+                    
+                    rows_written += len(chunk)
+                    report(f"Cleaned {rows_written:,} rows", 0.8 * source.tell() / max(source_size, 1))
+                
+                if writer is not None:
+                    writer.close()
+            
+            if writer is None:
+                raise ValueError("Dataset is empty")
+            
+            return self._finalize_streamed_cache(cache, temp_path, categories, report)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _estimate_chunk_rows(self, memory_budget_mb: float) -> int:
+        """
+        Estimate how many rows fit into the memory budget
+        
+        Args:
+            memory_budget_mb: Peak memory budget in megabytes
+            
+        Returns:
+            int: Rows per chunk
+        """
+        sample = pd.read_csv(self.csv_file_path, dtype=SOURCE_SCHEMA, nrows=STREAMING_CONFIG['sample_rows'])
+        if sample.empty:
+            return STREAMING_CONFIG['min_chunk_rows']
+        
+        raw_bytes = sample.memory_usage(deep=True).sum()
+        clean_bytes = self._clean_data(sample, with_ranks=False).memory_usage(deep=True).sum()
+        
+        # Raw and cleaned chunks coexist, plus intermediates and the Arrow copy
+        bytes_per_row = (raw_bytes + clean_bytes) / len(sample) * STREAMING_CONFIG['overhead_factor']
+        
+        return max(int(memory_budget_mb * 1_048_576 / bytes_per_row), STREAMING_CONFIG['min_chunk_rows'])
+    
+    def _finalize_streamed_cache(self,
+                                 cache: DatasetCache,
+                                 temp_path: str,
+                                 categories: dict,
+                                 report: Callable[[str, float], None]) -> str:
+        """
+        Add global ranks and unified categoricals to a streamed dataset
+        
+        Args:
+            cache: Cache of the source file
+            temp_path: Temporary Arrow file written by ingest_streaming
+            categories: Category values seen per categorical column
+            report: Progress reporter
+            
+        Returns:
+            str: Path of the published cache file
+        """
+        streamed = ipc.open_file(pa.memory_map(temp_path, 'r'))
+        staged = streamed.read_all()
+        
+        report("Ranking revenues", 0.85)
+        ranks = {}
+        if staged.num_rows > 1:
+            for rank_col, source_col in RANK_COLUMNS.items():
+                ranks[rank_col] = pd.Series(staged.column(source_col).to_numpy()).rank(ascending=False).to_numpy()
+        
+        categories = {col: sorted(values) for col, values in categories.items()}
+        output_path = f"{temp_path}.final"
+        writer = None
+        offset = 0
+        
+        try:
+            with pa.OSFile(output_path, 'wb') as sink:
+                for i in range(streamed.num_record_batches):
+                    chunk = streamed.get_batch(i).to_pandas()
+                    
+                    for col, values in categories.items():
+                        chunk[col] = pd.Categorical(chunk[col], categories=values)
+                    for rank_col, values in ranks.items():
+                        chunk[rank_col] = values[offset:offset + len(chunk)]
+                    offset += len(chunk)
+                    
+                    table = DatasetCache.to_table(chunk)
+                    if writer is None:
+                        schema = table.schema
+                        writer = ipc.new_file(sink, schema)
+                    writer.write_table(table.replace_schema_metadata(schema.metadata).cast(schema))
+                    
+                    report(f"Wrote {offset:,} of {staged.num_rows:,} rows", 0.85 + 0.15 * offset / staged.num_rows)
+                
+                writer.close()
+            
+            return cache.publish(output_path)
+        finally:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+    
+    def _clean_data(self, df: pd.DataFrame, with_ranks: bool = True) -> pd.DataFrame:
+        """
+        Clean a raw frame read from the source CSV
+        
+        Args:
+            df: Raw dataframe (the whole file or a single chunk)
+            with_ranks: Whether to add the dataset-wide rank columns
+            
+        Returns:
+            pd.DataFrame: Cleaned dataframe with calculated columns
+        """
+        # Clean column names
+        df.columns = df.columns.str.strip()
+        
+        # Convert financial columns to numeric
+        for col in FINANCIAL_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # Convert other numeric columns
+        for col in NUMERIC_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # Extract rating scores (parsed once per distinct rating)
+        if 'Rating' in df.columns:
+            df['Rating_Score'] = parse_rating_scores(df['Rating'])
+        
+        # Clean genres (split once per distinct genre list)
+        if 'Genres' in df.columns:
+            df['Primary_Genre'] = parse_primary_genres(df['Genres'])
+        
+        # Add regional analysis columns
+        df = self._add_calculated_columns(df)
+        
+        # Remove rows with missing critical data
+        df = df.dropna(subset=['$Worldwide', 'Year'])
+        
+        if with_ranks:
+            df = self._add_rank_columns(df)
+        
+        # Downcast to the declared compact dtypes
+        return self._apply_schema(df)
+    
     def _add_calculated_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Add calculated columns for regional analysis
@@ -106,24 +662,131 @@ class DataProcessor:
         # Regional preference ratio
         df['Domestic_Foreign_Ratio'] = df['$Domestic'] / df['$Foreign'].replace(0, 1)
         
+        return df
+    
+    def _add_rank_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add revenue rank columns across the whole dataset
+        
+        Args:
+            df: Cleaned dataframe
+            
+        Returns:
+            pd.DataFrame: Dataframe with rank columns
+        """
         # Revenue growth indicators
         if len(df) > 1:
-            df['Revenue_Rank'] = df['$Worldwide'].rank(ascending=False)
-            df['Domestic_Rank'] = df['$Domestic'].rank(ascending=False)
-            df['Foreign_Rank'] = df['$Foreign'].rank(ascending=False)
+            for rank_col, source_col in RANK_COLUMNS.items():
+                df[rank_col] = df[source_col].rank(ascending=False)
         
         return df
     
+    def _apply_schema(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast columns to the dtypes declared in DATASET_SCHEMA
+        
+        Args:
+            df: Cleaned dataframe
+            
+        Returns:
+            pd.DataFrame: Dataframe with compact dtypes
+        """
+        for col, dtype in DATASET_SCHEMA.items():
+            if col not in df.columns or df[col].dtype == dtype:
+                continue
+            
+            # Integer columns that still contain gaps use the nullable variant
+            if dtype.startswith('int') and df[col].isna().any():
+                dtype = dtype.capitalize()
+            
+            df[col] = df[col].astype(dtype)
+        
+        return df
+    
+    @staticmethod
+    def _widen_floats(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert float32 columns of an aggregate to float64
+        
+        Aggregates are rounded for display; rounding in single precision would
+        leave artifacts such as 67.980003 in the output tables.
+        
+        Args:
+            df: Aggregated dataframe
+            
+        Returns:
+            pd.DataFrame: Dataframe with float64 instead of float32 columns
+        """
+        float32_columns = df.select_dtypes(include='float32').columns
+        return df.astype({col: 'float64' for col in float32_columns})
+    
+    def get_memory_report(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compare the memory footprint of the dataset with pandas' inferred dtypes
+        
+        The baseline assumes what read_csv would infer on its own: 64-bit
+        numbers and Python object strings. The report of the shared dataset
+        is computed once per process and version.
+        
+        Args:
+            df: Cleaned dataframe
+            
+        Returns:
+            pd.DataFrame: Per-column bytes used, baseline bytes and bytes saved
+        """
+        if df is self.df and self.dataset_version is not None:
+            return _build_memory_report(self.dataset_version, df).copy()
+        return self._compute_memory_report(df)
+    
+    @staticmethod
+    def _compute_memory_report(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute the memory report of a frame without the shared cache
+        
+        Args:
+            df: Cleaned dataframe
+            
+        Returns:
+            pd.DataFrame: Per-column bytes used, baseline bytes and bytes saved
+        """
+        rows = []
+        
+        for col in df.columns:
+            series = df[col]
+            used = series.memory_usage(deep=True, index=False)
+            
+            if pd.api.types.is_bool_dtype(series.dtype):
+                baseline = len(series)
+            elif pd.api.types.is_numeric_dtype(series.dtype):
+                baseline = len(series) * 8
+            else:
+                baseline = series.astype(object).memory_usage(deep=True, index=False)
+            
+            rows.append({
+                'Column': col,
+                'Dtype': str(series.dtype),
+                'Bytes': used,
+                'Baseline_Bytes': baseline,
+                'Saved_Bytes': baseline - used
+            })
+        
+        report = pd.DataFrame(rows)
+        return report.sort_values('Saved_Bytes', ascending=False).reset_index(drop=True)
+    
     def apply_filters(self, 
                      df: pd.DataFrame,
                      year_range: Tuple[int, int],
-                     selected_genre: str = "All",
-                     selected_language: str = "All",
-                     regional_filter: str = "All",
+                     selected_genre: str = ALL_OPTION,
+                     selected_language: str = ALL_OPTION,
+                     regional_filter: str = ALL_OPTION,
                      revenue_range: Tuple[float, float] = None) -> pd.DataFrame:
         """
         Apply filters to the dataframe
         
+        Filtering the shared dataset resolves the row positions through its
+        precomputed filter index; any other frame is filtered with one
+        combined mask. Either way the result is materialized only once.
+        
         Args:
             df: Source dataframe
             year_range: Tuple of (min_year, max_year)
@@ -135,43 +798,190 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Filtered dataframe
         """
-        filtered_df = df.copy()
+        if df is self.df and self.dataset_version is not None:
+            index = _build_filter_index(self.dataset_version, df)
+            filters = (year_range, selected_genre, selected_language, regional_filter, revenue_range)
+            key = (self.dataset_version,) + index.filter_key(*filters)
+            
+            cache = _shared_result_cache()
+            positions = cache.get(key, 'positions')
+            if positions is None:
+                positions = index.positions(*filters)
+                cache.put(key, 'positions', positions)
+            
+            filtered_df = df.take(positions)
+            # Version and filter key determine the rows, so the frame is never hashed
+            remember_fingerprint(filtered_df, repr(key))
+            self._remember_result_key(filtered_df, key, filters)
+            return filtered_df
         
-        # Year filter
-        filtered_df = filtered_df[
-            (filtered_df['Year'] >= year_range[0]) & 
-            (filtered_df['Year'] <= year_range[1])
-        ]
+        mask = (df['Year'] >= year_range[0]) & (df['Year'] <= year_range[1])
         
         # Genre filter
-        if selected_genre != "All" and 'Primary_Genre' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Primary_Genre'] == selected_genre]
+        if selected_genre != ALL_OPTION and 'Primary_Genre' in df.columns:
+            mask &= df['Primary_Genre'] == selected_genre
         
         # Language filter
-        if selected_language != "All" and 'Original_Language' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['Original_Language'] == selected_language]
+        if selected_language != ALL_OPTION and 'Original_Language' in df.columns:
+            mask &= df['Original_Language'] == selected_language
         
         # Regional performance filter
-        if regional_filter == "Domestic Dominance (>50%)":
-            filtered_df = filtered_df[filtered_df['Domestic_Dominance'] == True]
-        elif regional_filter == "Foreign Dominance (>50%)":
-            filtered_df = filtered_df[filtered_df['Foreign_Dominance'] == True]
-        elif regional_filter == "Balanced Performance":
-            filtered_df = filtered_df[filtered_df['Regional_Balance'] == True]
+        if regional_filter in REGIONAL_FILTER_COLUMNS:
+            mask &= df[REGIONAL_FILTER_COLUMNS[regional_filter]] == True
         
         # Revenue filter
         if revenue_range:
-            filtered_df = filtered_df[
-                (filtered_df['Worldwide_Millions'] >= revenue_range[0]) &
-                (filtered_df['Worldwide_Millions'] <= revenue_range[1])
-            ]
+            mask &= (df['Worldwide_Millions'] >= revenue_range[0]) & (df['Worldwide_Millions'] <= revenue_range[1])
+        
+        return df[mask]
+    
+    def _remember_result_key(self, df: pd.DataFrame, key: Hashable, filters: tuple) -> None:
+        """
+        Associate a filtered frame with its filter key so that results derived
+        from it can be served from the result cache and the aggregation cube
         
-        return filtered_df
+        Args:
+            df: Filtered frame returned by apply_filters
+            key: Filter key of the frame
+            filters: apply_filters arguments the frame was built with
+        """
+        frame_id = id(df)
+        self._result_keys[frame_id] = (weakref.ref(df, lambda _: self._result_keys.pop(frame_id, None)), key, filters)
+    
+    def _filter_origin(self, df: pd.DataFrame) -> Optional[Tuple[Hashable, tuple]]:
+        """
+        Look up the filter key and filters a frame was built with
+        
+        Args:
+            df: Any frame
+            
+        Returns:
+            tuple: (filter key, filters) or None if df did not come from
+            apply_filters on the shared dataset
+        """
+        entry = self._result_keys.get(id(df))
+        if entry is None or entry[0]() is not df:
+            return None
+        return entry[1], entry[2]
+    
+    def _cached_result(self, df: pd.DataFrame, name: str, compute: Callable[[pd.DataFrame], Any]) -> Any:
+        """
+        Get a result derived from a filtered frame, computing it at most once
+        per filter combination
+        
+        Frames that did not come from apply_filters on the shared dataset are
+        always computed directly.
+        
+        Args:
+            df: Frame the result is derived from
+            name: Result name in the cache
+            compute: Function computing the result from the frame
+            
+        Returns:
+            Result (a fresh copy for frames and dicts, so callers may modify it)
+        """
+        origin = self._filter_origin(df)
+        if origin is None:
+            return compute(df)
+        
+        key = origin[0]
+        cache = _shared_result_cache()
+        result = cache.get(key, name)
+        if result is None:
+            result = compute(df)
+            cache.put(key, name, result)
+        
+        return result.copy()
+    
+    def aggregate(self, df: pd.DataFrame, by: List[str], spec: AggSpec) -> pd.DataFrame:
+        """
+        Group and aggregate a frame like df.groupby(by, observed=True).agg(spec)
+        
+        Frames returned by apply_filters on the shared dataset are answered by
+        rolling up the aggregation cube instead of scanning their rows, unless
+        a revenue range restricts them (revenue is not a cube dimension) or
+        the spec needs functions other than count, sum, mean and std. Cube
+        results equal the groupby ones up to floating-point rounding, since
+        sums are added up in a different order.
+        
+        Args:
+            df: Source dataframe
+            by: Grouping columns
+            spec: Aggregation spec in DataFrame.agg dict form
+            
+        Returns:
+            pd.DataFrame: Aggregated dataframe indexed by the grouping columns
+        """
+        origin = self._filter_origin(df)
+        
+        # The last component of the filter key is the normalized revenue range
+        if origin is not None and origin[0][-1] is None:
+            key, filters = origin
+            cube = _build_aggregation_cube(key[0], self.df)
+            if cube.supports(by, spec):
+                return cube.aggregate(by, spec, *filters[:4])
+        
+        return df.groupby(by, observed=True).agg(spec)
+    
+    def search_titles(self, df: pd.DataFrame, query: str) -> Optional[np.ndarray]:
+        """
+        Find the rows of a frame whose title matches a search, best matches first
+        
+        Uses the search index of the shared dataset, so df must be the shared
+        dataset or a row subset of it that keeps its index labels (as
+        apply_filters returns).
+        
+        Args:
+            df: Frame to search
+            query: Search text; typos are tolerated when nothing matches exactly
+            
+        Returns:
+            np.ndarray: Ranked row positions into df, or None when the shared
+                dataset is not loaded, or the query has no letters or digits
+                to look up, and the caller should scan df itself
+        """
+        if self.df is None or self.dataset_version is None or SEARCH_CONFIG['column'] not in df.columns:
+            return None
+        if not normalize_query(query):
+            return None
+        
+        hits = _build_search_index(self.dataset_version, self.df).search(query)
+        if df is self.df:
+            return hits
+        
+        if not (df.index.is_unique and self.df.index.is_unique):
+            return None
+        positions = df.index.get_indexer(self.df.index[hits])
+        return positions[positions >= 0]
+    
+    def get_result_cache_stats(self) -> dict:
+        """
+        Get the counters of the shared filter result cache
+        
+        Returns:
+            dict: Hits, misses, evictions, entry count and estimated bytes
+        """
+        return _shared_result_cache().stats()
     
     def get_summary_stats(self, df: pd.DataFrame) -> dict:
         """
         Get summary statistics for the dataset
         
+        Args:
+            df: Source dataframe
+            
+        Returns:
+            dict: Summary statistics
+        """
+        return self._cached_result(df, 'summary_stats', self._compute_summary_stats)
+    
+    def _compute_summary_stats(self, df: pd.DataFrame) -> dict:
+        """
+        Compute summary stats without the result cache
+        
+        Every metric is computed straight from the column arrays, without
+        materializing sub-frames, and each column is read only once.
+        
         Args:
             df: Source dataframe
             
@@ -181,23 +991,96 @@ class DataProcessor:
         if df.empty:
             return {}
         
+        worldwide = df['$Worldwide'].to_numpy()
+        worldwide_total, worldwide_count = self._nan_sum_count(worldwide)
+        years = df['Year'].to_numpy()
+        
+        avg_rating = 0
+        if 'Rating_Score' in df.columns:
+            rating_total, rating_count = self._nan_sum_count(df['Rating_Score'].to_numpy())
+            if rating_count:
+                avg_rating = rating_total / rating_count
+        
         stats = {
             'total_movies': len(df),
-            'total_worldwide_revenue': df['$Worldwide'].sum(),
-            'avg_worldwide_revenue': df['$Worldwide'].mean(),
-            'avg_domestic_percentage': df['Domestic %'].mean(),
-            'avg_foreign_percentage': df['Foreign %'].mean(),
-            'top_grossing_movie': df.loc[df['$Worldwide'].idxmax(), 'Release Group'] if not df.empty else "N/A",
-            'avg_rating': df['Rating_Score'].mean() if 'Rating_Score' in df.columns and not df['Rating_Score'].isna().all() else 0,
-            'year_range': (int(df['Year'].min()), int(df['Year'].max())),
-            'unique_genres': df['Primary_Genre'].nunique() if 'Primary_Genre' in df.columns else 0,
-            'domestic_dominance_count': len(df[df['Domestic_Dominance'] == True]),
-            'foreign_dominance_count': len(df[df['Foreign_Dominance'] == True]),
-            'balanced_performance_count': len(df[df['Regional_Balance'] == True])
+            'total_worldwide_revenue': worldwide_total,
+            'avg_worldwide_revenue': worldwide_total / worldwide_count,
+            'avg_domestic_percentage': self._nan_mean(df['Domestic %'].to_numpy()),
+            'avg_foreign_percentage': self._nan_mean(df['Foreign %'].to_numpy()),
+            'top_grossing_movie': df['Release Group'].iloc[int(np.nanargmax(worldwide))],
+            'avg_rating': avg_rating,
+            'year_range': (int(years.min()), int(years.max())),
+            'unique_genres': self._count_distinct(df['Primary_Genre']) if 'Primary_Genre' in df.columns else 0,
+            'domestic_dominance_count': self._count_true(df['Domestic_Dominance']),
+            'foreign_dominance_count': self._count_true(df['Foreign_Dominance']),
+            'balanced_performance_count': self._count_true(df['Regional_Balance'])
         }
         
         return stats
     
+    @staticmethod
+    def _nan_sum_count(values: np.ndarray) -> Tuple[Any, Any]:
+        """
+        Sum a float array skipping NaN, the way pandas reductions do
+        
+        The sum is accumulated in the dtype of the array and the count is
+        returned in that dtype too, so that sum / count reproduces Series.mean().
+        
+        Args:
+            values: Float array
+            
+        Returns:
+            tuple: (sum, number of non-NaN values)
+        """
+        missing = np.isnan(values)
+        n_missing = np.count_nonzero(missing)
+        if n_missing:
+            values = np.where(missing, 0, values)
+        return values.sum(dtype=values.dtype), values.dtype.type(len(values) - n_missing)
+    
+    @classmethod
+    def _nan_mean(cls, values: np.ndarray) -> Any:
+        """
+        Mean of a float array skipping NaN
+        
+        Args:
+            values: Float array
+            
+        Returns:
+            Mean in the dtype of the array (NaN if every value is missing)
+        """
+        total, count = cls._nan_sum_count(values)
+        return total / count if count else values.dtype.type(np.nan)
+    
+    @staticmethod
+    def _count_distinct(values: pd.Series) -> int:
+        """
+        Count the distinct non-missing values of a column
+        
+        Args:
+            values: Column to count
+            
+        Returns:
+            int: Number of distinct values
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=1)))
+        return values.nunique()
+    
+    @staticmethod
+    def _count_true(flags: pd.Series) -> int:
+        """
+        Count the True values of a boolean indicator column
+        
+        Args:
+            flags: Boolean (possibly nullable) column
+            
+        Returns:
+            int: Number of True values
+        """
+        return int(np.count_nonzero(flags.to_numpy(dtype=bool, na_value=False)))
+    
     def get_top_performers(self, df: pd.DataFrame, n: int = 10, by: str = 'worldwide') -> pd.DataFrame:
         """
         Get top performing movies by specified criteria
@@ -236,15 +1119,20 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Genre analysis summary
         """
+        return self._cached_result(df, 'genre_analysis', self._compute_genre_analysis)
+    
+    def _compute_genre_analysis(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute genre analysis without the result cache"""
         if df.empty or 'Primary_Genre' not in df.columns:
             return pd.DataFrame()
         
-        genre_stats = df.groupby('Primary_Genre').agg({
+        genre_stats = self.aggregate(df, ['Primary_Genre'], {
             'Worldwide_Millions': ['count', 'mean', 'sum', 'std'],
             'Domestic %': 'mean',
             'Foreign %': 'mean',
             'Rating_Score': 'mean' if 'Rating_Score' in df.columns else lambda x: 0
-        }).round(2)
+        })
+        genre_stats = self._widen_floats(genre_stats).round(2)
         
         # Flatten column names
         genre_stats.columns = [
@@ -267,15 +1155,20 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Yearly trends summary
         """
+        return self._cached_result(df, 'yearly_trends', self._compute_yearly_trends)
+    
+    def _compute_yearly_trends(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute yearly trends without the result cache"""
         if df.empty:
             return pd.DataFrame()
         
-        yearly_trends = df.groupby('Year').agg({
+        yearly_trends = self.aggregate(df, ['Year'], {
             'Worldwide_Millions': ['count', 'mean', 'sum'],
             'Domestic %': 'mean',
             'Foreign %': 'mean',
             'Rating_Score': 'mean' if 'Rating_Score' in df.columns else lambda x: 0
-        }).round(2)
+        })
+        yearly_trends = self._widen_floats(yearly_trends).round(2)
         
         # Flatten column names
         yearly_trends.columns = [
@@ -0,0 +1,130 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.config.settings import RESULT_CACHE_CONFIG
+
+def estimate_bytes(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value
+
+    Args:
+        value: Array, frame, series, container or scalar
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+class FilterResultCache:
+    """Thread-safe LRU cache of filter results, bounded by entry count and memory"""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: Maximum number of filter combinations kept
+            max_bytes: Maximum estimated memory of all cached results
+        """
+        self.max_entries = max_entries or RESULT_CACHE_CONFIG['max_entries']
+        self.max_bytes = max_bytes or RESULT_CACHE_CONFIG['max_mb'] * 1024 * 1024
+
+        # key -> {result name -> value}, least recently used first
+        self._entries: 'OrderedDict[Hashable, Dict[str, Any]]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, name: str) -> Optional[Any]:
+        """
+        Look up one result of a filter combination
+
+        Args:
+            key: Filter key (dataset version plus normalized filters)
+            name: Result name, e.g. 'positions' or 'summary_stats'
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or name not in entry:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[name]
+
+    def put(self, key: Hashable, name: str, value: Any) -> None:
+        """
+        Store one result of a filter combination and evict to stay within bounds
+
+        Args:
+            key: Filter key (dataset version plus normalized filters)
+            name: Result name
+            value: Result to cache
+        """
+        size = estimate_bytes(value)
+
+        with self._lock:
+            entry = self._entries.setdefault(key, {})
+            self._entries.move_to_end(key)
+
+            previous = entry.get(name)
+            if previous is not None:
+                previous_size = estimate_bytes(previous)
+                self._sizes[key] -= previous_size
+                self._total_bytes -= previous_size
+
+            entry[name] = value
+            self._sizes[key] = self._sizes.get(key, 0) + size
+            self._total_bytes += size
+
+            # The entry just written is never evicted, even if it alone exceeds the budget
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(evicted_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters
+
+        Returns:
+            dict: Hits, misses, evictions, entry count and estimated bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes
+            }
@@ -0,0 +1,349 @@
+import unicodedata
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Dict, List, Optional, Tuple
+from src.config.settings import SEARCH_CONFIG
+
+# Combining accents left over by NFKD decomposition, dropped so that "é" matches "e"
+ACCENTS = '[\u0300-\u036f]'
+# Runs of anything but letters, marks and digits, in any script, become one space
+SEPARATORS = r'[^\p{L}\p{M}\p{N}]+'
+
+def normalize_titles(titles: pd.Series) -> pd.Series:
+    """
+    Normalize titles for matching: accents removed, lower case, words
+    separated by single spaces
+
+    Letters and digits of every script are kept, so titles in Cyrillic,
+    CJK and other scripts stay searchable.
+
+    Args:
+        titles: Raw titles
+
+    Returns:
+        pd.Series: Normalized titles, '' for missing ones
+    """
+    text = pa.array(titles.astype('string').fillna(''), type=pa.string())
+    text = pc.utf8_normalize(pc.utf8_lower(text), 'NFKD')
+    text = pc.replace_substring_regex(text, ACCENTS, '')
+    text = pc.utf8_trim(pc.replace_substring_regex(text, SEPARATORS, ' '), ' ')
+    return pd.Series(text.to_numpy(zero_copy_only=False), index=titles.index, dtype=object)
+
+def normalize_query(query: str) -> str:
+    """Normalize one search text the way normalize_titles does, without compiling its regular expressions"""
+    text = unicodedata.normalize('NFKD', query.lower())
+    kept = ''.join(
+        char if unicodedata.category(char)[0] in 'LMN' else ' '
+        for char in text if not '\u0300' <= char <= '\u036f'
+    )
+    return ' '.join(kept.split())
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Sorted distinct values; sorting beats np.unique's hashing on large integer arrays"""
+    values = np.sort(values)
+    return values[np.concatenate([[True], values[1:] != values[:-1]])] if len(values) else values
+
+def _intersect_sorted(small: np.ndarray, large: np.ndarray) -> np.ndarray:
+    """Intersection of two sorted id arrays, by binary search when one is much shorter"""
+    if len(small) * 16 > len(large):
+        return np.intersect1d(small, large, assume_unique=True)
+    found = np.searchsorted(large, small).clip(max=len(large) - 1)
+    return small[large[found] == small] if len(large) else large
+
+def _code_points(text: str) -> np.ndarray:
+    """Unicode code points of a text"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+
+def _encode_trigrams(points: np.ndarray) -> np.ndarray:
+    """Code of every run of three code points, 21 bits per code point"""
+    return (points[:-2] << 42) | (points[1:-1] << 21) | points[2:]
+
+def _trigram_postings(texts: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build an inverted index from trigram to the texts containing it
+
+    Every text is padded with a space on both sides, so word starts and ends
+    form their own trigrams.
+
+    Args:
+        texts: Texts without newlines
+
+    Returns:
+        tuple: (sorted trigram codes, offsets of their postings, text ids)
+    """
+    padded = [f" {text} " for text in texts]
+    lengths = np.fromiter((len(text) + 1 for text in padded), dtype=np.int64, count=len(padded))
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    points = _code_points('\n'.join(padded))
+
+    if len(points) < 3:
+        return np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    newline = points == ord('\n')
+    positions = np.flatnonzero(~(newline[:-2] | newline[1:-1] | newline[2:]))
+    codes = _encode_trigrams(points)[positions]
+    text_ids = np.searchsorted(starts, positions, side='right') - 1
+
+    # Codes take 63 bits, so (code, text) pairs are sorted together rather than packed
+    order = np.lexsort((text_ids, codes))
+    codes, text_ids = codes[order], text_ids[order]
+    new_code = np.concatenate([[True], codes[1:] != codes[:-1]])
+    distinct = new_code | np.concatenate([[True], text_ids[1:] != text_ids[:-1]])
+    codes, text_ids, new_code = codes[distinct], text_ids[distinct], new_code[distinct]
+
+    offsets = np.append(np.flatnonzero(new_code), len(codes))
+    return codes[offsets[:-1]], offsets, text_ids
+
+def _trigram_codes(text: str) -> np.ndarray:
+    """Distinct trigram codes of a text, as _trigram_postings encodes them"""
+    points = _code_points(text)
+    if len(points) < 3:
+        return np.empty(0, dtype=np.int64)
+    return _sorted_unique(_encode_trigrams(points))
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance between two strings, capped at limit + 1
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Largest distance of interest
+
+    Returns:
+        int: Distance, or limit + 1 when it exceeds limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+class SearchIndex:
+    """Trigram and token index over a title column for ranked, typo-tolerant search"""
+
+    def __init__(self, titles: pd.Series):
+        """
+        Build the index
+
+        Args:
+            titles: Title of every row (row positions in results refer to it)
+        """
+        self.n_rows = len(titles)
+
+        # Titles are indexed once per distinct value and mapped back to rows
+        codes, uniques = pd.factorize(titles)
+        self.titles = normalize_titles(pd.Series(uniques)).tolist()
+        self.title_lengths = np.fromiter(map(len, self.titles), dtype=np.int64, count=len(self.titles))
+        self.row_order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        self.row_order = self.row_order[len(codes) - counts.sum():]
+        self.row_bounds = np.concatenate([[0], np.cumsum(counts)])
+
+        # Titles in alphabetical order, for prefix ranges
+        self.title_order = np.argsort(np.asarray(self.titles, dtype=object), kind='stable')
+        self.sorted_titles = np.asarray(self.titles, dtype=object)[self.title_order]
+
+        # Substring candidates: trigram -> titles containing it
+        self.gram_codes, self.gram_offsets, self.gram_titles = _trigram_postings(self.titles)
+
+        # Typo tolerance: word -> titles containing it, and trigram -> words
+        words = pd.Series(self.titles).str.split().explode().dropna()
+        word_codes, vocabulary = pd.factorize(words.to_numpy(dtype=object), sort=True)
+        pairs = _sorted_unique((word_codes.astype(np.int64) << 32) | words.index.to_numpy(dtype=np.int64))
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.word_offsets = np.concatenate([[0], np.cumsum(np.bincount(pairs >> 32, minlength=len(vocabulary)))])
+        self.word_titles = pairs & 0xFFFFFFFF
+        self.word_gram_codes, self.word_gram_offsets, self.word_gram_words = _trigram_postings(list(vocabulary))
+
+    def __repr__(self) -> str:
+        return f"SearchIndex({self.n_rows:,} rows, {len(self.titles):,} titles, {len(self.vocabulary):,} words)"
+
+    def search(self, query: str, limit: Optional[int] = None, fuzzy: bool = True) -> np.ndarray:
+        """
+        Find the rows whose title contains the query, best matches first
+
+        Titles equal to the query rank first, then titles starting with it,
+        then titles where it starts a word, then other substring matches,
+        shorter titles first within each group. When nothing contains the
+        query and fuzzy is set, titles whose words are within a few edits of
+        every query word are returned, fewest edits first.
+
+        Args:
+            query: Search text (case, accents and punctuation are ignored)
+            limit: Maximum number of titles to return, None for all
+            fuzzy: Fall back to typo-tolerant matching
+
+        Returns:
+            np.ndarray: Row positions of the matching titles in rank order
+        """
+        normalized = normalize_query(query)
+        if not normalized:
+            return np.empty(0, dtype=np.int64)
+
+        ranked = self._substring_matches(normalized)
+        if not len(ranked) and fuzzy:
+            ranked = self._fuzzy_matches(normalized)
+
+        return self._rows(ranked[:limit])
+
+    def _postings(self, code: int, codes: np.ndarray, offsets: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Sorted ids listed under a trigram code, empty when the code is unknown"""
+        i = np.searchsorted(codes, code)
+        if i == len(codes) or codes[i] != code:
+            return ids[:0]
+        return ids[offsets[i]:offsets[i + 1]]
+
+    def _substring_matches(self, normalized: str) -> np.ndarray:
+        """Ranked ids of the titles containing the normalized query"""
+        grams = _trigram_codes(normalized)
+        if len(grams):
+            postings = sorted(
+                (self._postings(code, self.gram_codes, self.gram_offsets, self.gram_titles) for code in grams),
+                key=len
+            )
+            candidates = postings[0]
+            for posting in postings[1:]:
+                if not len(candidates):
+                    break
+                candidates = _intersect_sorted(candidates, posting)
+        else:
+            # One or two characters have no trigram to look up
+            candidates = np.arange(len(self.titles))
+
+        titles = self.titles
+        if len(normalized) == 3:
+            # The query is its own trigram: every candidate contains it
+            matches = candidates
+        else:
+            matches = np.fromiter((i for i in candidates.tolist() if normalized in titles[i]), dtype=np.int64)
+
+        tiers = self._match_tiers(matches, normalized)
+        return matches[np.lexsort((matches, self.title_lengths[matches], tiers))]
+
+    def _match_tiers(self, matches: np.ndarray, normalized: str) -> np.ndarray:
+        """
+        Rank group of each title containing the query
+
+        Args:
+            matches: Ids of titles containing the normalized query
+            normalized: Normalized query
+
+        Returns:
+            np.ndarray: 0 for equal titles, 1 for titles starting with the
+                query, 2 where the query starts a later word, 3 otherwise
+        """
+        tiers = np.full(len(matches), 3, dtype=np.int64)
+
+        if ' ' in normalized:
+            titles = self.titles
+            word_start = f" {normalized}"
+            tiers[np.fromiter((word_start in titles[i] for i in matches.tolist()), dtype=bool, count=len(matches))] = 2
+        else:
+            # Titles with a word starting with the query, from the sorted vocabulary
+            first, last = _prefix_range(self.vocabulary, normalized)
+            words = np.arange(first, last)
+            sizes = self.word_offsets[words + 1] - self.word_offsets[words]
+            tiers[np.isin(matches, self.word_titles[np.repeat(self.word_offsets[words], sizes) + _ranges(sizes)])] = 2
+
+        first, last = _prefix_range(self.sorted_titles, normalized)
+        tiers[np.isin(matches, self.title_order[first:last])] = 1
+        # A title containing the query and as long as it is the query itself
+        tiers[self.title_lengths[matches] == len(normalized)] = 0
+        return tiers
+
+    def _similar_words(self, word: str) -> Dict[int, int]:
+        """
+        Find the vocabulary words within the allowed edits of a query word
+
+        Args:
+            word: Normalized query word
+
+        Returns:
+            dict: Vocabulary id -> edit distance
+        """
+        max_edits = 0
+        for min_length, edits in SEARCH_CONFIG['max_edits']:
+            if len(word) >= min_length:
+                max_edits = edits
+
+        exact = np.searchsorted(self.vocabulary, word)
+        if exact < len(self.vocabulary) and self.vocabulary[exact] == word:
+            similar = {int(exact): 0}
+        else:
+            similar = {}
+        if not max_edits:
+            return similar
+
+        # Candidates share the most padded trigrams with the word
+        grams = _trigram_codes(f" {word} ")
+        shared = np.concatenate([
+            self._postings(code, self.word_gram_codes, self.word_gram_offsets, self.word_gram_words)
+            for code in grams
+        ]) if len(grams) else np.empty(0, dtype=np.int64)
+        candidates, counts = np.unique(shared, return_counts=True)
+        best = candidates[np.argsort(-counts, kind='stable')[:SEARCH_CONFIG['fuzzy_candidates']]]
+
+        for i in best.tolist():
+            distance = _edit_distance(word, self.vocabulary[i], max_edits)
+            if distance <= max_edits:
+                similar[i] = min(distance, similar.get(i, distance))
+        return similar
+
+    def _fuzzy_matches(self, normalized: str) -> np.ndarray:
+        """Ids of the titles matching every query word within a few edits, fewest edits first"""
+        matches = None
+        edits = None
+
+        for word in normalized.split():
+            similar = self._similar_words(word)
+            if not similar:
+                return np.empty(0, dtype=np.int64)
+
+            # Per title, the smallest number of edits among the similar words it contains
+            word_ids = np.fromiter(similar.keys(), dtype=np.int64, count=len(similar))
+            word_edits = np.fromiter(similar.values(), dtype=np.int64, count=len(similar))
+            sizes = self.word_offsets[word_ids + 1] - self.word_offsets[word_ids]
+            titles = self.word_titles[np.repeat(self.word_offsets[word_ids], sizes) + _ranges(sizes)]
+            title_edits = np.repeat(word_edits, sizes)
+
+            order = np.lexsort((title_edits, titles))
+            titles, title_edits = titles[order], title_edits[order]
+            first = np.concatenate([[True], titles[1:] != titles[:-1]])
+            titles, title_edits = titles[first], title_edits[first]
+
+            if matches is None:
+                matches, edits = titles, title_edits
+            else:
+                common, left, right = np.intersect1d(matches, titles, assume_unique=True, return_indices=True)
+                matches, edits = common, edits[left] + title_edits[right]
+
+            if not len(matches):
+                return matches
+
+        return matches[np.lexsort((matches, self.title_lengths[matches], edits))]
+
+    def _rows(self, title_ids: np.ndarray) -> np.ndarray:
+        """Row positions of the given titles, grouped in the given order"""
+        sizes = self.row_bounds[title_ids + 1] - self.row_bounds[title_ids]
+        return self.row_order[np.repeat(self.row_bounds[title_ids], sizes) + _ranges(sizes)]
+
+def _prefix_range(sorted_texts: np.ndarray, prefix: str) -> Tuple[int, int]:
+    """Bounds of the texts starting with prefix in a sorted array of normalized texts"""
+    # The last code point sorts after every character a normalized text can contain
+    return (int(np.searchsorted(sorted_texts, prefix, side='left')),
+            int(np.searchsorted(sorted_texts, prefix + '\U0010ffff', side='left')))
+
+def _ranges(sizes: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(size) for every size"""
+    ends = np.cumsum(sizes)
+    return np.arange(ends[-1] if len(ends) else 0) - np.repeat(ends - sizes, sizes)
@@ -0,0 +1 @@
+# Batch report generation module
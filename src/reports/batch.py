@@ -0,0 +1,283 @@
+"""
+Generate revenue reports for a list of filter specs in parallel
+
+Every spec becomes a JSON file (summary statistics, genre analysis, yearly
+trends and top performers) and an HTML page with the charts. Specs run in a
+process pool whose workers all map the same on-disk dataset cache, so the
+data is held in memory once whatever the number of processes.
+
+Usage:
+    python -m src.reports.batch specs.json [--out reports] [--processes 4]
+    python -m src.reports.batch --per genre language
+
+A spec file is a JSON list of objects with an optional "name", the filter
+parameters of the query API (year_min, year_max, genre, language, region,
+revenue_min, revenue_max) and an optional "top_n". A genre or language of
+"*" expands to one spec per value in the dataset, e.g.
+
+    [{"name": "2010s", "year_min": 2010, "year_max": 2019, "genre": "*"}]
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from src.api.query import FILTER_PARAMS, QueryError, encode, parse_filters
+from src.config.settings import REPORT_CONFIG
+from src.data.processor import DataProcessor
+from src.visualizations.charts import ChartCreator
+
+SPEC_KEYS = set(FILTER_PARAMS) | {'name', 'top_n'}
+
+# Spec key -> dataset column a "*" value expands over
+EXPANDABLE = {'genre': 'Primary_Genre', 'language': 'Original_Language'}
+
+def spec_name(spec: Dict[str, Any]) -> str:
+    """File name of a spec: its name, or its filters joined, made file-system safe"""
+    name = spec.get('name') or '_'.join(f"{key}-{spec[key]}" for key in FILTER_PARAMS if key in spec) or 'all'
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', str(name)).strip('-')
+
+def expand_specs(specs: List[Dict[str, Any]], df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Validate specs and expand "*" genres and languages to one spec per value
+
+    Args:
+        specs: Report specs
+        df: Dataset the values are taken from
+
+    Returns:
+        list: Specs with concrete filter values, each with a unique name
+
+    Raises:
+        QueryError: On unknown keys or invalid filter or top_n values
+    """
+    year_bounds = (int(df['Year'].min()), int(df['Year'].max()))
+    expanded = []
+    for spec in specs:
+        unknown = sorted(set(spec) - SPEC_KEYS)
+        if unknown:
+            raise QueryError(f"Unknown spec key(s): {', '.join(unknown)}")
+
+        expand = [key for key in EXPANDABLE if spec.get(key) == '*']
+        variants = [dict(spec)]
+        for key in expand:
+            values = sorted(str(value) for value in df[EXPANDABLE[key]].dropna().unique())
+            variants = [{**variant, key: value} for variant in variants for value in values]
+
+        for variant in variants:
+            if expand and spec.get('name'):
+                variant['name'] = '_'.join([spec['name']] + [f"{key}-{variant[key]}" for key in expand])
+            variant['name'] = spec_name(variant)
+            # Check the values here rather than in a worker, where one bad
+            # spec would abort the whole batch
+            try:
+                parse_filters(variant, year_bounds)
+            except QueryError as e:
+                raise QueryError(f"Report {variant['name']}: {e}")
+            try:
+                int(variant.get('top_n', REPORT_CONFIG['top_n']))
+            except (TypeError, ValueError):
+                raise QueryError(f"Report {variant['name']}: top_n must be an integer, got {variant['top_n']!r}")
+        expanded.extend(variants)
+
+    seen = set()
+    for spec in expanded:
+        if spec['name'] in seen:
+            raise QueryError(f"Duplicate report name: {spec['name']}")
+        seen.add(spec['name'])
+    return expanded
+
+# Per-process state of the report workers
+_processor: Optional[DataProcessor] = None
+_df: Optional[pd.DataFrame] = None
+_charts: Optional[ChartCreator] = None
+_year_bounds: Tuple[int, int] = (0, 0)
+
+def _init_worker(csv_file_path: str) -> None:
+    """Map the shared dataset once per worker process"""
+    global _processor, _df, _charts, _year_bounds
+
+    # Outside a Streamlit session the shared caches warn on every use
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    _processor = DataProcessor(csv_file_path)
+    _df = _processor.load_shared_data()
+    if _df is None:
+        raise RuntimeError(f"Dataset {csv_file_path} could not be loaded")
+    _charts = ChartCreator()
+    # Every report filters differently, so cached figures would never be reused
+    _charts.figure_cache = None
+    _year_bounds = (int(_df['Year'].min()), int(_df['Year'].max()))
+
+def build_report(spec: Dict[str, Any]) -> Tuple[Dict[str, Any], List[go.Figure]]:
+    """
+    Compute the tables and charts of one spec in a worker
+
+    Args:
+        spec: Expanded report spec
+
+    Returns:
+        tuple: (JSON-ready report, figures)
+    """
+    filters = parse_filters(spec, _year_bounds)
+    df = _processor.apply_filters(_df, **filters)
+    top_n = int(spec.get('top_n', REPORT_CONFIG['top_n']))
+
+    report = {
+        'name': spec['name'],
+        'dataset_version': _processor.dataset_version,
+        'filters': filters,
+        'summary': _processor.get_summary_stats(df),
+        'genres': _processor.get_genre_analysis(df),
+        'yearly_trends': _processor.get_yearly_trends(df),
+        'top_performers': _processor.get_top_performers(df, n=top_n),
+    }
+    figures = [
+        _charts.create_genre_regional_analysis(df),
+        _charts.create_revenue_trends_chart(df),
+        _charts.create_top_performers_chart(df, top_n),
+        _charts.create_performance_scatter(df),
+    ]
+    return report, figures
+
+def write_html(path: str, report: Dict[str, Any], figures: List[go.Figure]) -> None:
+    """
+    Write a report as a standalone HTML page
+
+    Args:
+        path: Destination path
+        report: Report as returned by build_report
+        figures: Charts of the report; plotly.js is loaded once from its CDN
+    """
+    summary = json.loads(encode(report['summary']))
+    rows = ''.join(
+        f"<tr><th>{html.escape(key.replace('_', ' ').title())}</th><td>{html.escape(str(value))}</td></tr>"
+        for key, value in summary.items()
+    )
+    charts = ''.join(
+        fig.to_html(full_html=False, include_plotlyjs='cdn' if i == 0 else False)
+        for i, fig in enumerate(figures)
+    )
+    title = html.escape(f"Movie revenue report: {report['name']}")
+
+    with open(path, 'w', encoding='utf-8') as target:
+        target.write(
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title></head>"
+            f"<body style='background:#0e1117;color:#fafafa;font-family:sans-serif'>"
+            f"<h1>{title}</h1><table>{rows}</table>{charts}</body></html>"
+        )
+
+def run_spec(spec: Dict[str, Any], out_dir: str, formats: List[str]) -> Dict[str, Any]:
+    """
+    Build one report and write its files; runs in a worker
+
+    Args:
+        spec: Expanded report spec
+        out_dir: Output folder
+        formats: 'json' and/or 'html'
+
+    Returns:
+        dict: Report name, filtered row count, written files and seconds taken
+    """
+    start = time.perf_counter()
+    report, figures = build_report(spec)
+
+    files = []
+    if 'json' in formats:
+        files.append(os.path.join(out_dir, f"{spec['name']}.json"))
+        with open(files[-1], 'wb') as target:
+            target.write(encode(report))
+    if 'html' in formats:
+        files.append(os.path.join(out_dir, f"{spec['name']}.html"))
+        write_html(files[-1], report, figures)
+
+    return {
+        'name': spec['name'],
+        'rows': report['summary'].get('total_movies', 0),
+        'files': files,
+        'seconds': time.perf_counter() - start,
+    }
+
+def generate_reports(specs: List[Dict[str, Any]],
+                     out_dir: str,
+                     processes: Optional[int] = None,
+                     formats: Optional[List[str]] = None,
+                     csv_file_path: str = 'movie_revenue_data.csv') -> List[Dict[str, Any]]:
+    """
+    Generate the reports of a list of specs in a process pool
+
+    The dataset cache is built (or validated) in the calling process first,
+    so the workers only map it.
+
+    Args:
+        specs: Report specs, expanded by expand_specs
+        out_dir: Output folder, created if missing
+        processes: Worker processes, every core if None; 1 runs in process
+        formats: 'json' and/or 'html', defaults to REPORT_CONFIG['formats']
+        csv_file_path: Source dataset
+
+    Returns:
+        list: run_spec results in completion order
+    """
+    formats = formats or REPORT_CONFIG['formats']
+    processes = processes or REPORT_CONFIG['processes'] or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+
+    if processes == 1:
+        _init_worker(csv_file_path)
+        return [run_spec(spec, out_dir, formats) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(csv_file_path,)) as pool:
+        futures = [pool.submit(run_spec, spec, out_dir, formats) for spec in specs]
+        return [future.result() for future in as_completed(futures)]
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('specs', nargs='?', help="JSON file with a list of report specs")
+    parser.add_argument('--per', nargs='+', choices=sorted(EXPANDABLE), default=[],
+                        help="Add one report per genre and/or language")
+    parser.add_argument('--out', default=REPORT_CONFIG['output_dir'])
+    parser.add_argument('--processes', type=int, default=REPORT_CONFIG['processes'])
+    parser.add_argument('--formats', nargs='+', choices=['json', 'html'], default=REPORT_CONFIG['formats'])
+    parser.add_argument('--data', default='movie_revenue_data.csv', help="Source CSV file")
+    args = parser.parse_args(argv)
+
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    specs = []
+    if args.specs:
+        with open(args.specs, encoding='utf-8') as source:
+            specs = json.load(source)
+    specs += [{key: '*'} for key in args.per]
+    if not specs:
+        specs = [{'name': 'all'}]
+
+    processor = DataProcessor(args.data)
+    df = processor.load_shared_data()
+    if df is None:
+        raise SystemExit(f"Dataset {args.data} could not be loaded")
+    try:
+        specs = expand_specs(specs, df)
+    except QueryError as e:
+        raise SystemExit(str(e))
+
+    processes = args.processes or os.cpu_count() or 1
+    start = time.perf_counter()
+    results = generate_reports(specs, args.out, processes, args.formats, args.data)
+    elapsed = time.perf_counter() - start
+
+    for result in sorted(results, key=lambda item: item['name']):
+        print(f"{result['name']:<40} {result['rows']:>8,} rows {result['seconds']:>7.2f} s")
+    print(f"\n{len(results):,} reports in {elapsed:.2f} s: {len(results) / elapsed:.1f} reports/s "
+          f"on {processes} process(es), written to {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+Range = Optional[Tuple[float, float]]
+
+def _bin_ranges(columns: Sequence[np.ndarray], ranges: Sequence[Range]) -> List[Tuple[float, float]]:
+    """
+    Resolve the binning range of each axis, defaulting to the data extent
+
+    Args:
+        columns: Coordinates per axis
+        ranges: Optional (low, high) per axis
+
+    Returns:
+        list: (low, high) per axis, widened when low == high so bins have a width
+    """
+    resolved = []
+    for values, value_range in zip(columns, ranges):
+        if value_range is None:
+            finite = values[np.isfinite(values)]
+            value_range = (float(finite.min()), float(finite.max())) if len(finite) else (0.0, 1.0)
+        low, high = value_range
+        resolved.append((low, high) if high > low else (low - 0.5, high + 0.5))
+    return resolved
+
+def density_grid(columns: Sequence[np.ndarray],
+                 bins: Sequence[int],
+                 ranges: Optional[Sequence[Range]] = None) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Count points per cell of a regular 2D or 3D grid
+
+    Points outside the ranges and points with missing coordinates are not
+    counted.
+
+    Args:
+        columns: Coordinates per axis (x, y[, z])
+        bins: Number of cells per axis
+        ranges: Optional (low, high) per axis, defaults to the data extent
+
+    Returns:
+        tuple: (counts indexed [x, y(, z)], cell centers per axis)
+    """
+    columns = [np.asarray(values, dtype=np.float64) for values in columns]
+    ranges = _bin_ranges(columns, ranges or [None] * len(columns))
+
+    valid = np.logical_and.reduce([np.isfinite(values) for values in columns])
+    counts, edges = np.histogramdd(
+        np.column_stack([values[valid] for values in columns]),
+        bins=list(bins),
+        range=ranges
+    )
+
+    centers = [(axis_edges[:-1] + axis_edges[1:]) / 2 for axis_edges in edges]
+    return counts, centers
+
+def occupied_cells(counts: np.ndarray, centers: Sequence[np.ndarray]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    List the non-empty cells of a density grid
+
+    Args:
+        counts: Counts as returned by density_grid
+        centers: Cell centers per axis
+
+    Returns:
+        tuple: (center coordinates per axis of each non-empty cell, their counts)
+    """
+    cells = np.nonzero(counts)
+    return [axis_centers[axis_cells] for axis_centers, axis_cells in zip(centers, cells)], counts[cells]
+
+def in_ranges(columns: Sequence[np.ndarray], ranges: Sequence[Range]) -> np.ndarray:
+    """
+    Select the points inside a zoomed region
+
+    Args:
+        columns: Coordinates per axis
+        ranges: Optional inclusive (low, high) per axis, None for an unrestricted axis
+
+    Returns:
+        np.ndarray: Boolean mask of the points inside every range
+    """
+    mask = np.ones(len(columns[0]), dtype=bool)
+    for values, value_range in zip(columns, ranges):
+        if value_range is not None:
+            mask &= (values >= value_range[0]) & (values <= value_range[1])
+    return mask
@@ -3,17 +3,42 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import plotly.figure_factory as ff
-from src.config.settings import CHART_CONFIG, COLORS
+from src.config.settings import CHART_CONFIG, COLORS, DOWNSAMPLING_CONFIG, FIGURE_CACHE_CONFIG, RENDER_CONFIG
+from src.visualizations.figure_cache import FigureCache, cached_figure, shared_figure_cache
+from src.visualizations.hierarchy import build_hierarchy
+from src.visualizations.partitions import CategoryPartitions
+from src.visualizations.aggregation import density_grid, occupied_cells, in_ranges
+from src.visualizations.downsampling import downsample
 
 class ChartCreator:
     """Class to create various charts and visualizations"""
     
-    def __init__(self):
+    def __init__(self,
+                 aggregate: Optional[Callable[[pd.DataFrame, List[str], dict], pd.DataFrame]] = None,
+                 figure_cache: Optional[FigureCache] = None,
+                 render_mode: Optional[str] = None):
+        """
+        Args:
+            aggregate: Function (df, by, spec) computing grouped aggregates,
+                such as DataProcessor.aggregate; defaults to a pandas groupby
+            figure_cache: Cache serving unchanged figures; defaults to the
+                process-wide cache when FIGURE_CACHE_CONFIG is enabled
+            render_mode: Render mode of point charts: 'auto' (WebGL above
+                RENDER_CONFIG['webgl_threshold'] points), 'svg' or 'webgl'
+        """
         self.chart_config = CHART_CONFIG
         self.colors = COLORS
+        self.aggregate = aggregate or self._groupby_aggregate
+        self.render_mode = render_mode or RENDER_CONFIG['mode']
+        if figure_cache is None and FIGURE_CACHE_CONFIG['enabled']:
+            figure_cache = shared_figure_cache()
+        self.figure_cache = figure_cache
+        # (id of frame, column) -> (frame, partitions) of the last split frames
+        self._partitions = {}
     
+    @cached_figure
     def create_regional_comparison_chart(self, df: pd.DataFrame, selected_movies: List[str]) -> go.Figure:
         """
         Create regional comparison chart for selected movies
@@ -73,21 +98,38 @@ class ChartCreator:
         
         return fig
     
-    def create_performance_scatter(self, df: pd.DataFrame, size_limit: int = 100) -> go.Figure:
+    @cached_figure
+    def create_performance_scatter(self,
+                                   df: pd.DataFrame,
+                                   max_points: Optional[int] = None,
+                                   render_mode: Optional[str] = None,
+                                   x_range: Optional[Tuple[float, float]] = None,
+                                   y_range: Optional[Tuple[float, float]] = None) -> go.Figure:
         """
         Create performance scatter plot
         
         Args:
             df: Source dataframe
-            size_limit: Maximum number of points to display
+            max_points: Maximum number of points to display, the highest
+                grossing movies are kept (defaults to RENDER_CONFIG['max_points'])
+            render_mode: 'auto', 'svg', 'webgl' or 'density' (defaults to the
+                chart creator's mode); in 'auto' mode views with more than
+                RENDER_CONFIG['density_threshold'] movies are drawn as a
+                density heatmap binned on the server
+            x_range: Optional zoomed domestic revenue range in millions
+            y_range: Optional zoomed foreign revenue range in millions
             
         Returns:
             go.Figure: Performance scatter plot
         """
+        df = self._zoom(df, ['Domestic_Millions', 'Foreign_Millions'], [x_range, y_range])
         if df.empty:
             return self._create_empty_chart("No data available for scatter plot")
         
-        plot_data = df.head(size_limit)
+        if self._render_mode(len(df), render_mode, RENDER_CONFIG['density_threshold']) == 'density':
+            return self._create_density_heatmap(df, x_range, y_range)
+        
+        plot_data, positions = self._limit_points(df, max_points or RENDER_CONFIG['max_points'])
         
         fig = px.scatter(
             plot_data,
@@ -96,9 +138,10 @@ class ChartCreator:
             size='Worldwide_Millions',
             color='Primary_Genre' if 'Primary_Genre' in plot_data.columns else None,
             hover_data=['Release Group', 'Year'],
-            title="Domestic vs Foreign Performance",
+            title="Domestic vs Foreign Performance" + self._cap_caption(len(plot_data), len(df)),
             template=self.chart_config['template'],
-            color_discrete_sequence=self.chart_config['color_sequence']
+            color_discrete_sequence=self.chart_config['color_sequence'],
+            render_mode=self._render_mode(len(plot_data), render_mode)
         )
         
         fig.update_layout(
@@ -111,6 +154,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_genre_regional_analysis(self, df: pd.DataFrame) -> go.Figure:
         """
         Create genre-wise regional analysis chart
@@ -124,7 +168,7 @@ class ChartCreator:
         if df.empty or 'Primary_Genre' not in df.columns:
             return self._create_empty_chart("No genre data available")
         
-        genre_stats = df.groupby('Primary_Genre').agg({
+        genre_stats = self.aggregate(df, ['Primary_Genre'], {
             'Domestic %': 'mean',
             'Foreign %': 'mean',
             'Worldwide_Millions': 'mean'
@@ -166,12 +210,20 @@ class ChartCreator:
         
         return fig
     
-    def create_revenue_trends_chart(self, df: pd.DataFrame) -> go.Figure:
+    @cached_figure
+    def create_revenue_trends_chart(self, df: pd.DataFrame, time_col: str = 'Year',
+                                    target_width: Optional[int] = None) -> go.Figure:
         """
         Create revenue trends over time chart
         
+        Series with more periods than the plot has pixels are downsampled
+        (see DOWNSAMPLING_CONFIG), keeping their peaks.
+        
         Args:
             df: Source dataframe
+            time_col: Period column to trend over, e.g. 'Year' or a weekly date
+            target_width: Plot width in pixels (defaults to
+                DOWNSAMPLING_CONFIG['target_width_px'])
             
         Returns:
             go.Figure: Revenue trends chart
@@ -179,7 +231,7 @@ class ChartCreator:
         if df.empty:
             return self._create_empty_chart("No data available for trends")
         
-        yearly_trends = df.groupby('Year').agg({
+        yearly_trends = self.aggregate(df, [time_col], {
             'Domestic %': 'mean',
             'Foreign %': 'mean',
             'Worldwide_Millions': 'mean',
@@ -189,17 +241,27 @@ class ChartCreator:
         if yearly_trends.empty:
             return self._create_empty_chart("No yearly trends data available")
         
+        periods = yearly_trends[time_col]
+        line_method = DOWNSAMPLING_CONFIG['line_method']
+        domestic_x, domestic_y = self._downsample_line(periods, yearly_trends['Domestic %'], target_width, line_method)
+        foreign_x, foreign_y = self._downsample_line(periods, yearly_trends['Foreign %'], target_width, line_method)
+        count_x, count_y = self._downsample_line(
+            periods, yearly_trends['Release Group'], target_width, DOWNSAMPLING_CONFIG['bar_method']
+        )
+        # Markers only help while each period is still distinguishable
+        line_mode = 'lines+markers' if len(domestic_x) == len(periods) else 'lines'
+        
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
         # Add domestic percentage trend
         fig.add_trace(
             go.Scatter(
-                x=yearly_trends['Year'],
-                y=yearly_trends['Domestic %'],
-                mode='lines+markers',
+                x=domestic_x,
+                y=domestic_y,
+                mode=line_mode,
                 name='Domestic %',
                 line=dict(color=self.colors['primary'], width=3),
-                hovertemplate='<b>Year: %{x}</b><br>Domestic: %{y:.1f}%<extra></extra>'
+                hovertemplate=f'<b>{time_col}: %{{x}}</b><br>Domestic: %{{y:.1f}}%<extra></extra>'
             ),
             secondary_y=False,
         )
@@ -207,12 +269,12 @@ class ChartCreator:
         # Add foreign percentage trend
         fig.add_trace(
             go.Scatter(
-                x=yearly_trends['Year'],
-                y=yearly_trends['Foreign %'],
-                mode='lines+markers',
+                x=foreign_x,
+                y=foreign_y,
+                mode=line_mode,
                 name='Foreign %',
                 line=dict(color=self.colors['success'], width=3),
-                hovertemplate='<b>Year: %{x}</b><br>Foreign: %{y:.1f}%<extra></extra>'
+                hovertemplate=f'<b>{time_col}: %{{x}}</b><br>Foreign: %{{y:.1f}}%<extra></extra>'
             ),
             secondary_y=False,
         )
@@ -220,12 +282,12 @@ class ChartCreator:
         # Add movie count as bars on secondary y-axis
         fig.add_trace(
             go.Bar(
-                x=yearly_trends['Year'],
-                y=yearly_trends['Release Group'],
+                x=count_x,
+                y=count_y,
                 name='Number of Movies',
                 opacity=0.6,
                 marker_color=self.colors['warning'],
-                hovertemplate='<b>Year: %{x}</b><br>Movies: %{y}<extra></extra>'
+                hovertemplate=f'<b>{time_col}: %{{x}}</b><br>Movies: %{{y}}<extra></extra>'
             ),
             secondary_y=True,
         )
@@ -240,12 +302,13 @@ class ChartCreator:
             paper_bgcolor='rgba(0,0,0,0)'
         )
         
-        fig.update_xaxes(title_text="Year")
+        fig.update_xaxes(title_text=time_col)
         fig.update_yaxes(title_text="Average Percentage", secondary_y=False)
         fig.update_yaxes(title_text="Number of Movies", secondary_y=True)
         
         return fig
     
+    @cached_figure
     def create_top_performers_chart(self, df: pd.DataFrame, n: int = 10, orientation: str = 'h') -> go.Figure:
         """
         Create top performers chart
@@ -329,6 +392,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_stacked_bar_chart(self, df: pd.DataFrame, x_col: str, y_cols: List[str], title: str) -> go.Figure:
         """
         Create a stacked bar chart
@@ -374,6 +438,272 @@ class ChartCreator:
         
         return fig
     
+    def _limit_points(self, df: pd.DataFrame, max_points: int) -> Tuple[pd.DataFrame, Optional[np.ndarray]]:
+        """
+        Cap the rows of a point chart, keeping the highest ranked ones
+        
+        Args:
+            df: Source dataframe
+            max_points: Maximum number of rows
+            
+        Returns:
+            tuple: (rows to plot in descending rank order, their positions
+            in df or None if df is within the cap)
+        """
+        if len(df) <= max_points:
+            return df, None
+        
+        ranks = df[RENDER_CONFIG['rank_by']].to_numpy(dtype=np.float64)
+        ranks = np.where(np.isnan(ranks), -np.inf, ranks)
+        
+        top = np.argpartition(-ranks, max_points - 1)[:max_points]
+        # Highest first, ties in row order
+        positions = top[np.lexsort((top, -ranks[top]))]
+        return df.take(positions), positions
+    
+    def _cap_caption(self, shown: int, total: int) -> str:
+        """
+        Describe an applied point cap for a chart title
+        
+        Args:
+            shown: Number of plotted rows
+            total: Number of rows before the cap
+            
+        Returns:
+            str: Caption such as ' (top 20,000 of 150,000 by worldwide revenue)',
+            empty if nothing was left out
+        """
+        if shown >= total:
+            return ""
+        return f" (top {shown:,} of {total:,} by worldwide revenue)"
+    
+    def _downsample_line(self, x: pd.Series, y: pd.Series, target_width: Optional[int] = None,
+                         method: str = 'lttb') -> Tuple[Sequence, Sequence]:
+        """
+        Reduce a trace to about one point per pixel of the plot width
+        
+        Args:
+            x: Ascending periods
+            y: Values per period
+            target_width: Plot width in pixels (defaults to
+                DOWNSAMPLING_CONFIG['target_width_px'])
+            method: 'lttb' for lines, 'minmax' to keep every bucket's extremes
+            
+        Returns:
+            tuple: (x, y) to plot, the inputs themselves when the trace is short enough
+        """
+        n_out = int((target_width or DOWNSAMPLING_CONFIG['target_width_px']) * DOWNSAMPLING_CONFIG['points_per_pixel'])
+        if not DOWNSAMPLING_CONFIG['enabled'] or len(y) <= max(n_out, DOWNSAMPLING_CONFIG['min_points']):
+            return x, y
+        return downsample(x.to_numpy(), y.to_numpy(dtype=np.float64, na_value=np.nan), n_out, method)
+    
+    def _render_mode(self, n_points: int, render_mode: Optional[str] = None, density_threshold: Optional[int] = None) -> str:
+        """
+        Resolve the render mode of a point chart
+        
+        Args:
+            n_points: Number of points to draw
+            render_mode: 'auto', 'svg', 'webgl' or 'density' (defaults to the chart creator's mode)
+            density_threshold: Point count above which 'auto' bins the points
+                into a density grid (None if the chart has no density view)
+            
+        Returns:
+            str: 'density', 'webgl' or 'svg'
+        """
+        render_mode = render_mode or self.render_mode
+        if render_mode == 'auto':
+            if density_threshold is not None and n_points > density_threshold:
+                return 'density'
+            return 'webgl' if n_points > RENDER_CONFIG['webgl_threshold'] else 'svg'
+        if render_mode == 'density' and density_threshold is None:
+            return 'webgl'
+        return render_mode
+    
+    @staticmethod
+    def _zoom(df: pd.DataFrame, columns: List[str], ranges: List[Optional[Tuple[float, float]]]) -> pd.DataFrame:
+        """
+        Restrict a frame to a zoomed region
+        
+        Args:
+            df: Source dataframe
+            columns: Columns of the zoomed axes
+            ranges: Inclusive (low, high) per axis, None for an unrestricted axis
+            
+        Returns:
+            pd.DataFrame: Rows inside the region (df itself if nothing is zoomed)
+        """
+        if all(value_range is None for value_range in ranges):
+            return df
+        return df[in_ranges([df[col].to_numpy() for col in columns], ranges)]
+    
+    def _density_caption(self, n_points: int) -> str:
+        """Describe a density view for a chart title"""
+        return f" (density of {n_points:,} movies, zoom in for individual movies)"
+    
+    def _create_density_heatmap(self,
+                                df: pd.DataFrame,
+                                x_range: Optional[Tuple[float, float]],
+                                y_range: Optional[Tuple[float, float]]) -> go.Figure:
+        """
+        Create the domestic vs foreign density view of a large scatter
+        
+        Only the binned counts are sent to the browser, so the figure size
+        depends on the grid resolution rather than on the number of movies.
+        
+        Args:
+            df: Rows inside the zoomed region
+            x_range: Zoomed domestic revenue range, None for the data extent
+            y_range: Zoomed foreign revenue range, None for the data extent
+            
+        Returns:
+            go.Figure: Heatmap of movie counts per cell
+        """
+        bins = RENDER_CONFIG['density_bins']
+        counts, (x_centers, y_centers) = density_grid(
+            [df['Domestic_Millions'].to_numpy(), df['Foreign_Millions'].to_numpy()],
+            [bins, bins],
+            [x_range, y_range]
+        )
+        
+        # Log scale so that sparse cells stay visible next to dense ones,
+        # empty cells are left transparent
+        counts = counts.T
+        fig = go.Figure(go.Heatmap(
+            x=x_centers,
+            y=y_centers,
+            z=np.where(counts > 0, np.log10(np.maximum(counts, 1)), np.nan),
+            customdata=counts,
+            colorscale='Viridis',
+            colorbar=dict(title='Movies (log10)'),
+            hovertemplate='Domestic: $%{x:.1f}M<br>Foreign: $%{y:.1f}M<br>Movies: %{customdata:,.0f}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title="Domestic vs Foreign Performance" + self._density_caption(len(df)),
+            xaxis_title="Domestic_Millions",
+            yaxis_title="Foreign_Millions",
+            template=self.chart_config['template'],
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font_family=self.chart_config['font_family'],
+            font_size=self.chart_config['font_size'],
+            height=self.chart_config['height']
+        )
+        
+        return fig
+    
+    def _create_density_voxels(self,
+                               df: pd.DataFrame,
+                               x_range: Optional[Tuple[float, float]],
+                               y_range: Optional[Tuple[float, float]]) -> go.Figure:
+        """
+        Create the density view of the 3D movie universe
+        
+        Movies are binned into a domestic x foreign x year grid and every
+        occupied cell is drawn as one marker sized and colored by its count.
+        
+        Args:
+            df: Rows inside the zoomed region
+            x_range: Zoomed domestic revenue range, None for the data extent
+            y_range: Zoomed foreign revenue range, None for the data extent
+            
+        Returns:
+            go.Figure: 3D scatter of occupied grid cells
+        """
+        bins = RENDER_CONFIG['density_bins_3d']
+        years = df['Year'].to_numpy()
+        year_bins = int(years.max() - years.min()) + 1
+        counts, centers = density_grid(
+            [df['Domestic_Millions'].to_numpy(), df['Foreign_Millions'].to_numpy(), years],
+            [bins, bins, year_bins],
+            [x_range, y_range, (years.min() - 0.5, years.max() + 0.5)]
+        )
+        (x, y, z), cell_counts = occupied_cells(counts, centers)
+        log_counts = np.log10(cell_counts)
+        
+        fig = go.Figure(go.Scatter3d(
+            x=x,
+            y=y,
+            z=z,
+            mode='markers',
+            marker=dict(
+                size=3 + 12 * log_counts / max(log_counts.max(), 1),
+                color=log_counts,
+                colorscale='Viridis',
+                colorbar=dict(title='Movies (log10)'),
+                opacity=0.7
+            ),
+            customdata=cell_counts,
+            hovertemplate='Domestic: $%{x:.1f}M<br>Foreign: $%{y:.1f}M<br>Year: %{z:.0f}<br>' +
+                         'Movies: %{customdata:,.0f}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title={
+                'text': "🎬 3D Movie Performance Universe" + self._density_caption(len(df)),
+                'x': 0.5,
+                'font': {'size': 20, 'color': '#00D4FF'}
+            },
+            scene=dict(
+                xaxis_title="Domestic Revenue (M$)",
+                yaxis_title="Foreign Revenue (M$)",
+                zaxis_title="Release Year",
+                bgcolor='rgba(0,0,0,0)'
+            ),
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            height=600
+        )
+        
+        return fig
+    
+    def partition(self,
+                  df: pd.DataFrame,
+                  column: str = 'Primary_Genre',
+                  partitions: Optional[CategoryPartitions] = None) -> CategoryPartitions:
+        """
+        Split a frame by a column for per-category traces
+        
+        The split is remembered for the frame, so all charts built from the
+        same frame share it; precomputed partitions are used as they are if
+        they belong to the frame and column.
+        
+        Args:
+            df: Source dataframe
+            column: Column to split by
+            partitions: Optional precomputed partitions
+            
+        Returns:
+            CategoryPartitions: Row positions per value of the column
+        """
+        if partitions is not None and partitions.df is df and partitions.column == column:
+            return partitions
+        
+        cached = self._partitions.get((id(df), column))
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        
+        partitions = CategoryPartitions(df, column)
+        # Only the splits of the current frame are kept
+        self._partitions = {key: value for key, value in self._partitions.items() if value[0] is df}
+        self._partitions[(id(df), column)] = (df, partitions)
+        return partitions
+    
+    @staticmethod
+    def _groupby_aggregate(df: pd.DataFrame, by: List[str], spec: dict) -> pd.DataFrame:
+        """
+        Default aggregation: group the rows of the frame with pandas
+        
+        Args:
+            df: Source dataframe
+            by: Grouping columns
+            spec: Aggregation spec in DataFrame.agg dict form
+            
+        Returns:
+            pd.DataFrame: Aggregated dataframe
+        """
+        return df.groupby(by, observed=True).agg(spec)
+    
     def _create_empty_chart(self, message: str) -> go.Figure:
         """
         Create an empty chart with a message
@@ -404,30 +734,60 @@ class ChartCreator:
         )
         return fig
     
-    def create_advanced_3d_scatter(self, df: pd.DataFrame) -> go.Figure:
+    @cached_figure
+    def create_advanced_3d_scatter(self,
+                                   df: pd.DataFrame,
+                                   partitions: Optional[CategoryPartitions] = None,
+                                   max_points: Optional[int] = None,
+                                   render_mode: Optional[str] = None,
+                                   x_range: Optional[Tuple[float, float]] = None,
+                                   y_range: Optional[Tuple[float, float]] = None) -> go.Figure:
         """
         Create stunning 3D scatter plot with animated bubbles
         
         Args:
             df: Source dataframe
+            partitions: Optional genre partitions of df shared with other charts
+            max_points: Maximum number of points to display, the highest
+                grossing movies are kept (defaults to RENDER_CONFIG['max_points_3d'])
+            render_mode: 'auto', 'svg', 'webgl' or 'density' (defaults to the
+                chart creator's mode); in WebGL mode the bubbles are drawn as a
+                point cloud without outlines, in density mode (used by 'auto'
+                above RENDER_CONFIG['density_threshold_3d'] movies) as
+                occupied cells of a 3D grid binned on the server
+            x_range: Optional zoomed domestic revenue range in millions
+            y_range: Optional zoomed foreign revenue range in millions
             
         Returns:
             go.Figure: Advanced 3D scatter plot
         """
+        zoomed = self._zoom(df, ['Domestic_Millions', 'Foreign_Millions'], [x_range, y_range])
+        if zoomed is not df:
+            # Shared partitions describe the unzoomed frame
+            df, partitions = zoomed, None
+        
         if df.empty:
             return self._create_empty_chart("No data available for 3D visualization")
         
-        plot_data = df.head(50)  # Limit for performance
+        if self._render_mode(len(df), render_mode, RENDER_CONFIG['density_threshold_3d']) == 'density':
+            return self._create_density_voxels(df, x_range, y_range)
         
-        # Create color mapping for genres
-        unique_genres = plot_data['Primary_Genre'].unique() if 'Primary_Genre' in plot_data.columns else ['Unknown']
+        plot_data, positions = self._limit_points(df, max_points or RENDER_CONFIG['max_points_3d'])
+        point_cloud = self._render_mode(len(plot_data), render_mode) == 'webgl'
+        
+        # One trace per genre, all split from a single pass over the rows
+        if 'Primary_Genre' in df.columns:
+            genre_partitions = self.partition(df, 'Primary_Genre', partitions)
+            if positions is not None:
+                genre_partitions = genre_partitions.take(positions)
+            genre_groups = genre_partitions.groups()
+        else:
+            genre_groups = [('Unknown', plot_data)]
         color_scale = px.colors.qualitative.Set3
         
         fig = go.Figure()
         
-        for i, genre in enumerate(unique_genres):
-            genre_data = plot_data[plot_data['Primary_Genre'] == genre] if 'Primary_Genre' in plot_data.columns else plot_data
-            
+        for i, (genre, genre_data) in enumerate(genre_groups):
             fig.add_trace(go.Scatter3d(
                 x=genre_data['Domestic_Millions'],
                 y=genre_data['Foreign_Millions'],
@@ -436,8 +796,8 @@ class ChartCreator:
                 marker=dict(
                     size=genre_data['Worldwide_Millions'] / 50,
                     color=color_scale[i % len(color_scale)],
-                    opacity=0.8,
-                    line=dict(color='white', width=2),
+                    opacity=0.6 if point_cloud else 0.8,
+                    line=dict(color='white', width=0 if point_cloud else 2),
                     sizemode='diameter'
                 ),
                 text=genre_data['Release Group'],
@@ -451,7 +811,7 @@ class ChartCreator:
         
         fig.update_layout(
             title={
-                'text': "🎬 3D Movie Performance Universe",
+                'text': "🎬 3D Movie Performance Universe" + self._cap_caption(len(plot_data), len(df)),
                 'x': 0.5,
                 'font': {'size': 20, 'color': '#00D4FF'}
             },
@@ -473,6 +833,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_animated_timeline_chart(self, df: pd.DataFrame) -> go.Figure:
         """
         Create animated timeline chart showing movie trends over years
@@ -487,7 +848,7 @@ class ChartCreator:
             return self._create_empty_chart("No data available for timeline")
         
         # Prepare data for animation
-        yearly_data = df.groupby(['Year', 'Primary_Genre']).agg({
+        yearly_data = self.aggregate(df, ['Year', 'Primary_Genre'], {
             'Worldwide_Millions': ['sum', 'count'],
             'Domestic_Millions': 'sum',
             'Foreign_Millions': 'sum'
@@ -533,6 +894,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_radial_chart(self, df: pd.DataFrame) -> go.Figure:
         """
         Create beautiful radial/polar chart for genre performance
@@ -546,7 +908,7 @@ class ChartCreator:
         if df.empty or 'Primary_Genre' not in df.columns:
             return self._create_empty_chart("No genre data available for radial chart")
         
-        genre_stats = df.groupby('Primary_Genre').agg({
+        genre_stats = self.aggregate(df, ['Primary_Genre'], {
             'Worldwide_Millions': 'mean',
             'Domestic %': 'mean',
             'Foreign %': 'mean'
@@ -591,6 +953,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_waterfall_chart(self, df: pd.DataFrame, selected_movie: str) -> go.Figure:
         """
         Create waterfall chart showing revenue breakdown
@@ -643,6 +1006,7 @@ class ChartCreator:
         
         return fig
     
+    @cached_figure
     def create_heatmap_correlation(self, df: pd.DataFrame) -> go.Figure:
         """
         Create correlation heatmap with beautiful gradients
@@ -695,12 +1059,20 @@ class ChartCreator:
         
         return fig
     
-    def create_sunburst_chart(self, df: pd.DataFrame) -> go.Figure:
+    @cached_figure
+    def create_sunburst_chart(self,
+                              df: pd.DataFrame,
+                              path: Optional[List[str]] = None,
+                              bins: Optional[Dict[str, Sequence[float]]] = None) -> go.Figure:
         """
         Create stunning sunburst chart for hierarchical data
         
         Args:
             df: Source dataframe
+            path: Hierarchy levels from the center outwards, e.g.
+                ['Primary_Genre', 'Rating_Score', 'Original_Language', 'Release Group']
+                (defaults to genre -> rating)
+            bins: Optional bin edges per level column, e.g. {'Rating_Score': [0, 5, 6, 7, 8, 10]}
             
         Returns:
             go.Figure: Sunburst chart
@@ -708,32 +1080,12 @@ class ChartCreator:
         if df.empty:
             return self._create_empty_chart("No data available for sunburst chart")
         
-        # Create hierarchical data (Genre -> Rating -> Movies)
-        sunburst_data = []
+        # Create hierarchical data (Genre -> Rating by default)
+        path = [col for col in (path or ['Primary_Genre', 'Rating']) if col in df.columns]
+        if not path:
+            return self._create_empty_chart("No hierarchy columns available for sunburst chart")
         
-        for genre in df['Primary_Genre'].unique() if 'Primary_Genre' in df.columns else ['Unknown']:
-            genre_df = df[df['Primary_Genre'] == genre] if 'Primary_Genre' in df.columns else df
-            genre_revenue = genre_df['Worldwide_Millions'].sum()
-            
-            sunburst_data.append({
-                'ids': genre,
-                'labels': genre,
-                'parents': '',
-                'values': genre_revenue
-            })
-            
-            for rating in genre_df['Rating'].unique() if 'Rating' in genre_df.columns else ['Unknown']:
-                rating_df = genre_df[genre_df['Rating'] == rating] if 'Rating' in genre_df.columns else genre_df
-                rating_revenue = rating_df['Worldwide_Millions'].sum()
-                
-                sunburst_data.append({
-                    'ids': f"{genre} - {rating}",
-                    'labels': rating,
-                    'parents': genre,
-                    'values': rating_revenue
-                })
-        
-        sunburst_df = pd.DataFrame(sunburst_data)
+        sunburst_df = build_hierarchy(df, path, 'Worldwide_Millions', bins)
         
         fig = go.Figure(go.Sunburst(
             ids=sunburst_df['ids'],
@@ -760,12 +1112,14 @@ class ChartCreator:
         
         return fig
     
-    def create_violin_plot(self, df: pd.DataFrame) -> go.Figure:
+    @cached_figure
+    def create_violin_plot(self, df: pd.DataFrame, partitions: Optional[CategoryPartitions] = None) -> go.Figure:
         """
         Create violin plot for revenue distribution by genre
         
         Args:
             df: Source dataframe
+            partitions: Optional genre partitions of df shared with other charts
             
         Returns:
             go.Figure: Violin plot
@@ -777,9 +1131,9 @@ class ChartCreator:
         
         colors = px.colors.qualitative.Set2
         
-        for i, genre in enumerate(df['Primary_Genre'].unique()):
-            genre_data = df[df['Primary_Genre'] == genre]['Worldwide_Millions']
-            
+        genre_partitions = self.partition(df, 'Primary_Genre', partitions)
+        
+        for i, (genre, genre_data) in enumerate(genre_partitions.column_groups('Worldwide_Millions')):
             fig.add_trace(go.Violin(
                 y=genre_data,
                 name=genre,
@@ -0,0 +1,148 @@
+import numpy as np
+from typing import List, Tuple
+
+def _bucket_bounds(n_points: int, n_buckets: int) -> np.ndarray:
+    """Split positions 0..n_points into n_buckets contiguous, near-equal buckets"""
+    return np.linspace(0, n_points, n_buckets + 1).astype(np.int64)
+
+# Below this many points per bucket, LTTB scans buckets in plain Python: NumPy's
+# per-call overhead outweighs its speed on slices of a few points
+SCALAR_BUCKET_POINTS = 32
+
+def _lttb_scalar(x: List[float], y: List[float], avg_x: List[float], avg_y: List[float],
+                 bounds: List[int]) -> List[int]:
+    """Inner-bucket picks of lttb, computed on Python floats with the same arithmetic"""
+    picks = []
+    previous = 0
+    for bucket in range(len(bounds) - 1):
+        x_prev, y_prev = x[previous], y[previous]
+        slope_x = x_prev - avg_x[bucket + 1]
+        slope_y = avg_y[bucket + 1] - y_prev
+        best_area = -1.0
+        for i in range(bounds[bucket], bounds[bucket + 1]):
+            area = abs(slope_x * (y[i] - y_prev) - (x_prev - x[i]) * slope_y)
+            if area > best_area:
+                best_area, previous = area, i
+        picks.append(previous)
+    return picks
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    The first and last points are always kept. Every bucket in between keeps
+    the point forming the largest triangle with the point kept from the
+    previous bucket and the average of the next bucket, which preserves the
+    visual shape of the line, peaks included.
+
+    Args:
+        x: Ascending x values
+        y: y values (no NaN)
+        n_out: Number of points to keep (at least 3)
+
+    Returns:
+        np.ndarray: Ascending positions of the kept points
+    """
+    n_points = len(x)
+    if n_out >= n_points or n_out < 3:
+        return np.arange(n_points)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Inner buckets cover the points between the first and the last one
+    bounds = _bucket_bounds(n_points - 2, n_out - 2) + 1
+    sums_x = np.add.reduceat(x[1:-1], bounds[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:-1], bounds[:-1] - 1)
+    sizes = np.diff(bounds)
+    avg_x = np.append(sums_x / sizes, x[-1])
+    avg_y = np.append(sums_y / sizes, y[-1])
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n_points - 1
+
+    if n_points < SCALAR_BUCKET_POINTS * n_out:
+        kept[1:-1] = _lttb_scalar(x.tolist(), y.tolist(), avg_x.tolist(), avg_y.tolist(), bounds.tolist())
+        return kept
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = bounds[bucket], bounds[bucket + 1]
+        # Twice the triangle area, up to sign, for every candidate of the bucket
+        areas = np.abs(
+            (x[previous] - avg_x[bucket + 1]) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y[bucket + 1] - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+
+    return kept
+
+def min_max(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Min-max decimation: keep the lowest and highest point of every bucket
+
+    Args:
+        y: y values (no NaN)
+        n_out: Approximate number of points to keep (two per bucket)
+
+    Returns:
+        np.ndarray: Ascending positions of the kept points
+    """
+    n_points = len(y)
+    n_buckets = n_out // 2
+    if n_out >= n_points or n_buckets < 1:
+        return np.arange(n_points)
+
+    bounds = _bucket_bounds(n_points, n_buckets)
+    sizes = np.diff(bounds)
+    buckets = np.repeat(np.arange(n_buckets), sizes)
+
+    kept = []
+    for reduce in (np.minimum, np.maximum):
+        extremes = np.repeat(reduce.reduceat(y, bounds[:-1]), sizes)
+        # First position of every bucket holding the bucket's extreme value
+        matches = np.flatnonzero(y == extremes)
+        _, first = np.unique(buckets[matches], return_index=True)
+        kept.append(matches[first])
+    return np.unique(np.concatenate(kept))
+
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int, method: str = 'lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a line series to about n_out points
+
+    Points with a missing y value are dropped first.
+
+    Args:
+        x: Ascending x values
+        y: y values
+        n_out: Target number of points
+        method: 'lttb' or 'minmax'
+
+    Returns:
+        tuple: (x, y) of the kept points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+
+    if len(y) <= n_out:
+        return x, y
+
+    if method == 'minmax':
+        kept = min_max(y, n_out)
+    elif method == 'lttb':
+        if np.issubdtype(x.dtype, np.datetime64):
+            positions = x.astype('datetime64[ns]').astype(np.int64)
+        elif np.issubdtype(x.dtype, np.number):
+            positions = x
+        else:
+            positions = np.arange(len(x))
+        kept = lttb(positions, y, n_out)
+    else:
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    return x[kept], y[kept]
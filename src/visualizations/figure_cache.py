@@ -0,0 +1,148 @@
+import functools
+import hashlib
+import inspect
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from src.config.settings import FIGURE_CACHE_CONFIG
+from src.data.fingerprint import frame_fingerprint
+from src.data.result_cache import FilterResultCache
+
+class _Unkeyable(TypeError):
+    """Raised for chart arguments that have no stable cache key"""
+
+def argument_key(value: Any) -> Hashable:
+    """
+    Turn a chart argument into a stable, hashable cache key
+
+    Plain values key as themselves, containers by their items, and frames,
+    series and arrays by their contents, never by their identity.
+
+    Args:
+        value: Argument value
+
+    Returns:
+        Hashable: Key that is equal for equal arguments across calls
+
+    Raises:
+        _Unkeyable: For other objects, whose figures are not cached
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple)):
+        return tuple(argument_key(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), argument_key(item)) for key, item in value.items()))
+    if isinstance(value, pd.DataFrame):
+        return ('frame', frame_fingerprint(value))
+    if isinstance(value, pd.Series):
+        return ('series', frame_fingerprint(value.to_frame()))
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).tobytes(), digest_size=16)
+        return ('array', str(value.dtype), value.shape, digest.hexdigest())
+    raise _Unkeyable(type(value).__name__)
+
+class FigureCache:
+    """Size-bounded LRU cache of serialized Plotly figures"""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_entries: Maximum number of figures kept
+            max_bytes: Maximum total size of the serialized figures
+        """
+        self._store = FilterResultCache(
+            max_entries or FIGURE_CACHE_CONFIG['max_entries'],
+            max_bytes or FIGURE_CACHE_CONFIG['max_mb'] * 1024 * 1024
+        )
+
+    def get_or_create(self, key: Hashable, create: Callable[[], go.Figure]) -> go.Figure:
+        """
+        Get a cached figure or create and cache it
+
+        Figures are stored as JSON and a new Figure is returned on every hit,
+        so callers may update the returned figure freely.
+
+        Args:
+            key: Figure key (frame fingerprint plus chart parameters)
+            create: Function building the figure on a miss
+
+        Returns:
+            go.Figure: Cached or newly created figure
+        """
+        cached = self._store.get(key, 'figure')
+        if cached is not None:
+            return pio.from_json(cached, skip_invalid=True)
+
+        fig = create()
+        self._store.put(key, 'figure', fig.to_json())
+        return fig
+
+    def clear(self) -> None:
+        """Drop all cached figures"""
+        self._store.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the cache counters
+
+        Returns:
+            dict: Hits, misses, evictions, entry count and estimated bytes
+        """
+        return self._store.stats()
+
+@st.cache_resource(show_spinner=False)
+def shared_figure_cache() -> FigureCache:
+    """
+    Get the figure cache shared by all sessions of the process
+
+    Returns:
+        FigureCache: Process-wide figure cache
+    """
+    return FigureCache()
+
+# Parameters that only speed up building a figure, never change it, and are left out of its key
+UNKEYED_PARAMETERS = {'partitions'}
+
+def cached_figure(method: Callable[..., go.Figure]) -> Callable[..., go.Figure]:
+    """
+    Memoize a ChartCreator method whose first argument is the source frame
+
+    Arguments are bound to the method's signature with their defaults, so a
+    value passed by position or by keyword gives the same key. Calls with an
+    argument that has no stable key are built without the cache.
+
+    Args:
+        method: Chart method (self, df, *args, **kwargs) -> go.Figure
+
+    Returns:
+        Callable: Method served from the chart creator's figure cache
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, df: pd.DataFrame, *args, **kwargs) -> go.Figure:
+        if self.figure_cache is None or not isinstance(df, pd.DataFrame):
+            return method(self, df, *args, **kwargs)
+
+        bound = signature.bind(self, df, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            parameters = tuple(
+                (name, argument_key(value)) for name, value in list(bound.arguments.items())[2:]
+                if name not in UNKEYED_PARAMETERS
+            )
+        except _Unkeyable:
+            return method(self, df, *args, **kwargs)
+
+        key = (method.__name__, self.render_mode, frame_fingerprint(df), parameters)
+        return self.figure_cache.get_or_create(key, lambda: method(self, df, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+def _format_label(value) -> str:
+    """Format a node label, showing bins as 'left-right'"""
+    if isinstance(value, pd.Interval):
+        return f"{value.left:g}-{value.right:g}"
+    return str(value)
+
+def build_hierarchy(df: pd.DataFrame,
+                    path: List[str],
+                    value_col: str,
+                    bins: Optional[Dict[str, Sequence[float]]] = None,
+                    missing_label: str = 'Unknown') -> pd.DataFrame:
+    """
+    Build the nodes of a sunburst/treemap hierarchy in one grouping pass
+
+    Rows are grouped once by the integer codes of all path levels; every
+    shallower level is then rolled up from those leaf totals, so the cost
+    does not grow with the number of distinct values per level.
+
+    Args:
+        df: Source dataframe
+        path: Columns from the root level to the leaf level
+        value_col: Column summed into the node values
+        bins: Optional bin edges per path column; values of those columns
+            are bucketed with pd.cut before grouping
+        missing_label: Label of the node holding missing values of a level
+
+    Returns:
+        pd.DataFrame: ids, labels, parents and values of every node, parents
+        listed before their children. Node ids are the labels on the path
+        joined with ' - ', root nodes have an empty parent.
+    """
+    bins = bins or {}
+    codes = {}
+    level_labels = []
+
+    for depth, col in enumerate(path):
+        values = df[col]
+        if col in bins:
+            values = pd.cut(values, bins[col])
+
+        col_codes, uniques = pd.factorize(values, sort=True)
+        # Missing values get their own code after the distinct values
+        codes[depth] = np.where(col_codes < 0, len(uniques), col_codes)
+        level_labels.append(np.array([_format_label(value) for value in uniques] + [missing_label], dtype=object))
+
+    leaf_values = df[value_col].to_numpy(dtype=np.float64)
+    leaves = (
+        pd.DataFrame(codes)
+        .assign(_value=np.where(np.isnan(leaf_values), 0.0, leaf_values))
+        .groupby(list(range(len(path))), sort=True)['_value']
+        .sum()
+    )
+
+    nodes = []
+    for depth in range(len(path)):
+        level = leaves if depth == len(path) - 1 else leaves.groupby(level=list(range(depth + 1)), sort=True).sum()
+        level_codes = [level.index.get_level_values(k).to_numpy() for k in range(depth + 1)]
+        labels = [pd.Series(level_labels[k][level_codes[k]]) for k in range(depth + 1)]
+
+        parents = pd.Series('', index=range(len(level)), dtype=object)
+        for k in range(depth):
+            parents = labels[k] if k == 0 else parents + ' - ' + labels[k]
+        ids = labels[0] if depth == 0 else parents + ' - ' + labels[depth]
+
+        nodes.append(pd.DataFrame({
+            'ids': ids.to_numpy(),
+            'labels': labels[depth].to_numpy(),
+            'parents': parents.to_numpy(),
+            'values': level.to_numpy()
+        }))
+
+    return pd.concat(nodes, ignore_index=True)
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from typing import Iterator, Tuple
+
+class CategoryPartitions:
+    """Row positions of a frame split by the values of one column, in one argsort pass"""
+
+    def __init__(self, df: pd.DataFrame, column: str):
+        """
+        Split a frame by a column
+
+        Args:
+            df: Source dataframe
+            column: Column to split by; rows with missing values are left out
+        """
+        self.df = df
+        self.column = column
+
+        # Values in order of first appearance, as Series.unique() returns them
+        codes, uniques = pd.factorize(df[column])
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        # Missing values (code -1) sort first and are dropped
+        self.order = order[len(codes) - counts.sum():]
+        self.values = list(uniques)
+        self.bounds = np.concatenate([[0], np.cumsum(counts)])
+
+    def __repr__(self) -> str:
+        return f"CategoryPartitions({self.column!r}, {len(self.values)} groups)"
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def positions(self, i: int) -> np.ndarray:
+        """
+        Get the ascending row positions of the i-th group
+
+        Args:
+            i: Group number
+
+        Returns:
+            np.ndarray: Positions into the source frame
+        """
+        return self.order[self.bounds[i]:self.bounds[i + 1]]
+
+    def groups(self) -> Iterator[Tuple[object, pd.DataFrame]]:
+        """
+        Iterate over the groups and their rows
+
+        Returns:
+            Iterator of (value, rows of the frame with that value)
+        """
+        for i, value in enumerate(self.values):
+            yield value, self.df.take(self.positions(i))
+
+    def column_groups(self, column: str) -> Iterator[Tuple[object, pd.Series]]:
+        """
+        Iterate over the groups, taking only one column
+
+        Args:
+            column: Column to take
+
+        Returns:
+            Iterator of (value, column values of the group's rows)
+        """
+        values = self.df[column]
+        for i, value in enumerate(self.values):
+            yield value, values.take(self.positions(i))
+
+    def take(self, positions: np.ndarray) -> 'CategoryPartitions':
+        """
+        Restrict the partitions to a selection of rows without re-splitting
+
+        Args:
+            positions: Row positions to keep, in the order of the new frame
+
+        Returns:
+            CategoryPartitions: Partitions of df.take(positions)
+        """
+        subset = object.__new__(CategoryPartitions)
+        subset.df = self.df.take(positions)
+        subset.column = self.column
+
+        # New position of every source row, -1 for rows that are not kept
+        new_positions = np.full(len(self.df), -1, dtype=np.intp)
+        new_positions[positions] = np.arange(len(positions))
+
+        kept = []
+        for i in range(len(self.values)):
+            mapped = new_positions[self.positions(i)]
+            kept.append(np.sort(mapped[mapped >= 0]))
+
+        # Groups are ordered by their first appearance in the new frame
+        groups = sorted((mapped[0], i) for i, mapped in enumerate(kept) if len(mapped))
+
+        subset.values = [self.values[i] for _, i in groups]
+        subset.order = np.concatenate([kept[i] for _, i in groups]) if groups else np.empty(0, dtype=np.intp)
+        subset.bounds = np.concatenate([[0], np.cumsum([len(kept[i]) for _, i in groups], dtype=np.intp)])
+        return subset
@@ -0,0 +1,36 @@
+import os
+import shutil
+
+import pytest
+
+from src.config.settings import DATA_CACHE_CONFIG, EXPORT_CONFIG
+from src.data.processor import DataProcessor
+
+SOURCE_CSV = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'movie_revenue_data.csv')
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Dataset and export caches in a temporary folder"""
+    directory = tmp_path / 'cache'
+    monkeypatch.setitem(DATA_CACHE_CONFIG, 'directory', str(directory))
+    monkeypatch.setitem(EXPORT_CONFIG, 'directory', str(directory / 'exports'))
+    return directory
+
+@pytest.fixture
+def source_csv(tmp_path):
+    """Private copy of the bundled dataset, which tests may modify"""
+    path = tmp_path / 'movies.csv'
+    shutil.copyfile(SOURCE_CSV, path)
+    return str(path)
+
+@pytest.fixture
+def processor(source_csv, cache_dir):
+    """Processor with the shared dataset loaded from the copied source"""
+    processor = DataProcessor(source_csv)
+    assert processor.load_shared_data() is not None
+    return processor
+
+@pytest.fixture
+def df(processor):
+    """Shared cleaned dataset"""
+    return processor.df
@@ -0,0 +1,21 @@
+import pytest
+
+from src.api.query import QueryError
+from src.reports.batch import expand_specs
+
+def test_star_values_expand_to_one_spec_per_value(df):
+    specs = expand_specs([{'name': '2010s', 'year_min': 2010, 'genre': '*'}], df)
+    assert len(specs) == df['Primary_Genre'].dropna().nunique()
+    assert all(spec['name'].startswith('2010s_genre-') for spec in specs)
+
+@pytest.mark.parametrize('spec, message', [
+    ({'year_min': 'abc'}, "year_min must be an integer"),
+    ({'revenue_max': 'lots'}, "revenue_max must be a number"),
+    ({'region': 'north'}, "region must be one of"),
+    ({'top_n': 'ten'}, "top_n must be an integer"),
+    ({'genre': '*', 'top_n': None}, "top_n must be an integer"),
+    ({'colour': 'red'}, "Unknown spec key"),
+])
+def test_invalid_specs_fail_before_any_report_runs(df, spec, message):
+    with pytest.raises(QueryError, match=message):
+        expand_specs([{'name': 'good'}, spec], df)
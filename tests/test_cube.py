@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import REGIONAL_FILTERS
+from src.data.cube import AggregationCube
+
+SPEC = {
+    'Worldwide_Millions': ['count', 'mean', 'sum', 'std'],
+    'Domestic %': 'mean',
+    'Foreign %': ['mean', 'std'],
+    'Rating_Score': 'mean',
+    'Release Group': 'count',
+}
+
+FILTERS = [
+    {},
+    {'year_range': (2010, 2015)},
+    {'selected_genre': 'Drama'},
+    {'selected_language': 'en', 'regional_filter': REGIONAL_FILTERS[2]},
+    {'year_range': (2000, 2019), 'selected_genre': 'Action', 'regional_filter': REGIONAL_FILTERS[1]},
+]
+
+def assert_close(cube_result: pd.DataFrame, expected: pd.DataFrame) -> None:
+    """Cube and groupby results agree up to floating-point rounding"""
+    assert cube_result.shape == expected.shape
+    pd.testing.assert_index_equal(cube_result.index, expected.index, exact=False)
+    assert list(cube_result.columns) == list(expected.columns)
+    np.testing.assert_allclose(cube_result.to_numpy(dtype=float), expected.to_numpy(dtype=float),
+                               rtol=1e-12, atol=1e-9, equal_nan=True)
+
+@pytest.mark.parametrize('filters', FILTERS)
+@pytest.mark.parametrize('by', [['Year'], ['Primary_Genre'], ['Year', 'Original_Language']])
+def test_cube_matches_groupby(processor, df, filters, by):
+    filters = {'year_range': (int(df['Year'].min()), int(df['Year'].max())), **filters}
+    filtered = processor.apply_filters(df, **filters)
+    expected = filtered.groupby(by, observed=True).agg(SPEC)
+
+    cube = AggregationCube(df)
+    assert cube.supports(by, SPEC)
+    assert_close(cube.aggregate(by, SPEC, **filters), expected)
+    assert_close(processor.aggregate(filtered, by, SPEC), expected)
+
+def test_decades_roll_up_years(processor, df):
+    filtered = processor.apply_filters(df, (1990, 2020))
+    expected = filtered.groupby(['Decade'], observed=True).agg(SPEC)
+    assert_close(AggregationCube(df).aggregate(['Decade'], SPEC, (1990, 2020)), expected)
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+from src.config.settings import DATA_CACHE_CONFIG
+from src.data.cache import DatasetCache
+from src.data.processor import DataProcessor
+
+def rewrite(path: str, edit) -> None:
+    """Apply edit to the lines of a CSV file"""
+    with open(path, encoding='utf-8', newline='') as source:
+        lines = source.readlines()
+    with open(path, 'w', encoding='utf-8', newline='') as target:
+        target.writelines(edit(lines))
+
+def cleaned_without_cache(path: str) -> pd.DataFrame:
+    return DataProcessor(path, use_cache=False)._load_and_clean()
+
+def test_cache_round_trip(source_csv, cache_dir):
+    processor = DataProcessor(source_csv)
+    df = processor._load_and_clean()
+    cached = DatasetCache(source_csv).load()
+    pd.testing.assert_frame_equal(cached, df)
+    pd.testing.assert_frame_equal(cached, cleaned_without_cache(source_csv))
+
+def test_key_changes_with_the_source_and_the_format(source_csv, cache_dir, monkeypatch):
+    cache = DatasetCache(source_csv)
+    key = cache.fingerprint()
+    assert cache.fingerprint() == key
+
+    rewrite(source_csv, lambda lines: lines[:-1])
+    changed = cache.fingerprint()
+    assert changed != key
+
+    monkeypatch.setitem(DATA_CACHE_CONFIG, 'format_version', DATA_CACHE_CONFIG['format_version'] + 1)
+    assert cache.fingerprint() != changed
+
+def test_sources_in_different_folders_never_share_a_cache(source_csv, cache_dir, tmp_path):
+    other = tmp_path / 'other' / os.path.basename(source_csv)
+    other.parent.mkdir()
+    other.write_bytes(open(source_csv, 'rb').read())
+    assert DatasetCache(source_csv).prefix != DatasetCache(str(other)).prefix
+
+def test_shared_data_follows_source_changes(processor, source_csv):
+    version = processor.dataset_version
+    rewrite(source_csv, lambda lines: lines[:1] + lines[2:])
+
+    refreshed = processor.load_shared_data()
+    assert processor.dataset_version != version
+    pd.testing.assert_frame_equal(refreshed, cleaned_without_cache(source_csv))
+
+def test_incremental_update_matches_a_full_rebuild(processor, source_csv):
+    # Change one movie, drop one and add a new one
+    source = pd.read_csv(source_csv)
+    source.loc[10, '$Worldwide'] *= 3
+    extra = source.iloc[[20]].assign(**{'Release Group': 'Brand New Release'})
+    pd.concat([source.drop(index=30), extra]).to_csv(source_csv, index=False)
+
+    updated = processor.update_incremental()
+    pd.testing.assert_frame_equal(updated, cleaned_without_cache(source_csv))
@@ -0,0 +1,110 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import EXPORT_CONFIG
+from src.data.export import EXCEL_SHEET_NAME, ExportCache, write_csv, write_excel, write_parquet
+from src.data.fingerprint import frame_fingerprint
+
+@pytest.fixture
+def sample():
+    """Small frame with the value kinds of the dataset, including missing values"""
+    return pd.DataFrame({
+        'Release Group': pd.array(['Amélie', 'Брат, 2', None, 'Say "Hi"\nagain'], dtype='string'),
+        '$Worldwide': [546388108.0, 1.5, np.nan, 0.0],
+        'Year': np.array([2000, 2001, 2002, 2003], dtype=np.int16),
+        'Primary_Genre': pd.Categorical(['Drama', 'Action', 'Drama', None]),
+        'Domestic_Dominance': [True, False, True, False],
+    }, index=[10, 3, 7, 5])
+
+@pytest.mark.parametrize('positions', [None, np.array([2, 0, 3]), np.array([], dtype=np.int64)])
+@pytest.mark.parametrize('chunk_rows', [1, 2, 50])
+def test_csv_matches_to_csv(sample, tmp_path, positions, chunk_rows):
+    path = tmp_path / 'export.csv'
+    write_csv(sample, str(path), chunk_rows, positions)
+    expected = (sample if positions is None else sample.take(positions)).to_csv(index=False)
+    assert path.read_text(encoding='utf-8') == expected
+
+@pytest.mark.parametrize('positions', [None, np.array([3, 1]), np.array([], dtype=np.int64)])
+def test_parquet_round_trip(sample, tmp_path, positions):
+    path = tmp_path / 'export.parquet'
+    write_parquet(sample, str(path), 3, positions)
+    expected = (sample if positions is None else sample.take(positions)).reset_index(drop=True)
+    # An empty dictionary column keeps no categories
+    pd.testing.assert_frame_equal(pd.read_parquet(path), expected, check_categorical=len(expected) > 0,
+                                  check_dtype=len(expected) > 0)
+
+@pytest.mark.parametrize('positions', [None, np.array([3, 0])])
+def test_excel_round_trip(sample, tmp_path, positions):
+    path = tmp_path / 'export.xlsx'
+    write_excel(sample, str(path), 3, positions)
+    expected = (sample if positions is None else sample.take(positions)).reset_index(drop=True)
+
+    exported = pd.read_excel(path, sheet_name=EXCEL_SHEET_NAME)
+    assert list(exported.columns) == list(sample.columns)
+    pd.testing.assert_frame_equal(exported.astype(object).where(exported.notna(), None),
+                                  expected.astype(object).where(expected.notna(), None),
+                                  check_dtype=False)
+
+def test_dataset_exports_round_trip(df, tmp_path):
+    positions = np.arange(len(df))[::-3][:500]
+    csv_path, parquet_path = tmp_path / 'export.csv', tmp_path / 'export.parquet'
+    write_csv(df, str(csv_path), 128, positions)
+    write_parquet(df, str(parquet_path), 128, positions)
+
+    expected = df.take(positions)
+    assert csv_path.read_text(encoding='utf-8') == expected.to_csv(index=False)
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected.reset_index(drop=True))
+
+def test_cache_writes_each_key_once(sample, tmp_path):
+    cache = ExportCache(str(tmp_path), max_files=10)
+    first = cache.read('key', sample, 'csv')
+    assert cache.read('key', sample.iloc[:1], 'csv') == first  # same key, same file
+    assert cache.read('other', sample.iloc[:1], 'csv') != first
+    assert cache.read('key', sample, 'parquet') != first
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['files']) == (1, 3, 3)
+    assert os.path.basename(cache.path_for('key', 'csv')).startswith(f"export-v{EXPORT_CONFIG['format_version']}-")
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+def test_cache_evicts_least_recently_used_files(sample, tmp_path):
+    cache = ExportCache(str(tmp_path), max_files=2)
+    for key in ['a', 'b']:
+        cache.get_or_create(key, sample, 'csv')
+        os.utime(cache.path_for(key, 'csv'), ns=(1, 1) if key == 'a' else (2, 2))
+    cache.get('a', 'csv')  # 'a' is now the most recently used
+    cache.get_or_create('c', sample, 'csv')
+
+    assert cache.get('b', 'csv') is None
+    assert cache.get('a', 'csv') is not None and cache.get('c', 'csv') is not None
+    assert cache.stats()['evictions'] == 1
+
+def test_failed_exports_leave_no_file(sample, tmp_path):
+    cache = ExportCache(str(tmp_path))
+    with pytest.raises(Exception):
+        cache.get_or_create('broken', sample.assign(bad=[object()] * len(sample)), 'parquet')
+    assert cache.get('broken', 'parquet') is None
+    assert os.listdir(tmp_path) == []
+
+def test_refreshed_data_never_shares_an_export_key(processor, df, source_csv):
+    years = (2005, 2010)
+    old_key = frame_fingerprint(processor.apply_filters(df, years))
+    assert frame_fingerprint(processor.apply_filters(df, years)) == old_key
+
+    # Same filters and row count, one changed value
+    source = pd.read_csv(source_csv)
+    row = source.index[source['Year'] == 2007][0]
+    source.loc[row, 'Release Group'] = 'Refreshed Title'
+    buffer = io.StringIO()
+    source.to_csv(buffer, index=False)
+    with open(source_csv, 'w', encoding='utf-8', newline='') as target:
+        target.write(buffer.getvalue())
+
+    refreshed = processor.load_shared_data()
+    new = processor.apply_filters(refreshed, years)
+    assert 'Refreshed Title' in set(new['Release Group'])
+    assert frame_fingerprint(new) != old_key
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+import pytest
+
+from src.data.fingerprint import frame_fingerprint, remember_fingerprint
+from src.visualizations.charts import ChartCreator
+from src.visualizations.figure_cache import FigureCache, _Unkeyable, argument_key
+from src.visualizations.partitions import CategoryPartitions
+
+@pytest.fixture
+def charts():
+    """Chart creator with a private figure cache"""
+    return ChartCreator(figure_cache=FigureCache())
+
+def test_fingerprint_covers_every_value(df):
+    # The shared frame is identified by its dataset version; copies are hashed
+    df = df.copy()
+    base = frame_fingerprint(df)
+    assert frame_fingerprint(df.copy()) == base
+
+    # Changes far from the head and tail of the frame still change the fingerprint
+    middle = len(df) // 2 + 17
+    for column in ['$Worldwide', 'Year', 'Release Group', 'Primary_Genre']:
+        changed = df.copy()
+        changed.iloc[middle, changed.columns.get_loc(column)] = changed.iloc[middle + 1][column]
+        if changed[column].equals(df[column]):
+            continue
+        assert frame_fingerprint(changed) != base, column
+
+    assert frame_fingerprint(df.iloc[1:]) != base
+    assert frame_fingerprint(df.set_axis(df.index + 1)) != base
+    assert frame_fingerprint(df.rename(columns={'Year': 'year'})) != base
+
+def test_fingerprint_of_slices_covers_only_their_rows(df):
+    titles = df[['Release Group']]
+    assert frame_fingerprint(titles.iloc[10:20]) == frame_fingerprint(titles.iloc[10:20].copy())
+    assert frame_fingerprint(titles.iloc[10:20]) != frame_fingerprint(titles.iloc[20:30].set_axis(titles.index[10:20]))
+
+def test_remembered_fingerprints_replace_hashing(df):
+    frame = df.iloc[:100].copy()
+    fingerprint = remember_fingerprint(frame, 'dataset v1')
+    assert frame_fingerprint(frame) == fingerprint
+    assert remember_fingerprint(frame.copy(), 'dataset v1') == fingerprint
+    assert remember_fingerprint(frame.copy(), 'dataset v2') != fingerprint
+
+def test_argument_keys_are_stable():
+    assert argument_key([1, 'a', (2.5, None)]) == (1, 'a', (2.5, None))
+    assert argument_key(np.int64(3)) == 3
+    assert argument_key({'b': 1, 'a': [2]}) == argument_key({'a': [2], 'b': 1})
+    assert argument_key(np.arange(4)) == argument_key(np.arange(4))
+    assert argument_key(np.arange(4)) != argument_key(np.arange(4).astype(np.int32))
+    assert argument_key(pd.Series([1, 2])) == argument_key(pd.Series([1, 2]))
+    assert argument_key(pd.Series([1, 2])) != argument_key(pd.Series([1, 3]))
+    with pytest.raises(_Unkeyable):
+        argument_key(object())
+
+def test_positional_and_keyword_arguments_share_a_figure(charts, df):
+    df = df.copy()
+    first = charts.create_top_performers_chart(df, 5)
+    for args, kwargs in [((5,), {}), ((), {'n': 5}), ((5, 'h'), {}), ((), {'orientation': 'h', 'n': 5})]:
+        charts.create_top_performers_chart(df, *args, **kwargs)
+    stats = charts.figure_cache.stats()
+    assert (stats['misses'], stats['hits']) == (1, 4)
+
+    again = charts.create_top_performers_chart(df.copy(), n=5)
+    assert again.to_json() == pio.from_json(first.to_json(), skip_invalid=True).to_json()
+    assert charts.figure_cache.stats()['hits'] == 5
+
+def test_changed_data_or_arguments_build_new_figures(charts, df):
+    charts.create_top_performers_chart(df, 5)
+    charts.create_top_performers_chart(df, 6)
+    charts.create_top_performers_chart(df, 5, 'v')
+
+    changed = df.copy()
+    top = changed['$Worldwide'].idxmax()
+    changed.loc[top, 'Release Group'] = 'Renamed Blockbuster'
+    fig = charts.create_top_performers_chart(changed, 5)
+
+    assert charts.figure_cache.stats()['hits'] == 0
+    assert 'Renamed Blockbuster' in fig.to_json()
+
+def test_partitions_do_not_split_the_key(charts, df):
+    charts.create_violin_plot(df)
+    charts.create_violin_plot(df, partitions=CategoryPartitions(df, 'Primary_Genre'))
+    charts.create_violin_plot(df, CategoryPartitions(df, 'Primary_Genre'))
+    assert charts.figure_cache.stats()['hits'] == 2
+
+def test_unkeyable_arguments_bypass_the_cache(charts, df):
+    # Sets have no stable key: their iteration order depends on string hashing
+    fig = charts.create_regional_comparison_chart(df, set(df['Release Group'].iloc[:3]))
+    assert len(fig.data) > 0
+    assert charts.figure_cache.stats() == FigureCache().stats()
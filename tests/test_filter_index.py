@@ -0,0 +1,65 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.config.settings import ALL_OPTION, REGIONAL_FILTER_COLUMNS
+from src.data.filter_index import FilterIndex
+
+def mask_positions(df: pd.DataFrame, year_range, genre, language, regional, revenue_range) -> np.ndarray:
+    """Positions selected by plain boolean masks, the reference for the index"""
+    mask = df['Year'].between(*year_range)
+    if genre != ALL_OPTION:
+        mask &= df['Primary_Genre'] == genre
+    if language != ALL_OPTION:
+        mask &= df['Original_Language'] == language
+    if regional in REGIONAL_FILTER_COLUMNS:
+        mask &= df[REGIONAL_FILTER_COLUMNS[regional]]
+    if revenue_range:
+        mask &= df['Worldwide_Millions'].between(*revenue_range)
+    return np.flatnonzero(mask.to_numpy())
+
+def filter_combinations(df: pd.DataFrame):
+    """Every option combination over a few ranges and the most common values"""
+    years = (int(df['Year'].min()), int(df['Year'].max()))
+    year_ranges = [years, (years[0] + 3, years[1] - 4), (years[1], years[1]), (years[1] + 1, years[1] + 5)]
+    genres = [ALL_OPTION] + df['Primary_Genre'].value_counts().index[:3].tolist() + ['Not A Genre']
+    languages = [ALL_OPTION] + df['Original_Language'].value_counts().index[:2].tolist()
+    regionals = [ALL_OPTION] + list(REGIONAL_FILTER_COLUMNS)
+    revenue = df['Worldwide_Millions']
+    revenue_ranges = [None, (float(revenue.min()), float(revenue.max())), (50.0, 250.5), (revenue.median(), 1e9)]
+    return itertools.product(year_ranges, genres, languages, regionals, revenue_ranges)
+
+def test_positions_match_boolean_masks(df):
+    index = FilterIndex(df)
+    for filters in filter_combinations(df):
+        np.testing.assert_array_equal(index.positions(*filters), mask_positions(df, *filters), err_msg=repr(filters))
+
+def test_apply_filters_matches_mask_path(processor, df):
+    private = df.copy()
+    for filters in itertools.islice(filter_combinations(df), 0, None, 7):
+        indexed = processor.apply_filters(df, *filters)
+        masked = processor.apply_filters(private, *filters)
+        pd.testing.assert_frame_equal(indexed, masked)
+
+def test_filter_key_is_shared_by_ranges_selecting_the_same_rows(df):
+    index = FilterIndex(df)
+    years = sorted(df['Year'].unique())
+    full = (int(years[0]), int(years[-1]))
+
+    # A range wider than the data filters nothing, like the full range
+    assert index.filter_key(full) == index.filter_key((full[0] - 10, full[1] + 10))
+    assert index.filter_key(full)[0] is None
+    # Bounds between two data years select the same rows as the years themselves
+    assert index.filter_key((years[1], years[-2])) == index.filter_key((years[1] - 0.5, years[-2] + 0.5))
+    assert index.filter_key((years[1], years[-2])) != index.filter_key((years[2], years[-2]))
+    # Options that filter nothing do not split the key
+    assert index.filter_key(full, ALL_OPTION, ALL_OPTION, 'Not A Filter') == index.filter_key(full)
+
+@pytest.mark.parametrize('n_rows', [0, 1, 7, 8, 9])
+def test_positions_on_tiny_frames(df, n_rows):
+    small = df.iloc[:n_rows]
+    index = FilterIndex(small)
+    filters = ((2000, 2030), ALL_OPTION, ALL_OPTION, list(REGIONAL_FILTER_COLUMNS)[0], (0.0, 1e9))
+    np.testing.assert_array_equal(index.positions(*filters), mask_positions(small, *filters))
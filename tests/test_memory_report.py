@@ -0,0 +1,24 @@
+import pandas as pd
+
+from src.config.settings import DATASET_SCHEMA, SOURCE_SCHEMA
+
+def test_compact_schema_saves_memory(processor, df):
+    report = processor.get_memory_report(df)
+
+    assert report['Saved_Bytes'].sum() > 0
+    assert report['Bytes'].sum() == df.memory_usage(deep=True, index=False).sum()
+    assert set(report['Column']) == set(df.columns)
+    assert (report['Saved_Bytes'] == report['Baseline_Bytes'] - report['Bytes']).all()
+
+    # Categories and narrow integers are where the savings come from
+    saved = report.set_index('Column')['Saved_Bytes']
+    for column, dtype in {**SOURCE_SCHEMA, **DATASET_SCHEMA}.items():
+        if column in saved and (dtype == 'category' or dtype in ('int16', 'int32', 'float32')):
+            assert saved[column] > 0, column
+
+def test_shared_report_is_computed_once(processor, df):
+    report = processor.get_memory_report(df)
+    report.loc[0, 'Bytes'] = -1  # callers get their own copy
+
+    again = processor.get_memory_report(df)
+    pd.testing.assert_frame_equal(again, processor._compute_memory_report(df))
@@ -0,0 +1,75 @@
+import numpy as np
+
+from src.config.settings import ALL_OPTION
+from src.data.processor import _shared_result_cache
+from src.data.result_cache import FilterResultCache, estimate_bytes
+
+def test_lru_eviction_by_entry_count():
+    cache = FilterResultCache(max_entries=2, max_bytes=1 << 30)
+    cache.put('a', 'positions', np.arange(3))
+    cache.put('b', 'positions', np.arange(3))
+    assert cache.get('a', 'positions') is not None  # 'a' is now the most recently used
+    cache.put('c', 'positions', np.arange(3))
+
+    assert cache.get('b', 'positions') is None
+    assert cache.get('a', 'positions') is not None
+    assert cache.get('c', 'positions') is not None
+    assert cache.stats()['evictions'] == 1
+
+def test_eviction_by_size_keeps_the_newest_entry():
+    cache = FilterResultCache(max_entries=10, max_bytes=1000)
+    cache.put('small', 'positions', np.zeros(50, dtype=np.int64))
+    cache.put('large', 'positions', np.zeros(500, dtype=np.int64))
+
+    assert cache.get('small', 'positions') is None
+    assert cache.get('large', 'positions') is not None
+    assert cache.stats()['entries'] == 1
+
+def test_results_of_one_key_share_an_entry():
+    cache = FilterResultCache(max_entries=1, max_bytes=1 << 30)
+    cache.put('key', 'positions', np.arange(4))
+    cache.put('key', 'summary_stats', {'total_movies': 4})
+    cache.put('key', 'summary_stats', {'total_movies': 5})
+
+    assert cache.get('key', 'summary_stats') == {'total_movies': 5}
+    assert cache.get('key', 'missing') is None
+    stats = cache.stats()
+    assert (stats['entries'], stats['evictions']) == (1, 0)
+    assert stats['bytes'] == estimate_bytes(np.arange(4)) + estimate_bytes({'total_movies': 5})
+
+def test_repeated_filters_are_served_from_the_cache(processor, df):
+    years = (int(df['Year'].min()), int(df['Year'].max()) - 2)
+    first = processor.apply_filters(df, years, ALL_OPTION)
+    before = processor.get_result_cache_stats()['hits']
+    second = processor.apply_filters(df, years, ALL_OPTION)
+
+    assert processor.get_result_cache_stats()['hits'] == before + 1
+    assert second is not first
+    assert second.index.equals(first.index)
+
+def test_derived_results_are_cached_per_filter_combination(processor, df):
+    years = (int(df['Year'].min()) + 1, int(df['Year'].max()))
+    stats = processor.get_summary_stats(processor.apply_filters(df, years))
+    stats['total_movies'] = -1  # callers may modify their copy
+
+    again = processor.get_summary_stats(processor.apply_filters(df, years))
+    assert again == processor._compute_summary_stats(processor.apply_filters(df.copy(), years))
+
+def test_a_new_dataset_version_misses_the_cache(processor, df, source_csv):
+    years = (int(df['Year'].min()), int(df['Year'].max()))
+    processor.apply_filters(df, years)
+    old_version = processor.dataset_version
+
+    # Drop the last movie from the source: the next load is a new dataset version
+    with open(source_csv, encoding='utf-8') as source:
+        lines = source.readlines()
+    with open(source_csv, 'w', encoding='utf-8') as target:
+        target.writelines(lines[:-1])
+
+    refreshed = processor.load_shared_data()
+    assert processor.dataset_version != old_version
+    misses = _shared_result_cache().stats()['misses']
+    filtered = processor.apply_filters(refreshed, years)
+
+    assert _shared_result_cache().stats()['misses'] == misses + 1
+    assert len(filtered) == len(df) - 1
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.search_index import SearchIndex, normalize_query, normalize_titles
+
+TITLES = pd.Series([
+    'Amélie', 'Mission: Impossible II', 'Spider-Man', 'Spider-Man 2', 'The Amazing Spider-Man',
+    'Брат', 'Брат 2', 'Сталинград', '千と千尋の神隠し', 'ハウルの動く城', '寄生虫', '기생충',
+    'Crouching Tiger, Hidden Dragon', 'Ｆｕｌｌｗｉｄｔｈ Ｆｉｌｍ', 'Ⅻ Monkeys', None, 'Amélie',
+])
+
+QUERIES = [
+    'amelie', 'AMÉLIE', 'spider', 'spider-man', 'man 2', 'Impossible', 'брат', 'СТАЛИН', 'сталинград',
+    '千と', '神隠し', '動く', '寄生', '생충', 'tiger hidden', 'fullwidth', 'xii', 'a', 'n', 'the', 'zzz',
+]
+
+def contains_positions(titles: pd.Series, query: str) -> np.ndarray:
+    """Rows whose normalized title contains the normalized query, the reference for the index"""
+    normalized = normalize_titles(titles)
+    return np.flatnonzero(normalized.str.contains(normalize_query(query), regex=False).to_numpy())
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_search_matches_str_contains(query):
+    index = SearchIndex(TITLES)
+    found = index.search(query, fuzzy=False)
+    assert len(found) == len(set(found.tolist()))
+    np.testing.assert_array_equal(np.sort(found), contains_positions(TITLES, query))
+
+def test_search_matches_str_contains_on_the_dataset(df):
+    index = SearchIndex(df['Release Group'])
+    titles = df['Release Group'].astype(str)
+    for query in ['the', 'man', 'star wars', 'ii', '2', 'of the', 'x', 'love']:
+        found = np.sort(index.search(query, fuzzy=False))
+        np.testing.assert_array_equal(found, contains_positions(df['Release Group'], query), err_msg=query)
+        # Plain case-insensitive matches are always among the results
+        plain = np.flatnonzero(titles.str.contains(query, case=False, regex=False).to_numpy())
+        assert np.isin(plain, found).all(), query
+
+def test_non_ascii_titles_are_searchable():
+    index = SearchIndex(TITLES)
+    assert TITLES[index.search('брат')[0]] == 'Брат'
+    assert TITLES[index.search('千と千尋')[0]] == '千と千尋の神隠し'
+    assert TITLES[index.search('기생충')[0]] == '기생충'
+    assert set(TITLES[index.search('amelie')]) == {'Amélie'}
+
+def test_ranking_puts_exact_and_prefix_matches_first():
+    index = SearchIndex(TITLES)
+    ranked = TITLES[index.search('spider-man')].tolist()
+    assert ranked == ['Spider-Man', 'Spider-Man 2', 'The Amazing Spider-Man']
+    assert index.search('amelie').tolist() == [0, 16]
+
+def test_typos_fall_back_to_fuzzy_matches():
+    index = SearchIndex(TITLES)
+    assert len(index.search('impossibel', fuzzy=False)) == 0
+    assert TITLES[index.search('impossibel')[0]] == 'Mission: Impossible II'
+
+def test_queries_without_letters_or_digits(processor, df):
+    assert len(SearchIndex(TITLES).search(' -!? ')) == 0
+    assert processor.search_titles(df, '...') is None
+    assert processor.search_titles(df, 'Брат') is not None
+
+def test_processor_search_on_filtered_frames(processor, df):
+    filtered = processor.apply_filters(df, (2010, 2015))
+    positions = processor.search_titles(filtered, 'the')
+    expected = contains_positions(filtered['Release Group'], 'the')
+    np.testing.assert_array_equal(np.sort(positions), expected)